@@ -31,6 +31,57 @@ CREATE TABLE tempotech."Location" (
 ALTER TABLE tempotech."Location" OWNER TO weather;
 -- ddl-end --
 
+-- object: unaccent | type: EXTENSION --
+-- DROP EXTENSION IF EXISTS unaccent CASCADE;
+CREATE EXTENSION unaccent
+WITH SCHEMA public;
+-- ddl-end --
+
+-- object: public.f_unaccent | type: FUNCTION --
+-- DROP FUNCTION IF EXISTS public.f_unaccent(text) CASCADE;
+CREATE FUNCTION public.f_unaccent (text)
+	RETURNS text
+	LANGUAGE sql
+	IMMUTABLE 
+	STRICT
+	PARALLEL SAFE
+	AS $$ SELECT public.unaccent('public.unaccent', $1) $$;
+-- ddl-end --
+ALTER FUNCTION public.f_unaccent(text) OWNER TO weather;
+-- ddl-end --
+
+-- object: ix_location_state_city_name_id | type: INDEX --
+-- DROP INDEX IF EXISTS tempotech.ix_location_state_city_name_id CASCADE;
+CREATE INDEX ix_location_state_city_name_id ON tempotech."Location"
+USING btree
+(
+	state,
+	city_name,
+	id
+);
+-- ddl-end --
+
+-- object: ix_location_country_state_state_name | type: INDEX --
+-- DROP INDEX IF EXISTS tempotech.ix_location_country_state_state_name CASCADE;
+CREATE INDEX ix_location_country_state_state_name ON tempotech."Location"
+USING btree
+(
+	country,
+	state,
+	"stateName"
+);
+-- ddl-end --
+
+-- object: ix_location_state_city_name_unaccent | type: INDEX --
+-- DROP INDEX IF EXISTS tempotech.ix_location_state_city_name_unaccent CASCADE;
+CREATE INDEX ix_location_state_city_name_unaccent ON tempotech."Location"
+USING btree
+(
+	state,
+	(public.f_unaccent(lower(city_name)))
+);
+-- ddl-end --
+
 -- object: tempotech."Weather" | type: TABLE --
 -- DROP TABLE IF EXISTS tempotech."Weather" CASCADE;
 CREATE TABLE tempotech."Weather" (
@@ -0,0 +1,27 @@
+"""
+Módulo de cache das respostas da API.
+
+Estende o `fastapi_cache`, reutilizando o backend, o codificador e o
+construtor de chaves configurados em `FastAPICache`, com recursos para
+ambientes com vários processos compartilhando o mesmo Redis, como a trava de
+preenchimento que impede que todos recalculem uma mesma chave ao mesmo tempo.
+
+Define também a instância do agendador de atualização antecipada, iniciada no
+ciclo de vida da aplicação e alimentada pelas rotas de clima.
+"""
+
+from tempotech.api.cache.refresh_ahead import (
+    RefreshAheadScheduler,
+    RefreshAheadSettings,
+)
+from tempotech.core import config
+
+refresh_ahead = RefreshAheadScheduler(
+    RefreshAheadSettings(
+        top_n=config.REFRESH_AHEAD_TOP_N,
+        lead=config.REFRESH_AHEAD_LEAD,
+        interval=config.REFRESH_AHEAD_INTERVAL,
+        budget=config.REFRESH_AHEAD_BUDGET,
+        max_concurrency=config.REFRESH_AHEAD_CONCURRENCY,
+    )
+)
@@ -0,0 +1,309 @@
+"""
+Módulo do backend de cache em dois níveis.
+
+Um cache local, em memória e limitado em bytes, é mantido à frente do backend
+do Redis, de forma que as respostas mais consultadas são servidas sem uma ida
+ao Redis. Quando uma chave é gravada ou removida, os demais processos são
+avisados por um canal de pub/sub do Redis e descartam a sua cópia local.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple, Union
+
+from fastapi_cache.backends import Backend
+from loguru import logger
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+
+class _LocalEntry(NamedTuple):
+    """
+    Valor armazenado no cache local.
+    """
+
+    value: Union[str, bytes]
+    size: int
+    expires_at: float
+    evict_at: float
+
+
+class LocalCacheSettings(NamedTuple):
+    """
+    Configuração do cache local do `TwoTierBackend`.
+
+    Attributes:
+        max_bytes (int): Tamanho máximo, em bytes, dos valores do cache local.
+        max_ttl (float): Tempo máximo, em segundos, que um valor é mantido localmente.
+        channel (str): O canal de pub/sub das mensagens de invalidação.
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    max_ttl: float = 60
+    channel: str = "fastapi-cache-invalidate"
+
+
+class TwoTierBackend(Backend):
+    """
+    Backend do `fastapi_cache` com um cache LRU local à frente de outro backend.
+
+    O tempo de validade informado nas leituras é sempre o do backend remoto, de
+    forma que o cache local é transparente para o decorador de cache. Cada
+    valor local é mantido por no máximo `max_ttl` segundos, o que limita a
+    incoerência caso uma mensagem de invalidação seja perdida.
+    """
+
+    def __init__(
+        self,
+        remote: Backend,
+        redis: Optional[Redis] = None,
+        settings: LocalCacheSettings = LocalCacheSettings(),
+    ):
+        """
+        Inicializa o backend com o cache local vazio.
+
+        Args:
+            remote (Backend): O backend compartilhado entre os processos, normalmente
+                o `RedisBackend`.
+            redis (Optional[Redis]): O cliente Redis usado nas mensagens de invalidação.
+                Se omitido, os demais processos não são avisados das alterações.
+            settings (LocalCacheSettings): A configuração do cache local.
+        """
+        self._remote = remote
+        self._redis = redis
+        self._settings = settings
+        self._id = uuid.uuid4().hex
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._size = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def size(self) -> int:
+        """
+        Retorna o tamanho, em bytes, dos valores do cache local.
+        """
+        return self._size
+
+    async def start(self) -> None:
+        """
+        Inscreve o processo no canal de invalidação, se houver um cliente Redis.
+        """
+        if self._redis is None or self._listener is not None:
+            return
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._settings.channel)
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def close(self) -> None:
+        """
+        Cancela a inscrição no canal de invalidação e esvazia o cache local.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._entries.clear()
+        self._size = 0
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[Union[str, bytes]]]:
+        """
+        Lê uma chave e o seu tempo restante de validade, primeiro no cache local.
+
+        Args:
+            key (str): A chave do cache.
+
+        Returns:
+            Tuple[int, Optional[Union[str, bytes]]]: O tempo restante, em segundos, e o valor.
+        """
+        entry = self._get_local(key)
+        if entry is not None:
+            return int(entry.expires_at - time.monotonic()), entry.value
+        ttl, value = await self._remote.get_with_ttl(key)
+        if value is not None and ttl and ttl > 0:
+            self._put_local(key, value, ttl)
+        return ttl, value
+
+    async def get(self, key: str) -> Optional[Union[str, bytes]]:
+        """
+        Lê uma chave, primeiro no cache local.
+
+        Args:
+            key (str): A chave do cache.
+
+        Returns:
+            Optional[Union[str, bytes]]: O valor, se existir.
+        """
+        entry = self._get_local(key)
+        if entry is not None:
+            return entry.value
+        return await self._remote.get(key)
+
+    async def set(
+        self, key: str, value: Union[str, bytes], expire: Optional[int] = None
+    ) -> None:
+        """
+        Grava uma chave nos dois níveis e avisa os demais processos.
+
+        Args:
+            key (str): A chave do cache.
+            value (Union[str, bytes]): O valor codificado.
+            expire (Optional[int]): Tempo de validade, em segundos.
+        """
+        await self._remote.set(key, value, expire)
+        self._evict(key)
+        if expire:
+            self._put_local(key, value, expire)
+        await self._publish({"key": key})
+
+    async def clear(
+        self, namespace: Optional[str] = None, key: Optional[str] = None
+    ) -> int:
+        """
+        Remove uma chave ou um espaço de nomes dos dois níveis e avisa os demais processos.
+
+        Args:
+            namespace (Optional[str]): O prefixo das chaves a serem removidas.
+            key (Optional[str]): A chave a ser removida.
+
+        Returns:
+            int: A quantidade de chaves removidas do backend remoto.
+        """
+        removed = await self._remote.clear(namespace=namespace, key=key)
+        message = {"namespace": namespace} if namespace else {"key": key}
+        self._invalidate(message)
+        await self._publish(message)
+        return removed
+
+    def _get_local(self, key: str) -> Optional[_LocalEntry]:
+        """
+        Lê uma chave do cache local, descartando-a se tiver expirado.
+
+        Args:
+            key (str): A chave do cache.
+
+        Returns:
+            Optional[_LocalEntry]: O valor local, se existir e estiver válido.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.evict_at <= time.monotonic():
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put_local(self, key: str, value: Union[str, bytes], ttl: int) -> None:
+        """
+        Grava uma chave no cache local, descartando as menos usadas se necessário.
+
+        Valores maiores que o tamanho máximo do cache local não são armazenados.
+
+        Args:
+            key (str): A chave do cache.
+            value (Union[str, bytes]): O valor codificado.
+            ttl (int): O tempo restante de validade no backend remoto, em segundos.
+        """
+        size = len(key) + len(value if isinstance(value, bytes) else value.encode())
+        if size > self._settings.max_bytes:
+            return
+        self._evict(key)
+        now = time.monotonic()
+        self._entries[key] = _LocalEntry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            evict_at=now + min(ttl, self._settings.max_ttl),
+        )
+        self._size += size
+        while self._size > self._settings.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+    def _evict(self, key: str) -> None:
+        """
+        Remove uma chave do cache local, se existir.
+
+        Args:
+            key (str): A chave do cache.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _invalidate(self, message: dict) -> None:
+        """
+        Remove do cache local a chave ou o espaço de nomes de uma mensagem de invalidação.
+
+        Args:
+            message (dict): A mensagem, com a chave `key` ou `namespace`.
+        """
+        namespace = message.get("namespace")
+        if namespace:
+            for key in [key for key in self._entries if key.startswith(namespace)]:
+                self._evict(key)
+        elif message.get("key"):
+            self._evict(message["key"])
+        else:
+            self._entries.clear()
+            self._size = 0
+
+    async def _publish(self, message: dict) -> None:
+        """
+        Publica uma mensagem de invalidação para os demais processos.
+
+        Args:
+            message (dict): A mensagem, com a chave `key` ou `namespace`.
+        """
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(
+                self._settings.channel, json.dumps({**message, "sender": self._id})
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Error publishing cache invalidation: {e!r}")
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        """
+        Aplica ao cache local as mensagens de invalidação dos demais processos.
+
+        Se a conexão com o Redis for perdida, o cache local é esvaziado, pois as
+        mensagens publicadas enquanto isso não são recebidas. A inscrição no canal
+        é cancelada quando a tarefa é cancelada.
+
+        Args:
+            pubsub (PubSub): A conexão inscrita no canal de invalidação.
+        """
+        try:
+            while True:
+                try:
+                    await self._receive(pubsub)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning(f"Cache invalidation listener failed: {e!r}")
+                    self._invalidate({})
+                    await asyncio.sleep(1)
+        finally:
+            await pubsub.unsubscribe(self._settings.channel)
+            await pubsub.close()
+
+    async def _receive(self, pubsub: PubSub) -> None:
+        """
+        Aplica ao cache local as mensagens recebidas até a conexão ser encerrada.
+
+        Args:
+            pubsub (PubSub): A conexão inscrita no canal de invalidação.
+        """
+        async for message in pubsub.listen():
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            if data.get("sender") != self._id:
+                self._invalidate(data)
@@ -0,0 +1,67 @@
+"""
+Módulo de leitura e gravação de várias chaves do cache de uma vez.
+
+Permite que uma rota que agrega várias consultas, como o clima de várias
+cidades, sirva os valores já gravados pelas rotas de consulta individual e
+grave de volta os valores que precisou calcular, com a mesma validade que o
+decorador `cache` utilizaria.
+"""
+
+import asyncio
+from typing import Mapping, Optional
+
+from fastapi_cache import FastAPICache
+from loguru import logger
+
+
+async def get_many(keys: list[str], grace: int) -> list[Optional[bytes]]:
+    """
+    Lê várias chaves do cache de forma concorrente, considerando apenas os valores atuais.
+
+    Valores expirados, mantidos apenas para serem servidos durante o recálculo, e
+    falhas do backend são tratados como ausência do valor.
+
+    Args:
+        keys (list[str]): As chaves do cache.
+        grace (int): Tempo, em segundos, em que os valores são mantidos após expirar.
+
+    Returns:
+        list[Optional[bytes]]: O valor codificado de cada chave, na mesma ordem de
+        `keys`, ou `None` para as chaves ausentes ou expiradas.
+    """
+    if not keys or not FastAPICache.get_enable():
+        return [None] * len(keys)
+    backend = FastAPICache.get_backend()
+    results = await asyncio.gather(
+        *(backend.get_with_ttl(key) for key in keys), return_exceptions=True
+    )
+    values = []
+    for key, result in zip(keys, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Error retrieving cache key '{key}' from backend:")
+            values.append(None)
+            continue
+        ttl, encoded = result
+        values.append(encoded if (ttl or 0) - grace > 0 else None)
+    return values
+
+
+async def set_many(values: Mapping[str, bytes], expire: int, grace: int) -> None:
+    """
+    Grava várias chaves do cache de forma concorrente.
+
+    Args:
+        values (Mapping[str, bytes]): Os valores codificados, pela chave.
+        expire (int): Tempo, em segundos, em que os valores são considerados atuais.
+        grace (int): Tempo, em segundos, em que os valores são mantidos após expirar.
+    """
+    if not values or not FastAPICache.get_enable():
+        return
+    backend = FastAPICache.get_backend()
+    results = await asyncio.gather(
+        *(backend.set(key, value, expire + grace) for key, value in values.items()),
+        return_exceptions=True,
+    )
+    for key, result in zip(values, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Error setting cache key '{key}' in backend:")
@@ -0,0 +1,102 @@
+"""
+Módulo do codificador binário das respostas em cache.
+
+Substitui o `JsonCoder` do `fastapi_cache`, que grava texto JSON, por um
+formato binário compacto: o JSON sem espaços, comprimido com `zlib` quando
+ultrapassa um tamanho mínimo. Um byte de marcação no início do valor indica o
+formato, de forma que valores gravados pelo `JsonCoder` continuam sendo lidos.
+"""
+
+import zlib
+from typing import Any, Union
+
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder
+from pydantic import BaseModel
+
+from tempotech.core import config
+from tempotech.core.utils.fast_json import dumps, loads
+
+_RAW = b"j"
+"""
+Marcação dos valores gravados como JSON sem compressão.
+"""
+_COMPRESSED = b"z"
+"""
+Marcação dos valores gravados como JSON comprimido com `zlib`.
+"""
+
+
+class CompactCoder(Coder):
+    """
+    Codificador binário do cache, com compressão dos valores grandes.
+
+    Os modelos são serializados diretamente pelo Pydantic, com os nomes de
+    campos das respostas da API, e os demais valores são convertidos com o
+    `jsonable_encoder`. Como o valor gravado já é o JSON da resposta, ele pode
+    ser enviado sem ser decodificado, por meio de `to_json`. Requer uma conexão
+    com o Redis que não decodifique as respostas como texto.
+    """
+
+    min_compress_size: int = config.CACHE_COMPRESS_MIN_BYTES
+    """
+    Tamanho mínimo, em bytes, a partir do qual os valores são comprimidos.
+    """
+    compress_level: int = config.CACHE_COMPRESS_LEVEL
+    """
+    Nível de compressão do `zlib`, de 1 (mais rápido) a 9 (menor).
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        """
+        Codifica um valor para ser gravado no cache.
+
+        Args:
+            value (Any): O valor retornado pela rota.
+
+        Returns:
+            bytes: O valor codificado, precedido do byte de marcação do formato.
+        """
+        if isinstance(value, BaseModel):
+            data = value.model_dump_json(by_alias=True).encode()
+        else:
+            data = dumps(jsonable_encoder(value))
+        if len(data) >= cls.min_compress_size:
+            return _COMPRESSED + zlib.compress(data, cls.compress_level)
+        return _RAW + data
+
+    @classmethod
+    def decode(cls, value: Union[bytes, str]) -> Any:
+        """
+        Decodifica um valor lido do cache.
+
+        Valores sem byte de marcação são lidos como o JSON gravado pelo `JsonCoder`.
+
+        Args:
+            value (Union[bytes, str]): O valor codificado.
+
+        Returns:
+            Any: O valor, como tipos JSON.
+        """
+        return loads(cls.to_json(value))
+
+    @classmethod
+    def to_json(cls, value: Union[bytes, str]) -> bytes:
+        """
+        Extrai o JSON de um valor lido do cache, sem decodificá-lo.
+
+        Args:
+            value (Union[bytes, str]): O valor codificado.
+
+        Returns:
+            bytes: O JSON, em UTF-8.
+        """
+        if isinstance(value, str):
+            return value.encode()
+        marker, data = value[:1], value[1:]
+        if marker == _COMPRESSED:
+            return zlib.decompress(data)
+        if marker == _RAW:
+            return data
+        return value
@@ -0,0 +1,542 @@
+"""
+Módulo do decorador de cache das rotas com proteção contra estouro de recálculo.
+
+O decorador substitui o `cache` do `fastapi_cache`, mantendo a mesma assinatura
+e o mesmo comportamento de cabeçalhos (`Cache-Control` e `ETag`). Na expiração
+de uma chave popular, apenas um processo, entre todos os que compartilham o
+Redis, executa a rota novamente: os demais servem o valor expirado, mantido por
+mais `CACHE_STALE_TTL` segundos, ou aguardam brevemente o novo valor. As rotas
+podem ainda optar pelo modo `stale-while-revalidate`, em que o valor expirado é
+servido imediatamente enquanto uma tarefa em segundo plano o recalcula.
+"""
+
+import asyncio
+import inspect
+import time
+from functools import partial, wraps
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import Coder
+from loguru import logger
+from starlette.requests import Request
+from starlette.responses import Response
+
+from tempotech.api.cache.coder import CompactCoder
+from tempotech.api.cache.lock import FillLock
+from tempotech.api.cache.refresh_ahead import RefreshAheadScheduler
+from tempotech.api.responses import FastJSONResponse, content_etag, etag_matches
+from tempotech.core import config
+from tempotech.core.utils.single_flight import SingleFlight
+
+T = TypeVar("T")
+
+_POLL_INTERVAL = 0.05
+"""
+Intervalo, em segundos, entre as consultas ao cache enquanto outro processo o preenche.
+"""
+
+_revalidations: set[asyncio.Task] = set()
+"""
+Tarefas de revalidação em segundo plano, mantidas até a conclusão para não serem coletadas.
+"""
+
+_fills = SingleFlight()
+"""
+Preenchimentos em andamento neste processo, para que apenas uma corrotina dispute a trava de cada chave.
+"""
+
+
+class Revalidation(NamedTuple):
+    """
+    Recálculo em segundo plano das chaves de uma rota.
+
+    Se nenhum atributo for informado, as chaves são recalculadas apenas durante
+    as requisições.
+
+    Attributes:
+        stale_while_revalidate (Optional[int]): Tempo, em segundos, em que o valor
+            expirado é servido enquanto é recalculado em segundo plano.
+        refresh_ahead (Optional[RefreshAheadScheduler]): O agendador que recalcula as
+            chaves mais consultadas pouco antes de expirarem.
+    """
+
+    stale_while_revalidate: Optional[int] = None
+    refresh_ahead: Optional[RefreshAheadScheduler] = None
+
+
+class _Entry(NamedTuple):
+    """
+    Chave do cache de uma requisição e a forma de recalculá-la.
+
+    Attributes:
+        key (str): A chave do cache.
+        call (Callable[[], Awaitable[Any]]): A execução da rota.
+        coder (Type[Coder]): O codificador dos valores.
+        expire (int): Tempo, em segundos, em que o valor é considerado atual.
+        grace (int): Tempo, em segundos, em que o valor é mantido após expirar.
+        revalidate (bool): Se o valor expirado é servido enquanto é recalculado em
+            segundo plano (`stale-while-revalidate`).
+    """
+
+    key: str
+    call: Callable[[], Awaitable[Any]]
+    coder: Type[Coder]
+    expire: int
+    grace: int
+    revalidate: bool
+
+
+def cache(
+    expire: Optional[int] = None,
+    coder: Optional[Type[Coder]] = None,
+    key_builder: Optional[Callable[..., Any]] = None,
+    namespace: str = "",
+    revalidation: Revalidation = Revalidation(),
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Armazena em cache a resposta de uma rota, coordenando o seu recálculo entre processos.
+
+    O valor é gravado com validade de `expire` mais `CACHE_STALE_TTL` segundos, e é
+    considerado atual apenas durante os primeiros `expire` segundos. Quando a chave
+    não está atual, o processo que adquire a trava de preenchimento executa a rota;
+    os demais servem o valor expirado, se ainda existir, ou aguardam o novo valor por
+    até `CACHE_LOCK_WAIT` segundos antes de executarem a rota por conta própria.
+
+    Com `revalidation.stale_while_revalidate`, o valor expirado é mantido por esse
+    tempo, em vez de `CACHE_STALE_TTL`, e é servido a todas as requisições, inclusive
+    a do processo que adquire a trava, que recalcula a chave em segundo plano. A execução ocorre após a
+    resposta, portanto as dependências da rota não podem depender do escopo da
+    requisição, como uma sessão do banco de dados.
+
+    Com o `CompactCoder`, as requisições recebem o JSON gravado no cache diretamente,
+    sem que ele seja decodificado, validado pelo modelo de resposta e serializado de novo.
+
+    Com `revalidation.refresh_ahead`, cada requisição é registrada no agendador, que
+    recalcula as chaves mais requisitadas pouco antes de expirarem, com a mesma
+    restrição sobre as dependências da rota.
+
+    Args:
+        expire (Optional[int]): Tempo, em segundos, em que o valor é considerado atual.
+            Se omitido, utiliza o padrão configurado em `FastAPICache`.
+        coder (Optional[Type[Coder]]): O codificador dos valores. Se omitido, utiliza
+            o configurado em `FastAPICache`.
+        key_builder (Optional[Callable[..., Any]]): O construtor das chaves. Se omitido,
+            utiliza o configurado em `FastAPICache`.
+        namespace (str): O espaço de nomes das chaves da rota.
+        revalidation (Revalidation): O recálculo em segundo plano das chaves. Se
+            omitido, as chaves são recalculadas apenas durante as requisições.
+
+    Returns:
+        Callable: O decorador da rota.
+    """
+
+    def wrapper(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature, request_name, response_name = _route_signature(func)
+
+        @wraps(func)
+        async def inner(*args, **kwargs):
+            call = partial(_execute, func, args, kwargs)
+            route_kwargs = kwargs.copy()
+            request: Optional[Request] = route_kwargs.pop(request_name, None)
+            response: Optional[Response] = route_kwargs.pop(response_name, None)
+            if _bypass(request):
+                return await call()
+
+            cache_key = (key_builder or FastAPICache.get_key_builder())(
+                func,
+                namespace,
+                request=request,
+                response=response,
+                args=args,
+                kwargs=route_kwargs,
+            )
+            if inspect.isawaitable(cache_key):
+                cache_key = await cache_key
+            entry = _Entry(
+                key=cache_key,
+                call=call,
+                coder=coder or FastAPICache.get_coder(),
+                expire=expire or FastAPICache.get_expire(),
+                grace=(
+                    config.CACHE_STALE_TTL
+                    if revalidation.stale_while_revalidate is None
+                    else revalidation.stale_while_revalidate
+                ),
+                revalidate=bool(revalidation.stale_while_revalidate),
+            )
+            if revalidation.refresh_ahead is not None:
+                revalidation.refresh_ahead.record(
+                    entry.key,
+                    expires_in=partial(_expires_in, entry),
+                    refresh=partial(_refresh, entry),
+                )
+            fresh = await _lookup(entry)
+            if response is None:
+                return entry.coder.decode(fresh[1])
+            return _respond(entry, request, response, fresh)
+
+        inner.__signature__ = signature
+        return inner
+
+    return wrapper
+
+
+def _route_signature(func: Callable[..., Any]) -> Tuple[inspect.Signature, str, str]:
+    """
+    Monta a assinatura da rota decorada, garantindo os parâmetros da requisição e da resposta.
+
+    Se a rota não declara um parâmetro `Request` ou `Response`, um parâmetro
+    nomeado é acrescentado à assinatura, para que o FastAPI o injete.
+
+    Args:
+        func (Callable[..., Any]): A rota.
+
+    Returns:
+        Tuple[inspect.Signature, str, str]: A assinatura e os nomes dos parâmetros
+        da requisição e da resposta.
+    """
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    names = []
+    for annotation, default_name in (
+        (Request, "__fastapi_cache_request"),
+        (Response, "__fastapi_cache_response"),
+    ):
+        param = _find_param(signature, annotation)
+        if param is None:
+            param = inspect.Parameter(
+                name=default_name,
+                annotation=annotation,
+                kind=inspect.Parameter.KEYWORD_ONLY,
+            )
+            parameters.append(param)
+        names.append(param.name)
+    return signature.replace(parameters=parameters), names[0], names[1]
+
+
+async def _execute(func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    """
+    Executa a rota, em uma thread se ela não for uma corrotina.
+
+    Args:
+        func (Callable[..., Any]): A rota.
+        args (tuple): Os argumentos posicionais da rota.
+        kwargs (dict): Os argumentos nomeados da rota.
+
+    Returns:
+        Any: O retorno da rota.
+    """
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+def _bypass(request: Optional[Request]) -> bool:
+    """
+    Indica se a requisição deve ser atendida sem o cache.
+
+    Args:
+        request (Optional[Request]): A requisição, se houver.
+
+    Returns:
+        bool: Verdadeiro se o cache está desabilitado, se a requisição não é um
+        `GET` ou se o cliente pediu para não usar o cache.
+    """
+    if not FastAPICache.get_enable():
+        return True
+    return request is not None and (
+        request.method != "GET"
+        or request.headers.get("Cache-Control") in ("no-store", "no-cache")
+    )
+
+
+async def _lookup(entry: _Entry) -> Tuple[int, str]:
+    """
+    Lê o valor atual de uma chave, recalculando-a se necessário.
+
+    Um valor atual é servido diretamente. Um valor expirado é servido enquanto é
+    recalculado em segundo plano, no modo `stale-while-revalidate`, ou enquanto
+    outro processo detém a trava de preenchimento. Nos demais casos, a rota é
+    executada durante a requisição.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+
+    Returns:
+        Tuple[int, str]: O tempo restante em que o valor é atual, negativo se já
+        expirou, e o valor codificado.
+    """
+    ttl, encoded = await _get(entry.key)
+    fresh_ttl = ttl - entry.grace
+    if encoded is not None and (fresh_ttl > 0 or entry.revalidate):
+        if fresh_ttl <= 0:
+            _revalidate(entry, encoded)
+        return fresh_ttl, encoded
+    fill = await _fills.do(entry.key, partial(_fill, entry, encoded))
+    if fill is not None:
+        return fill
+    if encoded is None:
+        return entry.expire, entry.coder.encode(await entry.call())
+    return fresh_ttl, encoded
+
+
+def _respond(
+    entry: _Entry,
+    request: Optional[Request],
+    response: Response,
+    fresh: Tuple[int, str],
+) -> Any:
+    """
+    Define os cabeçalhos de cache e monta a resposta da rota.
+
+    Responde `304 Not Modified` se o cliente já possui o valor, e, com o
+    `CompactCoder`, o JSON gravado no cache, sem decodificá-lo.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+        request (Optional[Request]): A requisição, se houver.
+        response (Response): A resposta injetada na rota.
+        fresh (Tuple[int, str]): O tempo restante em que o valor é atual e o valor codificado.
+
+    Returns:
+        Any: A resposta ou o valor decodificado.
+    """
+    fresh_ttl, encoded = fresh
+    response.headers.update(_cache_headers(entry, fresh_ttl, encoded))
+    if request is not None and etag_matches(request, response.headers["ETag"]):
+        response.status_code = 304
+        return response
+    if issubclass(entry.coder, CompactCoder):
+        return _raw_response(entry.coder.to_json(encoded), response)
+    return entry.coder.decode(encoded)
+
+
+def _cache_headers(entry: _Entry, fresh_ttl: int, encoded: str) -> dict[str, str]:
+    """
+    Monta os cabeçalhos `Cache-Control`, `Age` e `ETag` de um valor do cache.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+        fresh_ttl (int): O tempo restante em que o valor é atual, negativo se já expirou.
+        encoded (str): O valor codificado.
+
+    Returns:
+        dict[str, str]: Os cabeçalhos da resposta.
+    """
+    cache_control = f"max-age={max(fresh_ttl, 0)}"
+    if entry.revalidate:
+        cache_control += f", stale-while-revalidate={entry.grace}"
+    return {
+        "Cache-Control": cache_control,
+        "Age": str(max(entry.expire - fresh_ttl, 0)),
+        "ETag": content_etag(encoded),
+    }
+
+
+async def _fill(entry: _Entry, stale: Optional[str]) -> Optional[Tuple[int, str]]:
+    """
+    Preenche uma chave do cache, ou aguarda o seu preenchimento por outro processo.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+        stale (Optional[str]): O valor expirado ainda armazenado, se existir.
+
+    Returns:
+        Optional[Tuple[int, str]]: O tempo restante em que o valor é atual, negativo
+        se já expirou, e o valor codificado, ou `None` quando o valor expirado deve
+        ser servido.
+    """
+    token = await FillLock.acquire(entry.key, config.CACHE_LOCK_TTL)
+    if token is None:
+        if stale is not None:
+            return None
+        filled = await _wait(entry)
+        if filled is not None:
+            return filled
+    try:
+        encoded = entry.coder.encode(await entry.call())
+        await _set(entry.key, encoded, entry.expire + entry.grace)
+        return entry.expire, encoded
+    finally:
+        if token is not None:
+            await FillLock.release(entry.key, token)
+
+
+async def _wait(entry: _Entry) -> Optional[Tuple[int, str]]:
+    """
+    Aguarda, por até `CACHE_LOCK_WAIT` segundos, o preenchimento de uma chave por outro processo.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+
+    Returns:
+        Optional[Tuple[int, str]]: O tempo restante em que o valor é atual e o valor
+        codificado, ou `None` se a chave não foi preenchida a tempo.
+    """
+    deadline = time.monotonic() + config.CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_POLL_INTERVAL)
+        ttl, encoded = await _get(entry.key)
+        if encoded is not None:
+            return ttl - entry.grace, encoded
+    return None
+
+
+def _refresh(entry: _Entry) -> Awaitable[Optional[Tuple[int, str]]]:
+    """
+    Recalcula uma chave do cache antes de expirar, a pedido do `RefreshAheadScheduler`.
+
+    Se outro processo detém a trava de preenchimento, a chave não é recalculada.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+
+    Returns:
+        Awaitable[Optional[Tuple[int, str]]]: O preenchimento da chave.
+    """
+    return _fills.do(entry.key, partial(_fill, entry, ""))
+
+
+def _revalidate(entry: _Entry, stale: str) -> None:
+    """
+    Recalcula uma chave expirada do cache em segundo plano.
+
+    O recálculo é coalescido com os preenchimentos em andamento neste processo e
+    só ocorre se a trava de preenchimento for adquirida; caso contrário, outro
+    processo já está recalculando a chave.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+        stale (str): O valor expirado servido durante o recálculo.
+    """
+    task = asyncio.ensure_future(_fills.do(entry.key, partial(_fill, entry, stale)))
+    _revalidations.add(task)
+    task.add_done_callback(_revalidated)
+
+
+def _revalidated(task: asyncio.Task) -> None:
+    """
+    Descarta uma tarefa de revalidação concluída, registrando a sua falha, se houver.
+
+    Args:
+        task (asyncio.Task): A tarefa concluída.
+    """
+    _revalidations.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Error revalidating cache key: {task.exception()!r}")
+
+
+def _raw_response(body: bytes, response: Response) -> Response:
+    """
+    Monta a resposta a partir do JSON gravado no cache, sem decodificá-lo.
+
+    O JSON foi produzido a partir do retorno da rota, já validado, por isso a
+    resposta dispensa a validação pelo modelo de resposta e a serialização. Os
+    cabeçalhos definidos na resposta da rota são copiados, pois o FastAPI não os
+    aplica a uma resposta retornada diretamente.
+
+    Args:
+        body (bytes): O JSON da resposta.
+        response (Response): A resposta injetada na rota, com os cabeçalhos de cache.
+
+    Returns:
+        Response: A resposta JSON.
+    """
+    raw = Response(
+        content=body,
+        status_code=response.status_code or 200,
+        media_type=FastJSONResponse.media_type,
+    )
+    raw.headers.update(
+        {
+            name: value
+            for name, value in response.headers.items()
+            if name != "content-length"
+        }
+    )
+    return raw
+
+
+async def _expires_in(entry: _Entry) -> int:
+    """
+    Calcula o tempo até uma chave do cache deixar de ser atual.
+
+    Args:
+        entry (_Entry): A chave do cache e a forma de recalculá-la.
+
+    Returns:
+        int: O tempo restante, em segundos, negativo se a chave já expirou ou não existe.
+    """
+    ttl, _ = await _get(entry.key)
+    return ttl - entry.grace
+
+
+async def _get(cache_key: str) -> Tuple[int, Optional[str]]:
+    """
+    Lê uma chave do cache e o seu tempo restante de validade.
+
+    Falhas do backend são tratadas como ausência do valor, como no `fastapi_cache`.
+
+    Args:
+        cache_key (str): A chave do cache.
+
+    Returns:
+        Tuple[int, Optional[str]]: O tempo restante, em segundos, e o valor codificado.
+    """
+    try:
+        ttl, encoded = await FastAPICache.get_backend().get_with_ttl(cache_key)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning(f"Error retrieving cache key '{cache_key}' from backend:")
+        return 0, None
+    return ttl or 0, encoded
+
+
+async def _set(cache_key: str, encoded: str, expire: int) -> None:
+    """
+    Grava uma chave do cache.
+
+    Falhas do backend são registradas e ignoradas, como no `fastapi_cache`.
+
+    Args:
+        cache_key (str): A chave do cache.
+        encoded (str): O valor codificado.
+        expire (int): Tempo, em segundos, em que o valor é mantido.
+    """
+    try:
+        await FastAPICache.get_backend().set(cache_key, encoded, expire)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.warning(f"Error setting cache key '{cache_key}' in backend:")
+
+
+def _find_param(
+    signature: inspect.Signature, annotation: type
+) -> Optional[inspect.Parameter]:
+    """
+    Localiza o parâmetro da rota com a anotação informada.
+
+    Args:
+        signature (inspect.Signature): A assinatura da rota.
+        annotation (type): A anotação procurada, `Request` ou `Response`.
+
+    Returns:
+        Optional[inspect.Parameter]: O parâmetro, se existir.
+    """
+    return next(
+        (
+            param
+            for param in signature.parameters.values()
+            if param.annotation is annotation
+        ),
+        None,
+    )
@@ -0,0 +1,187 @@
+"""
+Módulo do construtor de chaves canônicas do cache.
+
+O construtor padrão do `fastapi_cache` gera a chave a partir de todos os
+argumentos da rota, de forma que variações de escrita de uma mesma consulta,
+como `/weather/current/Sao%20Paulo` e `/weather/current/são paulo`, ou a ordem
+dos parâmetros da URL, geram chaves diferentes. Aqui, a chave é montada apenas
+com os parâmetros declarados pela rota, normalizados e sem os valores padrão.
+"""
+
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.key_builder import default_key_builder
+from starlette.requests import Request
+
+
+def collapse_spaces(value: str) -> str:
+    """
+    Remove os espaços das extremidades e os espaços repetidos de um texto.
+
+    Args:
+        value (str): O texto do parâmetro.
+
+    Returns:
+        str: O texto com espaços simples.
+    """
+    return " ".join(value.split())
+
+
+def normalize_uf(value: str) -> str:
+    """
+    Normaliza a sigla de um estado para letras maiúsculas.
+
+    Args:
+        value (str): A sigla do estado (ex: "sc").
+
+    Returns:
+        str: A sigla em letras maiúsculas (ex: "SC").
+    """
+    return value.strip().upper()
+
+
+def normalize_int(value: str) -> str:
+    """
+    Normaliza um parâmetro numérico, removendo zeros à esquerda e espaços.
+
+    Valores inválidos são mantidos, pois a rota responderá com erro de validação.
+
+    Args:
+        value (str): O número do parâmetro.
+
+    Returns:
+        str: O número normalizado.
+    """
+    try:
+        return str(int(value))
+    except ValueError:
+        return value
+
+
+class Param(NamedTuple):
+    """
+    Parâmetro de uma rota considerado na chave do cache.
+
+    Attributes:
+        normalize (Callable[[str], str]): A normalização do valor do parâmetro.
+        default (Optional[str]): O valor padrão, já normalizado, omitido da chave.
+    """
+
+    normalize: Callable[[str], str] = collapse_spaces
+    default: Optional[str] = None
+
+
+def canonical_key_builder(**params: Param) -> Callable[..., str]:
+    """
+    Cria um construtor de chaves canônicas para uma rota.
+
+    A chave é composta pelo prefixo do `FastAPICache`, pelo espaço de nomes e
+    pela rota, seguidos dos parâmetros informados, lidos do caminho e da URL da
+    requisição, em ordem alfabética. Parâmetros não informados aqui, como os
+    usados apenas para evitar caches intermediários, são ignorados.
+
+    Exemplo: `canonical_key_builder(city_name=Param(normalize_text))`.
+
+    Args:
+        **params (Param): Os parâmetros da rota, pelo nome.
+
+    Returns:
+        Callable[..., str]: O construtor de chaves, a ser informado em `key_builder`
+        do decorador `cache`.
+    """
+
+    def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        request: Optional[Request] = None,
+        **arguments: Any,
+    ) -> str:
+        if request is None:
+            return default_key_builder(func, namespace, request=request, **arguments)
+        return canonical_key(
+            func, namespace, params, {**request.query_params, **request.path_params}
+        )
+
+    return key_builder
+
+
+def arguments_key_builder(
+    **params: Callable[[Mapping[str, Any]], Any],
+) -> Callable[..., str]:
+    """
+    Cria um construtor de chaves canônicas a partir dos argumentos já resolvidos da rota.
+
+    Diferentemente de `canonical_key_builder`, que lê os parâmetros da requisição,
+    a chave é composta com valores obtidos dos argumentos da rota, como as
+    dependências injetadas. Permite, por exemplo, compor a chave com a cidade
+    resolvida a partir de um nome digitado livremente.
+
+    Exemplo: `arguments_key_builder(location_id=lambda kwargs: kwargs["use_case"].location.id)`.
+
+    Args:
+        **params (Callable[[Mapping[str, Any]], Any]): A função que obtém o valor de
+            cada parâmetro da chave a partir dos argumentos da rota, pelo nome.
+
+    Returns:
+        Callable[..., str]: O construtor de chaves, a ser informado em `key_builder`
+        do decorador `cache`.
+    """
+    key_params = {name: Param() for name in params}
+
+    def key_builder(
+        func: Callable[..., Any],
+        namespace: str = "",
+        *,
+        kwargs: Mapping[str, Any],
+        **_: Any,
+    ) -> str:
+        return canonical_key(
+            func,
+            namespace,
+            key_params,
+            {name: value(kwargs) for name, value in params.items()},
+        )
+
+    return key_builder
+
+
+def canonical_key(
+    func: Callable[..., Any],
+    namespace: str,
+    params: Mapping[str, Param],
+    values: Mapping[str, Any],
+) -> str:
+    """
+    Monta a chave canônica de uma rota a partir dos valores dos seus parâmetros.
+
+    Permite que outras rotas, como a consulta de várias cidades, leiam e gravem
+    as mesmas chaves que a rota gravaria ao ser requisitada diretamente.
+
+    Args:
+        func (Callable[..., Any]): A rota.
+        namespace (str): O espaço de nomes das chaves da rota.
+        params (Mapping[str, Param]): Os parâmetros da rota considerados na chave.
+        values (Mapping[str, Any]): Os valores dos parâmetros, pelo nome.
+
+    Returns:
+        str: A chave do cache.
+    """
+    parts = []
+    for name in sorted(params):
+        if name not in values:
+            continue
+        param = params[name]
+        value = param.normalize(str(values[name]))
+        if value != param.default:
+            parts.append(f"{name}={value}")
+    return ":".join(
+        [
+            FastAPICache.get_prefix(),
+            namespace,
+            func.__module__,
+            func.__name__,
+            "&".join(parts),
+        ]
+    )
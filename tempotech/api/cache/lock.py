@@ -0,0 +1,90 @@
+"""
+Módulo da trava distribuída de preenchimento do cache.
+
+A trava é uma chave no Redis criada com `SET NX` e um tempo de expiração, de
+forma que apenas um processo, entre todos os que compartilham o Redis,
+recalcula uma chave do cache expirada. A expiração garante que a trava seja
+liberada mesmo que o processo que a detém seja encerrado.
+"""
+
+import uuid
+from typing import ClassVar, Optional
+
+from redis.asyncio import Redis
+
+
+class FillLock:
+    """
+    Trava distribuída para o preenchimento de chaves do cache.
+
+    Segue o mesmo padrão de `FastAPICache` e `FastAPILimiter`: a conexão com o
+    Redis é configurada no nível da classe, em `init`, durante o ciclo de vida
+    da aplicação. Enquanto não for inicializada, a trava é sempre concedida,
+    preservando o comportamento de um único processo.
+    """
+
+    _redis: ClassVar[Optional[Redis]] = None
+    _prefix: ClassVar[str] = "fastapi-cache-lock"
+
+    _RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+    """
+    Script Lua que remove a trava apenas se ela ainda pertencer a quem a adquiriu.
+    """
+
+    @classmethod
+    async def init(cls, redis: Redis, prefix: str = "fastapi-cache-lock") -> None:
+        """
+        Configura a conexão com o Redis usada pelas travas.
+
+        Args:
+            redis (Redis): O cliente Redis compartilhado pela aplicação.
+            prefix (str): O prefixo das chaves das travas.
+        """
+        cls._redis = redis
+        cls._prefix = prefix
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Descarta a conexão configurada, sem encerrá-la.
+        """
+        cls._redis = None
+
+    @classmethod
+    async def acquire(cls, key: str, ttl: float) -> Optional[str]:
+        """
+        Tenta adquirir a trava de uma chave do cache, sem aguardar.
+
+        Args:
+            key (str): A chave do cache a ser preenchida.
+            ttl (float): Tempo máximo, em segundos, que a trava é mantida.
+
+        Returns:
+            Optional[str]: O identificador da trava adquirida, necessário para
+            liberá-la, ou `None` se outro processo já a detém.
+        """
+        token = uuid.uuid4().hex
+        if cls._redis is None:
+            return token
+        acquired = await cls._redis.set(
+            f"{cls._prefix}:{key}", token, nx=True, px=int(ttl * 1000)
+        )
+        return token if acquired else None
+
+    @classmethod
+    async def release(cls, key: str, token: str) -> None:
+        """
+        Libera a trava de uma chave do cache, se ela ainda pertencer ao identificador.
+
+        Args:
+            key (str): A chave do cache preenchida.
+            token (str): O identificador retornado por `acquire`.
+        """
+        if cls._redis is None:
+            return
+        await cls._redis.eval(cls._RELEASE_SCRIPT, 1, f"{cls._prefix}:{key}", token)
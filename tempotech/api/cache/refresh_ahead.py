@@ -0,0 +1,169 @@
+"""
+Módulo do agendador de atualização antecipada (refresh-ahead) do cache.
+
+O agendador conta as requisições recebidas por chave do cache e, periodicamente,
+recalcula as chaves mais requisitadas pouco antes de expirarem. Assim, as
+requisições às cidades mais populares encontram o cache sempre atual, sem que
+nenhuma delas aguarde a consulta ao provedor externo.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from loguru import logger
+
+
+class _Entry(NamedTuple):
+    """
+    Funções de uma chave do cache registradas pela rota.
+    """
+
+    expires_in: Callable[[], Awaitable[int]]
+    refresh: Callable[[], Awaitable[Any]]
+
+
+class RefreshAheadSettings(NamedTuple):
+    """
+    Configuração do agendador de atualização antecipada.
+
+    Attributes:
+        top_n (int): Quantidade de chaves mais requisitadas acompanhadas a cada ciclo.
+        lead (int): Antecedência, em segundos, em relação à expiração, com que uma
+            chave é recalculada.
+        interval (float): Intervalo, em segundos, entre os ciclos.
+        budget (int): Quantidade máxima de chaves recalculadas por ciclo, que limita
+            as chamadas ao provedor externo.
+        max_concurrency (int): Quantidade máxima de chaves recalculadas simultaneamente.
+    """
+
+    top_n: int = 300
+    lead: int = 60
+    interval: float = 15
+    budget: int = 60
+    max_concurrency: int = 5
+
+
+class RefreshAheadScheduler:
+    """
+    Agendador que recalcula as chaves mais requisitadas antes de expirarem.
+
+    A frequência de cada chave decai pela metade a cada ciclo, de forma que o
+    ranking acompanha o tráfego recente e as chaves pouco requisitadas deixam
+    de ser acompanhadas. As requisições só são contadas enquanto o agendador
+    estiver em execução, entre `start` e `close`.
+    """
+
+    def __init__(self, settings: RefreshAheadSettings = RefreshAheadSettings()):
+        """
+        Inicializa o agendador, sem nenhuma chave acompanhada.
+
+        Args:
+            settings (RefreshAheadSettings): A configuração do agendador.
+        """
+        self._settings = settings
+        self._hits: Counter[str] = Counter()
+        self._entries: dict[str, _Entry] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record(
+        self,
+        key: str,
+        expires_in: Callable[[], Awaitable[int]],
+        refresh: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Registra uma requisição a uma chave do cache.
+
+        Args:
+            key (str): A chave do cache.
+            expires_in (Callable[[], Awaitable[int]]): Função que retorna o tempo, em
+                segundos, até a chave deixar de ser atual.
+            refresh (Callable[[], Awaitable[Any]]): Função que recalcula a chave e
+                retorna `None` se outro processo já a está recalculando.
+        """
+        if self._task is None:
+            return
+        self._hits[key] += 1
+        self._entries[key] = _Entry(expires_in, refresh)
+
+    async def start(self) -> None:
+        """
+        Inicia os ciclos de atualização em segundo plano.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Encerra os ciclos de atualização e descarta as chaves acompanhadas.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._hits.clear()
+        self._entries.clear()
+
+    async def _run(self) -> None:
+        """
+        Executa um ciclo de atualização a cada `interval` segundos.
+        """
+        while True:
+            await asyncio.sleep(self._settings.interval)
+            try:
+                refreshed = await self.tick()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Refresh-ahead cycle failed: {e!r}")
+            else:
+                if refreshed:
+                    logger.info(f"Refresh-ahead refreshed {refreshed} cache keys")
+
+    async def tick(self) -> int:
+        """
+        Recalcula as chaves mais requisitadas que estão próximas de expirar.
+
+        Ao final, a frequência das chaves decai pela metade.
+
+        Returns:
+            int: A quantidade de chaves recalculadas por este processo.
+        """
+        hot = [key for key, _ in self._hits.most_common(self._settings.top_n)]
+        entries = [self._entries[key] for key in hot]
+        expires_in = await asyncio.gather(
+            *(entry.expires_in() for entry in entries), return_exceptions=True
+        )
+        due = [
+            entry
+            for entry, remaining in zip(entries, expires_in)
+            if not isinstance(remaining, BaseException)
+            and remaining <= self._settings.lead
+        ][: self._settings.budget]
+
+        semaphore = asyncio.Semaphore(self._settings.max_concurrency)
+
+        async def refresh(entry: _Entry) -> Any:
+            async with semaphore:
+                return await entry.refresh()
+
+        results = await asyncio.gather(
+            *(refresh(entry) for entry in due), return_exceptions=True
+        )
+        self._decay()
+        return sum(
+            1
+            for result in results
+            if result is not None and not isinstance(result, BaseException)
+        )
+
+    def _decay(self) -> None:
+        """
+        Reduz pela metade a frequência das chaves, descartando as que chegam a zero.
+        """
+        self._hits = Counter(
+            {key: hits // 2 for key, hits in self._hits.items() if hits // 2}
+        )
+        self._entries = {key: self._entries[key] for key in self._hits}
@@ -7,20 +7,29 @@ localização como dependências reutilizáveis para os endpoints da API,
 promovendo a separação de responsabilidades e a testabilidade.
 """
 
-from typing import Annotated
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Annotated, AsyncGenerator, Callable
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, status
 from sqlalchemy import Engine
 
 from tempotech.core.database.repository import LocationRepository
+from tempotech.core.database.repository.memory import (
+    location_catalog,
+    location_snapshot,
+)
+from tempotech.core.database.repository.memory.location_snapshot import (
+    LocationSnapshot,
+)
 from tempotech.core.database.repository.postgres.connection_repository import (
     ConnectionRepository,
+    ConnectionRepositoryV2,
 )
 from tempotech.core.interfaces.database_repository import (
     IConnectionRepository,
-    IDefaultRepository,
+    ILocationCatalog,
+    ILocationRepository,
 )
-from tempotech.core.schemas.location_schema import Location
 
 DbSession = Annotated[
     IConnectionRepository[Engine], Depends(ConnectionRepository.connect)
@@ -30,11 +39,12 @@ Type alias que representa a dependência de uma sessão de banco de dados.
 
 Utiliza `Annotated` para injetar uma conexão de repositório,
 garantindo que uma nova sessão seja criada e gerenciada
-a cada requisição de endpoint que a utiliza.
+a cada requisição de endpoint que a utiliza. As sessões reutilizam as
+conexões do pool criado no ciclo de vida da aplicação.
 """
 
 
-def get_location_repository(session: DbSession) -> IDefaultRepository[Location]:
+def get_location_repository(session: DbSession) -> ILocationRepository:
     """
     Função de injeção de dependência que fornece o repositório de localização.
 
@@ -42,14 +52,12 @@ def get_location_repository(session: DbSession) -> IDefaultRepository[Location]:
         session (DbSession): A sessão de banco de dados injetada.
 
     Returns:
-        IDefaultRepository[Location]: Uma instância do repositório de localização.
+        ILocationRepository: Uma instância do repositório de localização.
     """
     return LocationRepository(session=session)
 
 
-LocationDbRepository = Annotated[
-    IDefaultRepository[Location], Depends(get_location_repository)
-]
+LocationDbRepository = Annotated[ILocationRepository, Depends(get_location_repository)]
 """
 Type alias que representa a dependência do repositório de localização.
 
@@ -57,3 +65,99 @@ Quando injetado em um endpoint, FastAPI chamará `get_location_repository` para
 fornecer uma instância do repositório, permitindo a interação com os dados de
 localização no banco de dados.
 """
+
+
+@asynccontextmanager
+async def location_repository_scope() -> AsyncGenerator[ILocationRepository, None]:
+    """
+    Gerenciador de contexto que fornece um repositório de localização com sessão própria.
+
+    Diferente de `LocationDbRepository`, a sessão não fica atrelada ao ciclo de
+    vida da requisição, permitindo que o repositório seja usado enquanto uma
+    resposta em streaming é enviada.
+
+    Yields:
+        AsyncGenerator[ILocationRepository, None]: Uma instância do repositório de localização.
+    """
+    async with ConnectionRepositoryV2.connect() as session:
+        yield LocationRepository(session=session)
+
+
+LocationDbRepositoryScope = Annotated[
+    Callable[[], AbstractAsyncContextManager[ILocationRepository]],
+    Depends(lambda: location_repository_scope),
+]
+"""
+Type alias que representa a dependência da fábrica de repositórios de localização.
+
+Quando injetado em um endpoint, fornece `location_repository_scope`, que abre
+uma sessão independente da requisição a cada uso.
+"""
+
+
+def get_location_catalog() -> ILocationCatalog:
+    """
+    Função de injeção de dependência que fornece o catálogo de localizações em memória.
+
+    Returns:
+        ILocationCatalog: A instância compartilhada do catálogo.
+
+    Raises:
+        HTTPException: Se o catálogo ainda não foi carregado.
+    """
+    if not location_catalog.loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Location catalog is still loading.",
+        )
+    return location_catalog
+
+
+LocationCatalogRepository = Annotated[ILocationCatalog, Depends(get_location_catalog)]
+"""
+Type alias que representa a dependência do catálogo de localizações em memória.
+
+Fornece a instância compartilhada do catálogo, carregada no ciclo de vida da
+aplicação. Enquanto o catálogo não é carregado, as requisições que dependem
+dele respondem com o status 503; se a carga inicial falhar, a falha é
+registrada por `log_setup_failure`.
+"""
+
+
+async def get_location_reader() -> AsyncGenerator[ILocationRepository, None]:
+    """
+    Função de injeção de dependência que fornece um repositório para consultas de localização.
+
+    Enquanto o catálogo em memória estiver carregado, ele é fornecido no lugar do
+    repositório do banco de dados, e nenhuma sessão é aberta. Caso contrário, uma
+    sessão é obtida do pool, como em `LocationDbRepository`.
+
+    Yields:
+        AsyncGenerator[ILocationRepository, None]: O catálogo ou o repositório de localização.
+    """
+    if location_catalog.loaded:
+        yield location_catalog
+        return
+    async with ConnectionRepositoryV2.connect() as session:
+        yield LocationRepository(session=session)
+
+
+LocationReadRepository = Annotated[ILocationRepository, Depends(get_location_reader)]
+"""
+Type alias que representa a dependência de um repositório somente para consultas de localização.
+
+Quando injetado em um endpoint, FastAPI chamará `get_location_reader`, que
+prioriza o catálogo em memória e recorre ao banco de dados enquanto ele não
+estiver carregado.
+"""
+
+
+LocationSnapshotRepository = Annotated[
+    LocationSnapshot, Depends(lambda: location_snapshot)
+]
+"""
+Type alias que representa a dependência das listagens de localizações pré-serializadas.
+
+Fornece a instância compartilhada, que pode ainda não ter sido montada; as
+rotas devem consultar `loaded` antes de utilizá-la.
+"""
@@ -3,7 +3,8 @@ Módulo de injeção de dependência para provedores de dados externos.
 
 Este módulo configura e gerencia a injeção de dependências para provedores
 de dados que buscam informações de APIs externas. A injeção de dependência
-para `CountryProvider` garante que o provedor correto seja utilizado,
+para `CountryProvider`, `CoordinateProvider` e `WeatherProvider` garante
+que o provedor correto seja utilizado,
 mantendo o código desacoplado e facilitando a troca de provedores,
 se necessário.
 """
@@ -13,7 +14,12 @@ from typing import Annotated
 from fastapi import Depends
 
 from tempotech.core.interfaces.location_provider import ILocationProvider
-from tempotech.core.providers import coutry_provider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.providers import (
+    coordinate_provider,
+    coutry_provider,
+    weather_provider,
+)
 
 CountryProvider = Annotated[ILocationProvider, Depends(lambda: coutry_provider)]
 """
@@ -23,3 +29,19 @@ Quando um endpoint precisa interagir com um provedor de localização externo,
 ele pode injetar esta dependência, que fornecerá a instância configurada do
 provedor (ex: IBGEProvider).
 """
+
+
+CoordinateProvider = Annotated[ILocationProvider, Depends(lambda: coordinate_provider)]
+"""
+Type alias que representa a injeção de dependência para o provedor de coordenadas.
+
+Fornece a instância configurada do provedor de geocodificação (ex: OpenWeatherProvider).
+"""
+
+
+WeatherProvider = Annotated[IWeatherProvider, Depends(lambda: weather_provider)]
+"""
+Type alias que representa a injeção de dependência para o provedor de clima.
+
+Fornece a instância configurada do provedor de clima (ex: OpenWeatherProvider).
+"""
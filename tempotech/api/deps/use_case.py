@@ -7,43 +7,67 @@ instâncias de casos de uso, injetando as dependências necessárias, como
 repositórios de banco de dados e provedores de dados externos.
 """
 
-from typing import Annotated, Literal, Optional
+from functools import partial
+from typing import Annotated, AsyncGenerator, Callable, Literal, Optional
 
-from fastapi import Depends
+from fastapi import Body, Depends, HTTPException, Query, status
 
-from tempotech.api.deps.database import LocationDbRepository
-from tempotech.api.deps.provider import CountryProvider
+from tempotech.api.deps.database import (
+    LocationCatalogRepository,
+    LocationDbRepositoryScope,
+    LocationReadRepository,
+)
+from tempotech.api.deps.provider import (
+    CoordinateProvider,
+    CountryProvider,
+    WeatherProvider,
+)
+from tempotech.core import config
 from tempotech.core.interfaces.use_case import IUseCase
-from tempotech.core.schemas.location_schema import Location
-from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.schemas.location_schema import (
+    CitySearchParams,
+    Location,
+    LocationMatch,
+)
+from tempotech.core.schemas.pagination_schema import Cursor, Pagination
+from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.use_case.autocomplete_city_use_case import AutocompleteCity
+from tempotech.core.use_case.export_city_use_case import ExportCity
+from tempotech.core.use_case.get_coordinates_use_case import GetCoordinates
+from tempotech.core.use_case.resolve_city_use_case import ResolveCity
 from tempotech.core.use_case.search_city_use_case import SearchCity
 from tempotech.core.use_case.search_state_use_case import SearchState
+from tempotech.core.use_case.search_weather_batch_use_case import (
+    CITY_AMBIGUOUS,
+    CITY_NOT_FOUND,
+    SearchWeatherBatch,
+)
+from tempotech.core.use_case.search_weather_use_case import SearchWeather
 
 
-def get_search_state(location_provider: CountryProvider):
+def get_search_state(
+    location_db: LocationReadRepository, location_provider: CountryProvider
+):
     """
     Função de injeção de dependência para o caso de uso `SearchState`.
 
     Esta função cria e retorna uma instância de `SearchState`, injetando o
-    provedor de localização do país.
+    repositório de localização e o provedor de localização do país.
 
     Args:
+        location_db (LocationReadRepository): O repositório de localização injetado.
         location_provider (CountryProvider): O provedor de localização injetado.
 
     Returns:
         SearchState: Uma instância do caso de uso `SearchState`.
     """
-    return SearchState(location_provider=location_provider)
+    return SearchState(location_db=location_db, location_provider=location_provider)
 
 
 def get_search_city(
-    location_db: LocationDbRepository,
+    location_db: LocationReadRepository,
     state: str,
-    order_by: Optional[Literal["state_name", "city_name"]] = None,
-    search_by: Optional[Literal["country", "state", "state_name", "city_name"]] = None,
-    search_value: Optional[str] = None,
-    page: int = 1,
-    page_size: int = 10,
+    params: Annotated[CitySearchParams, Query()],
 ):
     """
     Função de injeção de dependência para o caso de uso `SearchCity`.
@@ -53,25 +77,251 @@ def get_search_city(
     para o caso de uso.
 
     Args:
-        location_db (LocationDbRepository): O repositório de localização injetado.
+        location_db (LocationReadRepository): O repositório de localização injetado.
         state (str): A abreviação do estado a ser buscado.
-        order_by (Optional[Literal["state_name", "city_name"]]): Coluna para ordenação.
-        search_by (Optional[Literal["country", "state", "state_name", "city_name"]]): Coluna para busca.
-        search_value (Optional[str]): Valor a ser buscado.
-        page (int): O número da página.
-        page_size (int): O número de itens por página.
+        params (CitySearchParams): Os parâmetros de filtro, ordenação e paginação da URL.
+            O cursor opaco (`cursor`), retornado em `nextCursor`, faz a paginação por
+            chave (keyset) em vez de por número de página.
 
     Returns:
         SearchCity: Uma instância do caso de uso `SearchCity`.
+
+    Raises:
+        HTTPException: Se o cursor informado for inválido.
     """
+    try:
+        cursor = Cursor.decode(params.cursor) if params.cursor else None
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)
+        ) from error
     return SearchCity(
-        location_db=location_db,
-        state=state,
-        order_by=order_by,
-        search_by=search_by,
-        search_value=search_value,
-        page=page,
-        page_size=page_size,
+        location_db=location_db, state=state, params=params, cursor=cursor
+    )
+
+
+async def get_export_city(
+    location_db_scope: LocationDbRepositoryScope,
+    location_db: LocationReadRepository,
+    state: Optional[str] = None,
+    order_by: Optional[Literal["state_name", "city_name"]] = None,
+):
+    """
+    Função de injeção de dependência para o caso de uso `ExportCity`.
+
+    A sigla do estado é normalizada para letras maiúsculas e validada antes do
+    início da exportação, pois, depois que o envio começa, não é mais possível
+    responder com um erro.
+
+    Args:
+        location_db_scope (LocationDbRepositoryScope): A fábrica de repositórios de localização injetada.
+        location_db (LocationReadRepository): O repositório usado para validar o estado.
+        state (Optional[str]): A abreviação do estado. Se omitido, exporta todo o país.
+        order_by (Optional[Literal["state_name", "city_name"]]): Coluna para ordenação.
+
+    Returns:
+        ExportCity: Uma instância do caso de uso `ExportCity`.
+
+    Raises:
+        HTTPException: Se o estado não existir.
+    """
+    if state is not None:
+        state = state.strip().upper()
+        if state not in {known.state for known in await location_db.list_states()}:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="State not found."
+            )
+    return ExportCity(
+        location_db_scope=location_db_scope, state=state, order_by=order_by
+    )
+
+
+def get_autocomplete_city(
+    location_catalog: LocationCatalogRepository,
+    q: str = Query(min_length=1),
+    state: Optional[str] = None,
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    """
+    Função de injeção de dependência para o caso de uso `AutocompleteCity`.
+
+    Args:
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+        q (str): O início do nome da cidade.
+        state (Optional[str]): A abreviação do estado. Se omitido, busca em todo o país.
+        limit (int): O número máximo de sugestões.
+
+    Returns:
+        AutocompleteCity: Uma instância do caso de uso `AutocompleteCity`.
+    """
+    return AutocompleteCity(
+        location_catalog=location_catalog, query=q, state=state, limit=limit
+    )
+
+
+def get_resolve_city(
+    location_catalog: LocationCatalogRepository,
+    q: str = Query(min_length=1),
+    limit: int = Query(default=5, ge=1, le=20),
+):
+    """
+    Função de injeção de dependência para o caso de uso `ResolveCity`.
+
+    Args:
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+        q (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+        limit (int): O número máximo de candidatos.
+
+    Returns:
+        ResolveCity: Uma instância do caso de uso `ResolveCity`.
+    """
+    return ResolveCity(location_catalog=location_catalog, query=q, limit=limit)
+
+
+async def _resolve_city(
+    location_catalog: LocationCatalogRepository, city_name: str
+) -> list[Location]:
+    """
+    Resolve o nome de uma cidade no catálogo em memória.
+
+    Retorna os candidatos empatados com a maior pontuação: mais de um indica
+    cidades homônimas, de estados diferentes, que só são desambiguadas pela sigla
+    do estado ao final do nome.
+
+    Args:
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+        city_name (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+
+    Returns:
+        list[Location]: Os candidatos mais prováveis, ou uma lista vazia se nenhuma
+        cidade corresponder ao nome.
+    """
+    matches = await location_catalog.resolve(city_name)
+    return [match.location for match in matches if match.score == matches[0].score]
+
+
+async def get_search_weather(
+    city_name: str,
+    location_catalog: LocationCatalogRepository,
+    location_db_scope: LocationDbRepositoryScope,
+    coordinate_provider: CoordinateProvider,
+    weather_provider: WeatherProvider,
+):
+    """
+    Função de injeção de dependência para o caso de uso `SearchWeather`.
+
+    O nome da cidade é resolvido no catálogo em memória, e o candidato mais
+    provável é usado na consulta do clima. Se houver mais de um, o nome deve
+    ser repetido com a sigla do estado de um dos candidatos.
+
+    Args:
+        city_name (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+        location_db_scope (LocationDbRepositoryScope): A fábrica de repositórios de localização injetada.
+        coordinate_provider (CoordinateProvider): O provedor de coordenadas injetado.
+        weather_provider (WeatherProvider): O provedor de clima injetado.
+
+    Returns:
+        SearchWeather: Uma instância do caso de uso `SearchWeather`.
+
+    Raises:
+        HTTPException: 404, se nenhuma cidade corresponder ao nome informado, ou 409,
+            com os candidatos, se o nome corresponder a cidades homônimas.
+    """
+    candidates = await _resolve_city(location_catalog, city_name)
+    if not candidates:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=CITY_NOT_FOUND
+        )
+    if len(candidates) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": CITY_AMBIGUOUS,
+                "candidates": [
+                    candidate.model_dump(
+                        by_alias=True, include={"city_name", "state", "state_name"}
+                    )
+                    for candidate in candidates
+                ],
+            },
+        )
+    return SearchWeather(
+        location=candidates[0],
+        get_coordinates=partial(
+            GetCoordinates,
+            location_db_scope=location_db_scope,
+            coordinate_provider=coordinate_provider,
+            location_catalog=location_catalog,
+        ),
+        weather_provider=weather_provider,
+    )
+
+
+async def get_resolved_cities(
+    cities: Annotated[
+        list[str],
+        Body(embed=True, min_length=1, max_length=config.WEATHER_BATCH_MAX_CITIES),
+    ],
+    location_catalog: LocationCatalogRepository,
+) -> list[tuple[str, Optional[Location], Optional[str]]]:
+    """
+    Função de injeção de dependência que resolve os nomes de várias cidades.
+
+    Cada nome é resolvido no catálogo em memória, como em `get_search_weather`.
+
+    Args:
+        cities (list[str]): Os nomes das cidades, com até `WEATHER_BATCH_MAX_CITIES` itens.
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+
+    Returns:
+        list[tuple[str, Optional[Location], Optional[str]]]: Cada nome, na ordem da
+        requisição, a cidade resolvida e, se nenhuma ou mais de uma cidade
+        corresponder ao nome, `None` e o erro no lugar da cidade.
+    """
+    resolved = []
+    for city_name in cities:
+        candidates = await _resolve_city(location_catalog, city_name)
+        if len(candidates) == 1:
+            resolved.append((city_name, candidates[0], None))
+        else:
+            error = CITY_AMBIGUOUS if candidates else CITY_NOT_FOUND
+            resolved.append((city_name, None, error))
+    return resolved
+
+
+def get_search_weather_batch(
+    location_catalog: LocationCatalogRepository,
+    location_db_scope: LocationDbRepositoryScope,
+    coordinate_provider: CoordinateProvider,
+    weather_provider: WeatherProvider,
+):
+    """
+    Função de injeção de dependência para o caso de uso `SearchWeatherBatch`.
+
+    Retorna uma fábrica do caso de uso, pois as cidades a serem consultadas só
+    são conhecidas pela rota depois de descartadas as que já estão em cache.
+
+    Args:
+        location_catalog (LocationCatalogRepository): O catálogo de localizações injetado.
+        location_db_scope (LocationDbRepositoryScope): A fábrica de repositórios de localização injetada.
+        coordinate_provider (CoordinateProvider): O provedor de coordenadas injetado.
+        weather_provider (WeatherProvider): O provedor de clima injetado.
+
+    Returns:
+        Callable[[list[Location]], SearchWeatherBatch]: A fábrica do caso de uso, que
+        recebe as cidades já resolvidas.
+    """
+    return partial(
+        SearchWeatherBatch,
+        get_coordinates=partial(
+            GetCoordinates,
+            location_db_scope=location_db_scope,
+            coordinate_provider=coordinate_provider,
+            location_catalog=location_catalog,
+        ),
+        weather_provider=weather_provider,
+        max_concurrency=config.WEATHER_BATCH_CONCURRENCY,
     )
 
 
@@ -91,3 +341,66 @@ Type alias para injeção do caso de uso de busca de cidades.
 Quando injetado em um endpoint, o FastAPI resolve a dependência
 chamando `get_search_city`.
 """
+
+
+ExportCityUseCase = Annotated[
+    IUseCase[AsyncGenerator[bytes, None]], Depends(get_export_city)
+]
+"""
+Type alias para injeção do caso de uso de exportação de cidades.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_export_city`.
+"""
+
+
+AutocompleteCityUseCase = Annotated[
+    IUseCase[list[Location]], Depends(get_autocomplete_city)
+]
+"""
+Type alias para injeção do caso de uso de autocompletar cidades.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_autocomplete_city`.
+"""
+
+
+ResolveCityUseCase = Annotated[IUseCase[list[LocationMatch]], Depends(get_resolve_city)]
+"""
+Type alias para injeção do caso de uso de resolução de nomes de cidades.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_resolve_city`.
+"""
+
+
+SearchWeatherUseCase = Annotated[IUseCase[Weather], Depends(get_search_weather)]
+"""
+Type alias para injeção do caso de uso de busca do clima atual.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_search_weather`.
+"""
+
+
+ResolvedCities = Annotated[
+    list[tuple[str, Optional[Location], Optional[str]]], Depends(get_resolved_cities)
+]
+"""
+Type alias para injeção dos nomes das cidades resolvidos no catálogo.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_resolved_cities`.
+"""
+
+
+SearchWeatherBatchUseCase = Annotated[
+    Callable[[list[Location]], IUseCase[list[Optional[Weather]]]],
+    Depends(get_search_weather_batch),
+]
+"""
+Type alias para injeção da fábrica do caso de uso de busca do clima de várias cidades.
+
+Quando injetado em um endpoint, o FastAPI resolve a dependência
+chamando `get_search_weather_batch`.
+"""
@@ -0,0 +1,305 @@
+"""
+Módulo da limitação de taxa local, com sincronização periódica entre os processos.
+
+O `RateLimiter` do `fastapi_limiter` executa um script no Redis a cada
+requisição, antes de qualquer outro processamento. Aqui, cada processo decide
+localmente, com um balde de fichas (token bucket) por cliente, e acumula as
+requisições admitidas. Periodicamente, as contagens de todas as rotas são
+somadas no Redis, em uma única chamada, e os clientes que ultrapassaram o limite
+somando todos os processos passam a ser bloqueados localmente até o fim da
+janela. O limite entre os processos é, portanto, aproximado: um cliente pode
+exceder o limite enquanto as contagens ainda não foram sincronizadas.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import Counter
+from math import ceil
+from typing import Callable, ClassVar, NamedTuple, Optional, Union
+
+from fastapi_limiter import default_identifier, http_default_callback
+from fastapi_limiter.depends import RateLimiter
+from loguru import logger
+from redis.asyncio import Redis
+from starlette.requests import Request
+from starlette.responses import Response
+
+from tempotech.core import config
+
+
+class _Bucket(NamedTuple):
+    """
+    Balde de fichas de um cliente.
+    """
+
+    tokens: float
+    updated_at: float
+
+
+class LocalRateLimiter:
+    """
+    Dependência de limitação de taxa avaliada no próprio processo.
+
+    Responde da mesma forma que o `RateLimiter` do `fastapi_limiter`: o cliente é
+    identificado pelo IP e pelo caminho da requisição e, ao exceder o limite,
+    recebe `429 Too Many Requests` com o cabeçalho `Retry-After`. Assim como `FillLock`, a conexão com o Redis é
+    configurada no nível da classe, em `init`; enquanto não for inicializada, o
+    limite é aplicado apenas dentro do processo.
+    """
+
+    _redis: ClassVar[Optional[Redis]] = None
+    _prefix: ClassVar[str] = "local-limiter"
+    _task: ClassVar[Optional[asyncio.Task]] = None
+    _instances: ClassVar[weakref.WeakSet] = weakref.WeakSet()
+
+    _SYNC_SCRIPT = """
+local totals = {}
+for i, key in ipairs(KEYS) do
+    totals[i] = redis.call("incrby", key, ARGV[2 * i - 1])
+    redis.call("pexpire", key, ARGV[2 * i])
+end
+return totals
+"""
+    """
+    Script Lua que soma as contagens de vários clientes e retorna os totais, em uma única chamada.
+    """
+
+    def __init__(
+        self,
+        times: int,
+        seconds: float,
+        identifier: Optional[Callable] = None,
+        callback: Optional[Callable] = None,
+    ):
+        """
+        Inicializa o limite de uma rota.
+
+        Args:
+            times (int): Quantidade de requisições admitidas por janela, no mínimo 1.
+            seconds (float): Duração da janela, em segundos.
+            identifier (Optional[Callable]): Função que identifica o cliente. Se omitida,
+                utiliza a mesma identificação do `fastapi_limiter`.
+            callback (Optional[Callable]): Função chamada quando o limite é excedido. Se
+                omitida, responde com `429 Too Many Requests`.
+
+        Raises:
+            ValueError: Se `times` for menor que 1 ou a janela for menor que 1 milissegundo.
+        """
+        if times < 1 or int(seconds * 1000) <= 0:
+            raise ValueError(
+                f"Rate limit needs times >= 1 and a window of at least 1 ms, "
+                f"got times={times}, seconds={seconds}"
+            )
+        self.times = times
+        self.milliseconds = int(seconds * 1000)
+        self.identifier = identifier or default_identifier
+        self.callback = callback or http_default_callback
+        self._buckets: dict[str, _Bucket] = {}
+        self._blocked: dict[str, float] = {}
+        self._pending: Counter[str] = Counter()
+        self._instances.add(self)
+
+    @property
+    def rate(self) -> float:
+        """
+        Retorna a taxa de reabastecimento do balde, em fichas por segundo.
+        """
+        return self.times * 1000 / self.milliseconds
+
+    @classmethod
+    async def init(
+        cls,
+        redis: Redis,
+        prefix: str = "local-limiter",
+        sync_interval: float = 0.25,
+    ) -> None:
+        """
+        Configura a conexão com o Redis e inicia a sincronização periódica das contagens.
+
+        Args:
+            redis (Redis): O cliente Redis compartilhado pela aplicação.
+            prefix (str): O prefixo das chaves das contagens.
+            sync_interval (float): Intervalo, em segundos, entre as sincronizações.
+        """
+        cls._redis = redis
+        cls._prefix = prefix
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run(sync_interval))
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Sincroniza as contagens pendentes, encerra a sincronização e descarta a conexão.
+        """
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        try:
+            await cls.sync()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Rate limit sync failed: {e!r}")
+        cls._redis = None
+
+    @classmethod
+    async def _run(cls, sync_interval: float) -> None:
+        """
+        Sincroniza as contagens a cada `sync_interval` segundos.
+
+        Args:
+            sync_interval (float): Intervalo, em segundos, entre as sincronizações.
+        """
+        while True:
+            await asyncio.sleep(sync_interval)
+            try:
+                await cls.sync()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Rate limit sync failed: {e!r}")
+
+    @classmethod
+    async def sync(cls) -> None:
+        """
+        Soma no Redis as requisições admitidas desde a última sincronização.
+
+        As contagens de todas as rotas são enviadas em uma única chamada. Os clientes
+        cujo total na janela atual, somando todos os processos, atingiu o limite são
+        bloqueados localmente até o fim da janela. Se a chamada falhar, as contagens
+        são descartadas, e o limite continua sendo aplicado dentro do processo.
+        """
+        now, now_ms = time.monotonic(), int(time.time() * 1000)
+        batch = [
+            (limiter, identifier, count)
+            for limiter in list(cls._instances)
+            for identifier, count in limiter.drain(now).items()
+        ]
+        if cls._redis is None or not batch:
+            return
+        keys = [
+            f"{cls._prefix}:{limiter.milliseconds}:{identifier}:"
+            f"{now_ms // limiter.milliseconds}"
+            for limiter, identifier, _ in batch
+        ]
+        args = [
+            arg for limiter, _, count in batch for arg in (count, limiter.milliseconds)
+        ]
+        totals = await cls._redis.eval(cls._SYNC_SCRIPT, len(keys), *keys, *args)
+        for (limiter, identifier, _), total in zip(batch, totals):
+            if int(total) >= limiter.times:
+                limiter.block(identifier, now, now_ms)
+
+    def drain(self, now: float) -> Counter[str]:
+        """
+        Retorna e zera as requisições admitidas desde a última sincronização.
+
+        Descarta também os baldes já reabastecidos e os bloqueios expirados.
+
+        Args:
+            now (float): O instante atual, de `time.monotonic`.
+
+        Returns:
+            Counter[str]: As requisições admitidas, por cliente.
+        """
+        for identifier in [
+            identifier
+            for identifier in self._buckets
+            if self._tokens(identifier, now) >= self.times
+        ]:
+            del self._buckets[identifier]
+        for identifier in [
+            identifier
+            for identifier, blocked_until in self._blocked.items()
+            if blocked_until <= now
+        ]:
+            del self._blocked[identifier]
+        pending, self._pending = self._pending, Counter()
+        return pending
+
+    def block(self, identifier: str, now: float, now_ms: int) -> None:
+        """
+        Bloqueia um cliente até o fim da janela atual.
+
+        Args:
+            identifier (str): O cliente.
+            now (float): O instante atual, de `time.monotonic`.
+            now_ms (int): O instante atual, em milissegundos desde a época, que
+                define a janela compartilhada entre os processos.
+        """
+        blocked_until = now + (self.milliseconds - now_ms % self.milliseconds) / 1000
+        self._blocked[identifier] = max(self._blocked.get(identifier, 0), blocked_until)
+
+    async def __call__(self, request: Request, response: Response):
+        """
+        Admite a requisição ou responde que o cliente excedeu o limite.
+
+        Args:
+            request (Request): A requisição.
+            response (Response): A resposta da rota.
+        """
+        identifier = await self.identifier(request)
+        now = time.monotonic()
+        blocked_until = self._blocked.get(identifier)
+        if blocked_until is not None:
+            if now < blocked_until:
+                return await self.callback(
+                    request, response, ceil((blocked_until - now) * 1000)
+                )
+            del self._blocked[identifier]
+        tokens = self._tokens(identifier, now)
+        if tokens < 1:
+            return await self.callback(
+                request, response, ceil((1 - tokens) / self.rate * 1000)
+            )
+        self._buckets[identifier] = _Bucket(tokens - 1, now)
+        if self._redis is not None:
+            self._pending[identifier] += 1
+
+    def _tokens(self, identifier: str, now: float) -> float:
+        """
+        Calcula as fichas disponíveis de um cliente, reabastecidas desde o último uso.
+
+        Args:
+            identifier (str): O cliente.
+            now (float): O instante atual, de `time.monotonic`.
+
+        Returns:
+            float: As fichas disponíveis, no máximo `times`.
+        """
+        bucket = self._buckets.get(identifier)
+        if bucket is None:
+            return self.times
+        return min(self.times, bucket.tokens + (now - bucket.updated_at) * self.rate)
+
+
+def rate_limiter(
+    times: int, seconds: int, local: Optional[bool] = None
+) -> Union[LocalRateLimiter, RateLimiter]:
+    """
+    Cria a dependência de limitação de taxa de uma rota.
+
+    Exemplo: `dependencies=[Depends(rate_limiter(times=1, seconds=10))]`.
+
+    Args:
+        times (int): Quantidade de requisições admitidas por janela.
+        seconds (int): Duração da janela, em segundos.
+        local (Optional[bool]): Se o limite é avaliado no processo (`LocalRateLimiter`)
+            ou no Redis, a cada requisição (`RateLimiter`). Se omitido, utiliza
+            `RATE_LIMIT_LOCAL_ENABLED`.
+
+    Returns:
+        Union[LocalRateLimiter, RateLimiter]: A dependência a ser informada em `Depends`.
+
+    Raises:
+        ValueError: Se `times` ou `seconds` não forem positivos.
+    """
+    if times < 1 or seconds <= 0:
+        raise ValueError(
+            f"Rate limit needs positive times and seconds, "
+            f"got times={times}, seconds={seconds}"
+        )
+    if config.RATE_LIMIT_LOCAL_ENABLED if local is None else local:
+        return LocalRateLimiter(times=times, seconds=seconds)
+    return RateLimiter(times=times, seconds=seconds)
@@ -13,19 +13,34 @@ from typing import AsyncIterator
 import uvicorn
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
+from fastapi_cache.backends import Backend
 from fastapi_cache.backends.redis import RedisBackend
 from fastapi_limiter import FastAPILimiter
+from loguru import logger
 from redis import asyncio as aioredis
-
+from redis.asyncio import Redis
+
+from tempotech.api.cache import refresh_ahead
+from tempotech.api.cache.backend import LocalCacheSettings, TwoTierBackend
+from tempotech.api.cache.coder import CompactCoder
+from tempotech.api.cache.lock import FillLock
+from tempotech.api.limiter import LocalRateLimiter
+from tempotech.api.responses import FastJSONResponse
 from tempotech.api.router import location_router, weather_router
 from tempotech.core import config
+from tempotech.core.database.repository.memory import (
+    location_catalog,
+    location_snapshot,
+)
 from tempotech.core.database.repository.postgres.connection_repository import (
+    ConnectionRepository,
     ConnectionRepositoryV2,
 )
 from tempotech.core.database.repository.postgres.location_repository import (
     LocationRepository,
 )
-from tempotech.core.providers import coutry_provider
+from tempotech.core.providers import coordinate_provider, coutry_provider, http_client
+from tempotech.core.use_case.backfill_coordinates_use_case import BackfillCoordinates
 from tempotech.core.use_case.create_location_use_case import CreateLocationUseCase
 
 API_VERSION = "v1"
@@ -35,14 +50,109 @@ async def setup_db():
     """
     Inicializa o banco de dados e popula com dados iniciais.
 
-    Esta função se conecta ao banco de dados, cria todas as tabelas e, em seguida,
-    executa o caso de uso `CreateLocationUseCase` para buscar e persistir os
-    estados e cidades de um provedor externo, como o IBGE.
+    Esta função obtém uma sessão do pool compartilhado e, em seguida, executa
+    o caso de uso `CreateLocationUseCase` para buscar e persistir os
+    estados e cidades de um provedor externo, como o IBGE. Ao final, carrega o
+    catálogo de localizações em memória, do qual dependem a busca do clima e a
+    resolução de nomes de cidades, pré-serializa as listagens completas de estados
+    e cidades e geocodifica as cidades ainda sem coordenadas, se habilitados,
+    remontando as listagens com as coordenadas obtidas.
     """
     async with ConnectionRepositoryV2.connect() as session:
+        location_db = LocationRepository(session)
         await CreateLocationUseCase(
-            location_db=LocationRepository(session), location_provider=coutry_provider
+            location_db=location_db,
+            location_provider=coutry_provider,
+            max_concurrency=config.SEED_MAX_CONCURRENCY,
+            max_retries=config.SEED_MAX_RETRIES,
         ).execute()
+        await location_catalog.load(location_db)
+        await load_snapshot()
+        if config.COORDINATES_BACKFILL_ENABLED and config.OPEN_WEATHER_API_KEY:
+            await BackfillCoordinates(
+                location_db=location_db,
+                coordinate_provider=coordinate_provider,
+                location_catalog=location_catalog,
+                max_concurrency=config.COORDINATES_BACKFILL_CONCURRENCY,
+            ).execute()
+            await load_snapshot()
+
+
+async def load_snapshot():
+    """
+    Monta as listagens pré-serializadas de estados e cidades, se habilitadas.
+
+    As listagens são montadas a partir do catálogo, de forma que as coordenadas
+    gravadas depois no catálogo também as remontam.
+    """
+    if config.LOCATION_SNAPSHOT_ENABLED:
+        await location_snapshot.load(location_catalog, country=coutry_provider.country)
+
+
+def log_setup_failure(task: asyncio.Task):
+    """
+    Registra a falha da carga inicial do banco de dados, executada em segundo plano.
+
+    Sem a carga, o catálogo de localizações não é montado, e as rotas que dependem
+    dele respondem com o status 503 até a aplicação ser reiniciada.
+
+    Args:
+        task (asyncio.Task): A tarefa de `setup_db`, já concluída.
+    """
+    if not task.cancelled() and task.exception() is not None:
+        logger.opt(exception=task.exception()).error(
+            "Database setup failed; location routes will stay unavailable"
+        )
+
+
+async def start_redis_services(redis: Redis, cache_redis: Redis) -> Backend:
+    """
+    Inicializa os serviços da aplicação que dependem do Redis.
+
+    Configura a limitação de taxa, o cache das respostas, precedido do cache local
+    em memória se habilitado, a trava de preenchimento do cache e a atualização
+    antecipada do cache, se habilitada.
+
+    Args:
+        redis (Redis): A conexão que trafega texto, compartilhada pelos serviços.
+        cache_redis (Redis): A conexão que trafega as respostas do cache em formato binário.
+
+    Returns:
+        Backend: O backend configurado no `FastAPICache`.
+    """
+    await FastAPILimiter.init(redis)
+    await LocalRateLimiter.init(redis, sync_interval=config.RATE_LIMIT_SYNC_INTERVAL)
+    cache_backend = RedisBackend(cache_redis)
+    if config.CACHE_LOCAL_ENABLED:
+        cache_backend = TwoTierBackend(
+            cache_backend,
+            redis,
+            LocalCacheSettings(
+                max_bytes=config.CACHE_LOCAL_MAX_BYTES,
+                max_ttl=config.CACHE_LOCAL_MAX_TTL,
+            ),
+        )
+        await cache_backend.start()
+    FastAPICache.init(cache_backend, prefix="fastapi-cache", coder=CompactCoder)
+    await FillLock.init(redis)
+    if config.REFRESH_AHEAD_ENABLED:
+        await refresh_ahead.start()
+    return cache_backend
+
+
+async def stop_redis_services(cache_backend: Backend):
+    """
+    Encerra os serviços iniciados por `start_redis_services`, na ordem inversa.
+
+    Args:
+        cache_backend (Backend): O backend configurado no `FastAPICache`.
+    """
+    await refresh_ahead.close()
+    await FillLock.close()
+    if isinstance(cache_backend, TwoTierBackend):
+        await cache_backend.close()
+    await LocalRateLimiter.close()
+    await FastAPILimiter.close()
 
 
 @asynccontextmanager
@@ -51,10 +161,18 @@ async def lifesplan(app: FastAPI) -> AsyncIterator[None]:
     Gerenciador de ciclo de vida da aplicação FastAPI.
 
     Lida com os eventos de inicialização (startup) e desligamento (shutdown) da aplicação.
-    - Na inicialização, cria uma tarefa em segundo plano para popular o banco de dados.
-    - Conecta-se ao Redis para configurar o cache (`FastAPICache`) e a limitação de taxa
-      (`FastAPILimiter`).
-    - No desligamento, garante que as conexões sejam fechadas corretamente.
+    - Na inicialização, cria o motor do banco de dados com pool de conexões e o cliente
+      HTTP dos provedores, compartilhados por todas as requisições, e uma tarefa em
+      segundo plano para popular o banco de dados.
+    - Conecta-se ao Redis para configurar o cache (`FastAPICache`), com uma conexão própria
+      que trafega as respostas em formato binário (`CompactCoder`), precedido de um cache
+      local em memória (`TwoTierBackend`), a trava de preenchimento do cache (`FillLock`),
+      compartilhada entre os processos, e a limitação de taxa (`FastAPILimiter` e, avaliada
+      em cada processo e sincronizada periodicamente, `LocalRateLimiter`), e inicia a
+      atualização antecipada do cache das cidades mais consultadas (`refresh_ahead`).
+    - No desligamento, cancela a tarefa de carga do banco de dados e aguarda o seu
+      término antes de fechar as conexões, incluindo as do Redis, o pool de conexões
+      do banco de dados e o cliente HTTP dos provedores.
 
     Args:
         app (FastAPI): A instância da aplicação FastAPI.
@@ -63,7 +181,10 @@ async def lifesplan(app: FastAPI) -> AsyncIterator[None]:
         AsyncIterator[None]: Cede o controle para a aplicação, que irá rodar
         enquanto o contexto estiver ativo.
     """
+    await ConnectionRepository.init()
+    await http_client.start()
     task = asyncio.create_task(setup_db())
+    task.add_done_callback(log_setup_failure)
     app.state.background_task = task
 
     redis = await aioredis.from_url(
@@ -71,13 +192,21 @@ async def lifesplan(app: FastAPI) -> AsyncIterator[None]:
         encoding="utf-8",
         decode_responses=True,
     )
-    await FastAPILimiter.init(redis)
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    cache_redis = await aioredis.from_url(
+        f"redis://{config.REDIS_HOST}:{config.REDIS_PORT}"
+    )
+    cache_backend = await start_redis_services(redis, cache_redis)
     yield
-    await FastAPILimiter.close()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await stop_redis_services(cache_backend)
+    await cache_redis.close()
+    await redis.close()
+    await http_client.close()
+    await ConnectionRepository.close()
 
 
-app = FastAPI(lifespan=lifesplan)
+app = FastAPI(lifespan=lifesplan, default_response_class=FastJSONResponse)
 """
 Instância principal da aplicação FastAPI.
 
@@ -0,0 +1,97 @@
+"""
+Módulo das classes de resposta da API.
+
+Define a resposta JSON padrão da aplicação, que serializa os modelos
+diretamente pelo Pydantic e os demais valores pelo `orjson`, quando instalado,
+sem a conversão intermediária do `jsonable_encoder`, e a validação do cabeçalho
+`If-None-Match` das respostas com `ETag`.
+"""
+
+import hashlib
+from typing import Any, Union
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from tempotech.core.utils.fast_json import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Resposta JSON compacta, usada como classe de resposta padrão da aplicação.
+
+    Quando uma rota retorna a própria resposta, com um modelo ou uma lista de
+    modelos já validados, o FastAPI não valida nem converte o conteúdo
+    novamente, e o modelo é serializado uma única vez, com os nomes de campos
+    da API.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serializa o conteúdo da resposta.
+
+        Args:
+            content (Any): Um modelo, uma lista de modelos ou um valor JSON, que é
+                convertido pelo `jsonable_encoder` apenas se não puder ser serializado
+                diretamente.
+
+        Returns:
+            bytes: O JSON compacto, em UTF-8.
+        """
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        if isinstance(content, list) and all(
+            isinstance(item, BaseModel) for item in content
+        ):
+            return (
+                b"["
+                + b",".join(
+                    item.model_dump_json(by_alias=True).encode() for item in content
+                )
+                + b"]"
+            )
+        try:
+            return dumps(content)
+        except TypeError:
+            return dumps(jsonable_encoder(content))
+
+
+def content_etag(content: Union[bytes, str]) -> str:
+    """
+    Calcula o `ETag` fraco de um conteúdo, a partir do seu digest SHA-256.
+
+    Ao contrário do `hash` do Python, o digest não depende do processo, de forma
+    que réplicas da aplicação atribuem o mesmo `ETag` ao mesmo conteúdo.
+
+    Args:
+        content (Union[bytes, str]): O conteúdo identificado.
+
+    Returns:
+        str: O `ETag`, entre aspas e com o prefixo `W/`.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    return f'W/"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Verifica se o cliente já possui a versão identificada pelo `ETag`.
+
+    O cabeçalho `If-None-Match` pode conter vários `ETag`, separados por
+    vírgulas, e é comparado de forma fraca, isto é, ignorando o prefixo `W/`.
+
+    Args:
+        request (Request): A requisição, da qual é lido o cabeçalho `If-None-Match`.
+        etag (str): O `ETag` da versão atual.
+
+    Returns:
+        bool: `True` se o cabeçalho contém o `ETag` ou `*`, `False` caso contrário.
+    """
+    tags = {
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    return "*" in tags or etag.removeprefix("W/") in tags
@@ -7,35 +7,125 @@ provedor de localização do IBGE e com o banco de dados interno para
 recuperar e gerenciar dados geográficos.
 """
 
-from fastapi import APIRouter, Depends
-from fastapi_cache.decorator import cache
-from fastapi_limiter.depends import RateLimiter
+import zlib
+from typing import AsyncGenerator, Optional
 
-from tempotech.api.deps.use_case import SearchCityUseCase, SearchStateUseCase
-from tempotech.core.schemas.location_schema import Location
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from tempotech.api.cache.decorator import cache
+from tempotech.api.cache.key_builder import (
+    Param,
+    arguments_key_builder,
+    canonical_key_builder,
+    normalize_int,
+    normalize_uf,
+)
+from tempotech.api.deps.database import LocationSnapshotRepository
+from tempotech.api.deps.use_case import (
+    AutocompleteCityUseCase,
+    ExportCityUseCase,
+    ResolveCityUseCase,
+    SearchCityUseCase,
+    SearchStateUseCase,
+)
+from tempotech.api.limiter import rate_limiter
+from tempotech.api.responses import FastJSONResponse, etag_matches
+from tempotech.core.database.repository.memory.location_snapshot import Snapshot
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.schemas.location_schema import Location, LocationMatch
 from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.utils.text import fold_text
 
-router = APIRouter(tags=["Location"])
+router = APIRouter(tags=["Location"], default_response_class=FastJSONResponse)
 
 
-@router.get("/state", dependencies=[Depends(RateLimiter(times=1, seconds=10))])
-@cache(expire=600)
-async def get_states(use_case: SearchStateUseCase) -> list[Location]:
+def _snapshot_response(snapshot: Snapshot, request: Request) -> Response:
+    """
+    Responde com uma listagem pré-serializada, sem serializar nenhum objeto.
+
+    O documento é enviado comprimido se o cliente aceitar `gzip`, e cada versão,
+    comprimida ou não, possui o seu próprio `ETag`. Se o cliente já possuir a versão
+    solicitada (`If-None-Match`), a resposta é `304 Not Modified`, sem corpo.
+
+    Args:
+        snapshot (Snapshot): A listagem pré-serializada.
+        request (Request): A requisição, da qual são lidos os cabeçalhos de cache e de compressão.
+
+    Returns:
+        Response: A resposta com o documento JSON.
+    """
+    compressed = "gzip" in request.headers.get("accept-encoding", "")
+    etag = snapshot.gzip_etag if compressed else snapshot.etag
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+        return Response(snapshot.gzip, media_type="application/json", headers=headers)
+    return Response(snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get("/state", dependencies=[Depends(rate_limiter(times=1, seconds=10))])
+async def get_states(
+    use_case: SearchStateUseCase,
+    snapshot: LocationSnapshotRepository,
+    request: Request,
+) -> list[Location]:
     """
     Retorna uma lista de todos os estados brasileiros.
 
-    Este endpoint busca os estados a partir da IBGE Provider. Para evitar sobrecarga no sistema,
-    ele é limitado a 1 requisição a cada 10 segundos por cliente.
-    O resultado da busca é armazenado em cache por 10 minutos para consultas subsequentes.
+    Este endpoint busca os estados a partir do banco de dados, populado com os dados da
+    IBGE Provider, que só é consultada enquanto o banco ainda não possui dados.
+    Para evitar sobrecarga no sistema, ele é limitado a 1 requisição a cada 10 segundos por cliente.
+    Após a carga inicial, a lista é servida já serializada e comprimida, com um `ETag` que permite
+    ao cliente revalidá-la e receber `304 Not Modified` enquanto ela não mudar. Antes disso, a lista
+    é armazenada em cache por 10 minutos.
 
     Returns:
         list[Location]: Uma lista de objetos Location, onde cada um representa um estado do Brasil.
     """
+    if snapshot.loaded:
+        return _snapshot_response(snapshot.states(), request)
+    return FastJSONResponse(await _search_states(use_case))
+
+
+@cache(expire=600, key_builder=arguments_key_builder())
+async def _search_states(use_case: IUseCase[list[Location]]) -> list[Location]:
+    """
+    Busca os estados enquanto as listagens pré-serializadas não foram montadas.
+
+    O resultado é armazenado em cache por 10 minutos, como a rota fazia antes das
+    listagens pré-serializadas.
+
+    Args:
+        use_case (IUseCase[list[Location]]): O caso de uso de busca dos estados.
+
+    Returns:
+        list[Location]: Os estados, decodificados do cache.
+    """
     return await use_case.execute()
 
 
-@router.get("/{state}/cities", dependencies=[Depends(RateLimiter(times=1, seconds=10))])
-@cache(expire=600)
+@router.get(
+    "/{state}/cities", dependencies=[Depends(rate_limiter(times=1, seconds=10))]
+)
+@cache(
+    expire=600,
+    key_builder=canonical_key_builder(
+        state=Param(normalize_uf),
+        order_by=Param(),
+        search_by=Param(),
+        search_value=Param(fold_text),
+        page=Param(normalize_int, default="1"),
+        page_size=Param(normalize_int, default="10"),
+        cursor=Param(),
+    ),
+)
 async def get_cities_from_state(use_case: SearchCityUseCase) -> Pagination[Location]:
     """
     Retorna uma lista paginada de todas as cidades de um estado específico.
@@ -43,6 +133,10 @@ async def get_cities_from_state(use_case: SearchCityUseCase) -> Pagination[Locat
     Este endpoint recupera as cidades de um estado usando a IBGE Provider. A
     resposta é paginada para facilitar o manuseio de grandes volumes de dados. A
     rota também possui um limite de 1 requisição a cada 10 segundos e cache de 10 minutos.
+    Além da paginação por número de página, é possível enviar o `nextCursor` da resposta
+    no parâmetro `cursor` para paginar por chave, sem o custo de `OFFSET` em páginas profundas.
+    A busca por nome de cidade (`search_value`) ignora maiúsculas e acentos, e as suas variações
+    compartilham o mesmo cache.
 
     Args:
         state (str): A abreviação do nome do estado (ex: "SC").
@@ -51,3 +145,137 @@ async def get_cities_from_state(use_case: SearchCityUseCase) -> Pagination[Locat
         Pagination[Location]: Um objeto paginado com a lista de cidades do estado.
     """
     return await use_case.execute()
+
+
+@router.get("/cities/all", dependencies=[Depends(rate_limiter(times=1, seconds=10))])
+async def get_all_cities(
+    snapshot: LocationSnapshotRepository, request: Request, state: Optional[str] = None
+) -> list[Location]:
+    """
+    Retorna todas as cidades de um estado, ou do país inteiro, em uma única resposta.
+
+    A listagem é montada e comprimida uma única vez, após a carga inicial, e servida sem
+    consultar o banco de dados nem serializar as cidades. A resposta possui um `ETag`
+    forte, próprio de cada codificação, e o cliente que já possuir a listagem recebe `304 Not Modified`. Enquanto a
+    listagem é montada, a rota responde com o status 503.
+
+    Args:
+        state (Optional[str]): A abreviação do estado (ex: "SC"). Se omitido, retorna todo o país.
+
+    Returns:
+        list[Location]: As cidades, em uma lista JSON.
+
+    Raises:
+        HTTPException: 503, enquanto a listagem é montada, ou 404, se o estado não existir.
+    """
+    if not snapshot.loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Location listings are still loading.",
+        )
+    cities = snapshot.cities(state)
+    if cities is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="State not found."
+        )
+    return _snapshot_response(cities, request)
+
+
+@router.get("/autocomplete")
+async def autocomplete_cities(use_case: AutocompleteCityUseCase) -> list[Location]:
+    """
+    Sugere cidades cujo nome começa com o texto informado.
+
+    A busca ignora maiúsculas e acentos (ex: "sao jo" encontra "São José") e é
+    respondida pelo catálogo de localizações em memória, sem acessar o banco de
+    dados ou o Redis. Por isso, a rota não possui cache nem limite de requisições.
+    Enquanto o catálogo é carregado, na inicialização da aplicação, a rota
+    responde com o status 503.
+
+    Args:
+        q (str): O início do nome da cidade.
+        state (Optional[str]): A abreviação do estado (ex: "SC"). Se omitido, busca em todo o país.
+        limit (int): O número máximo de sugestões, entre 1 e 50.
+
+    Returns:
+        list[Location]: As cidades encontradas, em ordem alfabética.
+    """
+    return FastJSONResponse(await use_case.execute())
+
+
+@router.get("/resolve")
+async def resolve_city(use_case: ResolveCityUseCase) -> list[LocationMatch]:
+    """
+    Resolve um nome de cidade digitado livremente para as cidades conhecidas.
+
+    O nome pode conter erros de digitação, omitir acentos e terminar com a sigla do
+    estado (ex: "sao jose sc", "Florianopolis/SC"). Os candidatos são ranqueados
+    pela similaridade com o nome pesquisado, de 0 a 1, e a pontuação 1 indica que o
+    nome coincide exatamente, ignorando maiúsculas e acentos. Assim como o
+    autocompletar, a rota é respondida pelo catálogo em memória e responde com o
+    status 503 enquanto ele é carregado.
+
+    Args:
+        q (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+        limit (int): O número máximo de candidatos, entre 1 e 20.
+
+    Returns:
+        list[LocationMatch]: Os candidatos, do mais para o menos provável.
+    """
+    return FastJSONResponse(await use_case.execute())
+
+
+async def _gzip_stream(
+    chunks: AsyncGenerator[bytes, None],
+) -> AsyncGenerator[bytes, None]:
+    """
+    Comprime, de forma incremental, um fluxo de bytes no formato gzip.
+
+    Args:
+        chunks (AsyncGenerator[bytes, None]): O fluxo de bytes original.
+
+    Returns:
+        AsyncGenerator[bytes, None]: O fluxo de bytes comprimido.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get(
+    "/cities/export",
+    dependencies=[Depends(rate_limiter(times=1, seconds=10))],
+    response_class=StreamingResponse,
+)
+async def export_cities(use_case: ExportCityUseCase, request: Request):
+    """
+    Exporta todas as cidades de um estado, ou do país inteiro, em NDJSON.
+
+    Cada linha do corpo é um objeto `Location` em JSON. O conteúdo é lido do banco
+    de dados com um cursor no servidor e enviado de forma incremental, com consumo
+    de memória constante. Se o cliente aceitar `gzip` (`Accept-Encoding`), a resposta
+    é comprimida durante o envio. A rota substitui a paginação de todas as páginas de
+    `/{state}/cities` por uma única transferência, e possui o mesmo limite de 1
+    requisição a cada 10 segundos.
+
+    Args:
+        state (Optional[str]): A abreviação do estado (ex: "SC" ou "sc"). Se omitido, exporta todo o país.
+        order_by (Optional[Literal["state_name", "city_name"]]): Coluna para ordenação.
+
+    Returns:
+        StreamingResponse: A resposta em streaming no formato `application/x-ndjson`.
+
+    Raises:
+        HTTPException: 404, se o estado não existir.
+    """
+    content = await use_case.execute()
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        content = _gzip_stream(content)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        content, media_type="application/x-ndjson", headers=headers
+    )
@@ -2,34 +2,97 @@
 Módulo de roteamento para os endpoints relacionados ao clima.
 
 Este módulo define as rotas para recuperar dados de clima atuais e históricos.
-Conforme as justificativas de design do projeto, a implementação completa
-destes endpoints está pendente, focando primeiramente na camada de localização para
-garantir a precisão dos dados geográficos. As rotas aqui definidas
-incluem mecanismos de cache para otimizar o desempenho futuro.
+O nome da cidade é resolvido para um registro conhecido no catálogo de
+localizações, o que resolve a ambiguidade apontada nas justificativas de design
+do projeto. O histórico de consultas ainda está pendente. As rotas aqui
+definidas incluem mecanismos de cache para otimizar o desempenho.
 """
 
-from typing import Optional
+from typing import Mapping, Optional
 
-from fastapi import APIRouter, Request
-from fastapi_cache.decorator import cache
+from fastapi import APIRouter, Depends, Request
+from starlette.responses import Response
 
+from tempotech.api.cache import refresh_ahead
+from tempotech.api.cache.batch import get_many, set_many
+from tempotech.api.cache.coder import CompactCoder
+from tempotech.api.cache.decorator import Revalidation, cache
+from tempotech.api.cache.key_builder import (
+    Param,
+    arguments_key_builder,
+    canonical_key,
+    canonical_key_builder,
+    normalize_uf,
+)
+from tempotech.api.deps.use_case import (
+    ResolvedCities,
+    SearchWeatherBatchUseCase,
+    SearchWeatherUseCase,
+)
+from tempotech.api.limiter import rate_limiter
+from tempotech.api.responses import FastJSONResponse
+from tempotech.core import config
+from tempotech.core.schemas.location_schema import Location
 from tempotech.core.schemas.pagination_schema import Pagination
-from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.schemas.weather_schema import Weather, WeatherBatchItem
+from tempotech.core.use_case.search_weather_batch_use_case import WEATHER_UNAVAILABLE
+from tempotech.core.utils.fast_json import dumps
+from tempotech.core.utils.text import normalize_text
 
-router = APIRouter(tags=["Weather"])
+router = APIRouter(tags=["Weather"], default_response_class=FastJSONResponse)
+
+_CURRENT_WEATHER_PARAMS = {"location_id": Param()}
+"""
+Parâmetros da chave de cache do clima atual, compartilhada com a consulta de várias cidades.
+
+A chave é composta pelo identificador da cidade resolvida, e não pelo nome informado,
+de forma que variações do nome, com erros de digitação ou sem acentos, compartilham o
+mesmo valor em cache.
+"""
+
+
+def _current_weather_key(location: Location) -> str:
+    """
+    Monta a chave de cache do clima atual de uma cidade resolvida.
+
+    Args:
+        location (Location): A cidade resolvida no catálogo de localizações.
+
+    Returns:
+        str: A chave do cache, a mesma gravada por `/current/{city_name}`.
+    """
+    return canonical_key(
+        get_current_weather, "", _CURRENT_WEATHER_PARAMS, {"location_id": location.id}
+    )
 
 
 @router.get("/current/{city_name}")
-@cache(expire=600)
-async def get_current_weather(city_name: str, request: Request) -> Weather:
+@cache(
+    expire=config.WEATHER_CACHE_EXPIRE,
+    revalidation=Revalidation(
+        stale_while_revalidate=config.WEATHER_STALE_WHILE_REVALIDATE,
+        refresh_ahead=refresh_ahead,
+    ),
+    key_builder=arguments_key_builder(
+        location_id=lambda kwargs: kwargs["use_case"].location.id
+    ),
+)
+async def get_current_weather(
+    city_name: str, use_case: SearchWeatherUseCase, request: Request
+) -> Weather:
     """
     Recupera as informações meteorológicas atuais para uma cidade específica.
 
     Este endpoint retorna dados de clima atualizados para a `city_name` fornecida. Para garantir alta performance e
-    reduzir a carga na API externa, ele utiliza um mecanismo de cache com validade de 10 minutos.
-    Além disso, as consultas são armazenadas para criar um histórico de buscas.
-    A implementação desta rota depende de um serviço de geocodificação confiável para
-    converter o nome da cidade em coordenadas geográficas precisas.
+    reduzir a carga na API externa, ele utiliza um mecanismo de cache com validade de 10 minutos. Após a
+    validade, o último clima continua sendo servido por um curto período enquanto é atualizado em segundo
+    plano, e os cabeçalhos `Age` e `Cache-Control` (`stale-while-revalidate`) indicam a sua idade. O clima
+    das cidades mais consultadas é atualizado no cache pouco antes de expirar.
+    O nome é resolvido no catálogo de localizações, tolerando erros de digitação e a ausência de acentos, e pode
+    terminar com a sigla do estado para desambiguar cidades homônimas (ex: "Bom Jesus SC"), exigida quando o nome
+    corresponde a mais de uma cidade. O campo `state` indica a sigla do estado da cidade resolvida. As coordenadas da
+    cidade são obtidas do provedor de geocodificação apenas na primeira consulta, e depois lidas do banco de dados.
+    O campo `timestampUtc` indica o momento, em UTC, em que o clima retornado foi medido.
 
     Args:
         city_name (str): O nome da cidade para a qual se deseja a previsão do tempo.
@@ -37,12 +100,108 @@ async def get_current_weather(city_name: str, request: Request) -> Weather:
 
     Returns:
         Weather: Um objeto contendo os dados de clima, como temperatura, umidade e velocidade do vento.
+
+    Raises:
+        HTTPException: 404, se nenhuma cidade corresponder ao nome informado, ou 409, com os
+            candidatos, se o nome corresponder a cidades homônimas de estados diferentes.
     """
-    pass
+    return await use_case.execute()
+
+
+@router.post(
+    "/current:batch",
+    response_model=list[WeatherBatchItem],
+    dependencies=[Depends(rate_limiter(times=1, seconds=10))],
+)
+async def get_current_weather_batch(
+    cities: ResolvedCities, use_case: SearchWeatherBatchUseCase
+) -> Response:
+    """
+    Recupera as informações meteorológicas atuais de várias cidades em uma única requisição.
+
+    Cada nome é resolvido como em `/current/{city_name}` e compartilha o mesmo cache: as cidades com clima
+    atual em cache são servidas diretamente, e as demais são consultadas de uma vez no provedor de clima,
+    que coalesce as cidades repetidas, e gravadas no cache para as próximas consultas, individuais ou não.
+    O resultado de cada cidade é retornado na ordem da requisição e, se o clima não pôde ser obtido,
+    contém o erro no lugar do clima, sem interromper as demais cidades. Os nomes de cidades homônimas
+    sem a sigla do estado também resultam em erro.
+
+    Args:
+        cities (list[tuple[str, Optional[Location], Optional[str]]]): Os nomes das cidades, com até
+            `WEATHER_BATCH_MAX_CITIES` itens, as cidades resolvidas a partir deles e o erro das
+            que não puderam ser resolvidas.
+
+    Returns:
+        list[WeatherBatchItem]: O resultado de cada cidade, com o clima ou o erro.
+    """
+    grace = config.WEATHER_STALE_WHILE_REVALIDATE
+    locations = {
+        location.id: location for _, location, _ in cities if location is not None
+    }
+    keys = {id_: _current_weather_key(location) for id_, location in locations.items()}
+    cached = dict(zip(keys, await get_many(list(keys.values()), grace)))
+    misses = [locations[id_] for id_, encoded in cached.items() if encoded is None]
+    if misses:
+        weathers = await use_case(misses).execute()
+        fetched = {
+            location.id: CompactCoder.encode(weather)
+            for location, weather in zip(misses, weathers)
+            if weather is not None
+        }
+        await set_many(
+            {keys[id_]: encoded for id_, encoded in fetched.items()},
+            config.WEATHER_CACHE_EXPIRE,
+            grace,
+        )
+        cached.update(fetched)
+    body = b",".join(_batch_item(city, cached) for city in cities)
+    return Response(content=b"[" + body + b"]", media_type=FastJSONResponse.media_type)
+
+
+def _batch_item(
+    city: tuple[str, Optional[Location], Optional[str]],
+    cached: Mapping[int, Optional[bytes]],
+) -> bytes:
+    """
+    Serializa o resultado de uma cidade da consulta de várias cidades.
+
+    O clima é inserido a partir do JSON gravado no cache, sem ser decodificado,
+    como nas respostas servidas pelo decorador `cache`.
+
+    Args:
+        city (tuple[str, Optional[Location], Optional[str]]): O nome da cidade informado
+            na requisição, a cidade resolvida, se houver, e o erro da resolução.
+        cached (Mapping[int, Optional[bytes]]): O clima codificado pelo `CompactCoder`,
+            pelo identificador da cidade, se disponível.
+
+    Returns:
+        bytes: O objeto JSON de um `WeatherBatchItem`.
+    """
+    query, location, error = city
+    if location is None:
+        weather = b"null"
+    elif cached.get(location.id) is None:
+        weather, error = b"null", WEATHER_UNAVAILABLE
+    else:
+        weather, error = CompactCoder.to_json(cached[location.id]), None
+    return (
+        b'{"query":'
+        + dumps(query)
+        + b',"weather":'
+        + weather
+        + b',"error":'
+        + dumps(error)
+        + b"}"
+    )
 
 
 @router.get("/history")
-@cache(expire=600)
+@cache(
+    expire=600,
+    key_builder=canonical_key_builder(
+        city_name=Param(normalize_text), state=Param(normalize_uf)
+    ),
+)
 async def get_history(
     city_name: Optional[str] = None, state: Optional[str] = None
 ) -> Pagination[Weather]:
@@ -6,6 +6,7 @@ centralizando todas as configurações essenciais para a aplicação.
 Isso inclui credenciais de banco de dados, chaves de API e configurações
 de serviços externos como Redis.
 """
+
 import os
 
 from dotenv import load_dotenv
@@ -59,8 +60,187 @@ DB_NAME = os.getenv("DB_NAME")
 """
 Nome do banco de dados.
 """
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+"""
+Quantidade de conexões mantidas abertas no pool do motor assíncrono do banco de dados.
+"""
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+"""
+Quantidade de conexões extras que o pool pode abrir temporariamente além de `DB_POOL_SIZE`.
+"""
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+"""
+Tempo máximo, em segundos, de espera por uma conexão livre no pool.
+"""
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+"""
+Tempo, em segundos, após o qual uma conexão do pool é descartada e reaberta.
+"""
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+"""
+Indica se as conexões do pool devem ser testadas antes de serem entregues a uma sessão.
+"""
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+"""
+Indica se o SQLAlchemy deve registrar no log todas as instruções SQL executadas.
+"""
 
 COUNTRY = "BR"
 """
 Código do país para o qual a aplicação está configurada, como 'BR' para Brasil.
-"""
\ No newline at end of file
+"""
+
+SEED_MAX_CONCURRENCY = int(os.getenv("SEED_MAX_CONCURRENCY", "5"))
+"""
+Quantidade máxima de estados processados simultaneamente durante a carga inicial de localizações.
+"""
+SEED_MAX_RETRIES = int(os.getenv("SEED_MAX_RETRIES", "3"))
+"""
+Quantidade máxima de tentativas por estado durante a carga inicial de localizações.
+"""
+
+IBGE_BULK_FETCH = os.getenv("IBGE_BULK_FETCH", "true").lower() == "true"
+"""
+Indica se o provedor do IBGE deve buscar todos os municípios do país em uma única requisição.
+"""
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+"""
+Quantidade máxima de conexões simultâneas do cliente HTTP compartilhado pelos provedores.
+"""
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+"""
+Quantidade máxima de conexões simultâneas do cliente HTTP para um mesmo host.
+"""
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+"""
+Tempo, em segundos, que uma conexão HTTP ociosa é mantida aberta para reutilização.
+"""
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+"""
+Tempo, em segundos, que as resoluções de DNS são mantidas em cache pelo cliente HTTP.
+"""
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+"""
+Tempo máximo, em segundos, para estabelecer uma conexão HTTP com um provedor.
+"""
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+"""
+Tempo máximo, em segundos, para concluir uma requisição HTTP a um provedor.
+"""
+
+LOCATION_SNAPSHOT_ENABLED = (
+    os.getenv("LOCATION_SNAPSHOT_ENABLED", "true").lower() == "true"
+)
+"""
+Indica se as listagens completas de estados e cidades devem ser pré-serializadas após a carga inicial.
+"""
+
+LOCATION_SNAPSHOT_REFRESH_DELAY = float(
+    os.getenv("LOCATION_SNAPSHOT_REFRESH_DELAY", "30")
+)
+"""
+Espera, em segundos, entre a primeira alteração do catálogo e a remontagem das listagens pré-serializadas.
+
+As alterações feitas durante a espera, como as coordenadas gravadas pela geocodificação
+em lote, são incluídas na mesma remontagem.
+"""
+
+COORDINATES_BACKFILL_ENABLED = (
+    os.getenv("COORDINATES_BACKFILL_ENABLED", "false").lower() == "true"
+)
+"""
+Indica se as cidades sem coordenadas devem ser geocodificadas após a carga inicial de localizações.
+"""
+COORDINATES_BACKFILL_CONCURRENCY = int(
+    os.getenv("COORDINATES_BACKFILL_CONCURRENCY", "5")
+)
+"""
+Quantidade máxima de chamadas simultâneas ao provedor de geocodificação durante o preenchimento das coordenadas.
+"""
+
+WEATHER_CACHE_EXPIRE = int(os.getenv("WEATHER_CACHE_EXPIRE", "600"))
+"""
+Tempo, em segundos, que o clima atual de uma cidade é mantido em cache e considerado atual.
+"""
+WEATHER_STALE_WHILE_REVALIDATE = int(os.getenv("WEATHER_STALE_WHILE_REVALIDATE", "120"))
+"""
+Tempo, em segundos, que o clima expirado de uma cidade continua sendo servido enquanto é atualizado em segundo plano.
+"""
+WEATHER_BATCH_CONCURRENCY = int(os.getenv("WEATHER_BATCH_CONCURRENCY", "10"))
+"""
+Quantidade máxima de requisições simultâneas aos provedores de clima e de coordenadas em uma consulta de várias cidades.
+"""
+WEATHER_BATCH_MAX_CITIES = int(os.getenv("WEATHER_BATCH_MAX_CITIES", "50"))
+"""
+Quantidade máxima de cidades aceitas em uma única consulta do clima de várias cidades.
+"""
+
+CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", "60"))
+"""
+Tempo, em segundos, que uma resposta expirada é mantida no cache para ser servida enquanto outro processo a recalcula.
+"""
+CACHE_LOCK_TTL = float(os.getenv("CACHE_LOCK_TTL", "10"))
+"""
+Tempo máximo, em segundos, que um processo mantém a trava de preenchimento de uma chave do cache.
+"""
+CACHE_LOCK_WAIT = float(os.getenv("CACHE_LOCK_WAIT", "2"))
+"""
+Tempo máximo, em segundos, que uma requisição aguarda o preenchimento de uma chave do cache por outro processo.
+"""
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))
+"""
+Tamanho mínimo, em bytes, a partir do qual as respostas são comprimidas antes de serem gravadas no cache.
+"""
+CACHE_COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", "6"))
+"""
+Nível de compressão das respostas gravadas no cache, de 1 (mais rápido) a 9 (menor).
+"""
+CACHE_LOCAL_ENABLED = os.getenv("CACHE_LOCAL_ENABLED", "true").lower() == "true"
+"""
+Indica se as respostas em cache devem ser mantidas também em memória, à frente do Redis.
+"""
+CACHE_LOCAL_MAX_BYTES = int(os.getenv("CACHE_LOCAL_MAX_BYTES", str(64 * 1024 * 1024)))
+"""
+Tamanho máximo, em bytes, das respostas mantidas no cache em memória de cada processo.
+"""
+CACHE_LOCAL_MAX_TTL = float(os.getenv("CACHE_LOCAL_MAX_TTL", "60"))
+"""
+Tempo máximo, em segundos, que uma resposta é mantida no cache em memória sem ser consultada no Redis.
+"""
+
+REFRESH_AHEAD_ENABLED = os.getenv("REFRESH_AHEAD_ENABLED", "true").lower() == "true"
+"""
+Indica se as cidades mais consultadas devem ter o clima atualizado no cache antes de expirar.
+"""
+REFRESH_AHEAD_TOP_N = int(os.getenv("REFRESH_AHEAD_TOP_N", "300"))
+"""
+Quantidade de cidades mais consultadas acompanhadas pela atualização antecipada do cache.
+"""
+REFRESH_AHEAD_LEAD = int(os.getenv("REFRESH_AHEAD_LEAD", "60"))
+"""
+Antecedência, em segundos, em relação à expiração, com que o clima de uma cidade é atualizado no cache.
+"""
+REFRESH_AHEAD_INTERVAL = float(os.getenv("REFRESH_AHEAD_INTERVAL", "15"))
+"""
+Intervalo, em segundos, entre os ciclos de atualização antecipada do cache.
+"""
+REFRESH_AHEAD_BUDGET = int(os.getenv("REFRESH_AHEAD_BUDGET", "60"))
+"""
+Quantidade máxima de chamadas ao provedor externo por ciclo de atualização antecipada do cache.
+"""
+REFRESH_AHEAD_CONCURRENCY = int(os.getenv("REFRESH_AHEAD_CONCURRENCY", "5"))
+"""
+Quantidade máxima de atualizações antecipadas do cache executadas simultaneamente.
+"""
+
+RATE_LIMIT_LOCAL_ENABLED = (
+    os.getenv("RATE_LIMIT_LOCAL_ENABLED", "true").lower() == "true"
+)
+"""
+Indica se a limitação de taxa das rotas deve ser avaliada em cada processo, sem consultar o Redis a cada requisição.
+"""
+RATE_LIMIT_SYNC_INTERVAL = float(os.getenv("RATE_LIMIT_SYNC_INTERVAL", "0.25"))
+"""
+Intervalo, em segundos, entre as sincronizações das contagens da limitação de taxa local no Redis.
+"""
@@ -9,6 +9,7 @@ coordenadas geográficas.
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -17,10 +18,17 @@ class LocationModel(SQLModel, table=True):
     Modelo de dados para a tabela "Location".
 
     Esta classe mapeia os dados de localização para a tabela correspondente
-    no banco de dados, facilitando a interação com o ORM.
+    no banco de dados, facilitando a interação com o ORM. Os índices seguem as
+    consultas de `LocationRepository`: busca de cidades por estado ordenada pelo
+    nome e busca de estados por país. O índice sem acentuação do nome da cidade
+    depende de uma extensão e é criado pelas migrações.
     """
 
     __tablename__ = "Location"
+    __table_args__ = (
+        Index("ix_location_state_city_name_id", "state", "city_name", "id"),
+        Index("ix_location_country_state_state_name", "country", "state", "state_name"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     city_name: Optional[str] = Field(alias="cityName")
@@ -0,0 +1,18 @@
+"""
+Módulo de inicialização dos repositórios em memória.
+
+Define as instâncias do catálogo de localizações e das listagens
+pré-serializadas compartilhadas pela aplicação. Ambos são carregados no ciclo
+de vida da aplicação, após a carga inicial do banco de dados, e consultados
+pelos endpoints de localização.
+"""
+
+from tempotech.core.database.repository.memory.location_catalog import (
+    LocationCatalog,
+)
+from tempotech.core.database.repository.memory.location_snapshot import (
+    LocationSnapshot,
+)
+
+location_catalog = LocationCatalog()
+location_snapshot = LocationSnapshot()
@@ -0,0 +1,458 @@
+"""
+Módulo do catálogo de localizações em memória.
+
+O conjunto de municípios é pequeno e praticamente imutável, por isso é
+carregado uma única vez a partir do banco de dados e mantido em memória, em
+estruturas compactas. Consultas por estado, o autocompletar por prefixo e a
+resolução aproximada de nomes são respondidos sem acessar o banco de dados ou
+o Redis.
+"""
+
+from bisect import bisect_left
+from typing import AsyncGenerator, Optional
+
+from tempotech.core.database.repository.memory.trigram_index import TrigramIndex
+from tempotech.core.interfaces.database_repository import (
+    ILocationCatalog,
+    ILocationRepository,
+)
+from tempotech.core.schemas.location_schema import Location, LocationMatch
+from tempotech.core.schemas.pagination_schema import Cursor, PageWindow
+from tempotech.core.utils.text import fold_text, normalize_text
+
+
+class _CatalogEntry:
+    """
+    Registro compacto de uma cidade do catálogo.
+
+    Guarda a localização, o nome normalizado usado no autocompletar e na
+    resolução de nomes, e o nome usado nos filtros de `search`.
+    """
+
+    __slots__ = ("location", "key", "folded")
+
+    def __init__(self, location: Location):
+        """
+        Inicializa o registro a partir de uma localização.
+
+        Args:
+            location (Location): A cidade representada pelo registro.
+        """
+        self.location = location
+        self.key = normalize_text(location.city_name or "")
+        self.folded = fold_text(location.city_name or "")
+
+
+class _PrefixIndex:
+    """
+    Índice de prefixos baseado em um vetor ordenado de nomes normalizados.
+
+    Os registros com nomes começando por um prefixo ocupam uma faixa contínua
+    do vetor, localizada por busca binária.
+    """
+
+    __slots__ = ("_keys", "_entries")
+
+    def __init__(self, entries: list[_CatalogEntry]):
+        """
+        Ordena os registros pelo nome normalizado e monta o índice.
+
+        Args:
+            entries (list[_CatalogEntry]): Os registros a serem indexados.
+        """
+        self._entries = sorted(
+            entries, key=lambda entry: (entry.key, entry.location.id)
+        )
+        self._keys = [entry.key for entry in self._entries]
+
+    def lookup(self, prefix: str, limit: int) -> list[Location]:
+        """
+        Retorna as localizações cujo nome normalizado começa com o prefixo.
+
+        Args:
+            prefix (str): O prefixo já normalizado.
+            limit (int): O número máximo de resultados.
+
+        Returns:
+            list[Location]: As localizações encontradas, em ordem alfabética.
+        """
+        result = []
+        index = bisect_left(self._keys, prefix)
+        while (
+            index < len(self._keys)
+            and len(result) < limit
+            and self._keys[index].startswith(prefix)
+        ):
+            result.append(self._entries[index].location)
+            index += 1
+        return result
+
+
+class LocationCatalog(ILocationCatalog):
+    """
+    Catálogo somente leitura das localizações, mantido em memória.
+
+    Implementa as consultas de `ILocationRepository` sobre as cidades carregadas
+    por `load`. As cidades de cada estado são mantidas ordenadas por nome, e o
+    autocompletar utiliza um índice de prefixos por estado e outro para o país.
+    A resolução de nomes digitados livremente utiliza um índice de trigramas.
+    Atualizações de uma cidade, como suas coordenadas, são aplicadas sem
+    recarregar o catálogo. Um novo carregamento monta todas as estruturas antes de substituí-las, de
+    forma que consultas concorrentes nunca observam um catálogo parcial.
+    """
+
+    RESOLVE_MIN_SCORE = 0.3
+    """
+    Similaridade mínima de trigramas, entre 0 e 1, para que uma cidade seja candidata em `resolve`.
+    """
+
+    def __init__(self):
+        """
+        Inicializa um catálogo vazio, ainda não carregado.
+        """
+        self._revision = 0
+        self._states: list[Location] = []
+        self._by_state: dict[str, list[_CatalogEntry]] = {}
+        self._indexes: dict[Optional[str], _PrefixIndex] = {}
+        self._entries: list[_CatalogEntry] = []
+        self._by_id: dict[int, _CatalogEntry] = {}
+        self._trigrams = TrigramIndex([])
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Indica se o catálogo já foi carregado e pode responder às consultas.
+        """
+        return self._revision > 0
+
+    @property
+    def revision(self) -> int:
+        """
+        Contador das alterações do catálogo, incrementado a cada carga ou atualização.
+        """
+        return self._revision
+
+    async def load(self, source: ILocationRepository) -> None:
+        """
+        Carrega, ou recarrega, o catálogo a partir de um repositório de localização.
+
+        Args:
+            source (ILocationRepository): O repositório de onde as localizações são lidas.
+        """
+        self._build([_CatalogEntry(location) async for location in source.stream()])
+
+    def _build(self, entries: list[_CatalogEntry]) -> None:
+        """
+        Monta as estruturas do catálogo e as substitui de uma só vez.
+
+        Args:
+            entries (list[_CatalogEntry]): Os registros de todas as cidades.
+        """
+        by_state: dict[str, list[_CatalogEntry]] = {}
+        states: dict[str, Location] = {}
+        for entry in entries:
+            location = entry.location
+            by_state.setdefault(location.state, []).append(entry)
+            states.setdefault(
+                location.state,
+                Location.model_construct(
+                    country=location.country,
+                    state=location.state,
+                    stateName=location.state_name,
+                    cityName=None,
+                    coordinates=None,
+                ),
+            )
+        for state_entries in by_state.values():
+            state_entries.sort(key=lambda entry: self._sort_key(entry.location))
+
+        self._states = sorted(states.values(), key=lambda state: state.state_name)
+        self._by_state = by_state
+        self._indexes = {
+            None: _PrefixIndex(entries),
+            **{
+                state: _PrefixIndex(state_entries)
+                for state, state_entries in by_state.items()
+            },
+        }
+        self._entries = entries
+        self._by_id = {entry.location.id: entry for entry in entries}
+        self._trigrams = TrigramIndex([entry.key for entry in entries])
+        self._revision += 1
+
+    async def autocomplete(
+        self, prefix: str, state: Optional[str] = None, limit: int = 10
+    ) -> list[Location]:
+        """
+        Busca cidades cujo nome começa com o prefixo informado.
+
+        A comparação ignora maiúsculas, acentos e pontuação.
+
+        Args:
+            prefix (str): O início do nome da cidade.
+            state (Optional[str]): Restringe a busca a um estado.
+            limit (int): O número máximo de resultados.
+
+        Returns:
+            list[Location]: As cidades encontradas, em ordem alfabética.
+        """
+        normalized = normalize_text(prefix)
+        if not normalized:
+            return []
+        index = self._indexes.get(state.upper() if state is not None else None)
+        return index.lookup(normalized, limit) if index else []
+
+    async def resolve(self, text: str, limit: int = 5) -> list[LocationMatch]:
+        """
+        Resolve um nome de cidade digitado livremente para as cidades do catálogo.
+
+        O nome pode conter erros de digitação, omitir acentos e terminar com a
+        sigla do estado (ex: "sao jose sc", "Florianópolis/SC"). Quando o nome
+        normalizado coincide exatamente com o de uma ou mais cidades, apenas
+        elas são retornadas, com pontuação 1. Caso contrário, as cidades são
+        ranqueadas pela similaridade de trigramas, a partir de `RESOLVE_MIN_SCORE`.
+        Se a sigla do estado não levar a nenhum resultado, ela é tratada como
+        parte do nome.
+
+        Args:
+            text (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+            limit (int): O número máximo de candidatos.
+
+        Returns:
+            list[LocationMatch]: Os candidatos, do mais para o menos provável.
+        """
+        normalized = normalize_text(text)
+        name, _, suffix = normalized.rpartition(" ")
+        state = suffix.upper()
+        if name and state in self._by_state:
+            matches = self._resolve(name, state, limit)
+            if matches:
+                return matches
+        return self._resolve(normalized, None, limit)
+
+    async def create(self, data: Location):
+        """
+        Cria um novo registro de localização.
+
+        O catálogo é somente leitura, e deve ser recarregado com `load`.
+        """
+        raise NotImplementedError
+
+    async def create_many(self, data: list[Location]):
+        """
+        Cria vários registros de localização.
+
+        O catálogo é somente leitura, e deve ser recarregado com `load`.
+        """
+        raise NotImplementedError
+
+    async def update(self, data: Location, id: int):
+        """
+        Atualiza uma cidade do catálogo, sem acessar o banco de dados.
+
+        Permite refletir no catálogo uma alteração já persistida, como as
+        coordenadas obtidas pela geocodificação, sem recarregá-lo. Os índices só
+        são reconstruídos se o nome da cidade ou o estado forem alterados.
+
+        Args:
+            data (Location): Os novos dados da localização.
+            id (int): O identificador da cidade a ser atualizada.
+        """
+        entry = self._by_id.get(id)
+        if entry is None:
+            return
+        previous = entry.location
+        location = data.model_copy(update={"id": id})
+        if (location.city_name, location.state) == (previous.city_name, previous.state):
+            entry.location = location
+            self._revision += 1
+            return
+        entries = [
+            _CatalogEntry(location) if item is entry else item for item in self._entries
+        ]
+        self._build(entries)
+
+    async def delete(self, id: int):
+        """
+        Exclui um registro de localização.
+
+        O catálogo é somente leitura, e deve ser recarregado com `load`.
+        """
+        raise NotImplementedError
+
+    async def search(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        page: Optional[PageWindow] = None,
+    ) -> list[Location]:
+        """
+        Busca cidades no catálogo com filtros e paginação.
+
+        Segue as mesmas regras de `LocationRepository.search`: os resultados são
+        ordenados pela coluna de ordenação e pelo identificador, e filtros por
+        nome de cidade ignoram maiúsculas e acentos. Ambos comparam os nomes por
+        `fold_text`, equivalente à expressão usada no banco de dados.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a busca.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+            page (Optional[PageWindow]): A janela de resultados, por deslocamento ou
+                por chave. Se omitida, todos os resultados são retornados.
+
+        Returns:
+            list[Location]: Uma lista de objetos Location encontrados.
+        """
+        page = page or PageWindow()
+        result = self._select(filters, order_by, page.after)
+        start = page.offset or 0
+        end = start + page.limit if page.limit is not None else None
+        return result[start:end]
+
+    async def stream(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+    ) -> AsyncGenerator[Location, None]:
+        """
+        Percorre as cidades do catálogo que atendem aos filtros.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a busca.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+
+        Returns:
+            AsyncGenerator[Location, None]: Gerador assíncrono dos objetos Location encontrados.
+        """
+        for location in self._select(filters, order_by):
+            yield location
+
+    async def list_states(self, country: Optional[str] = None) -> list[Location]:
+        """
+        Lista os estados distintos presentes no catálogo.
+
+        Args:
+            country (Optional[str]): Filtra os estados pelo código do país.
+
+        Returns:
+            list[Location]: Uma lista de objetos Location, um para cada estado,
+            ordenada pelo nome do estado.
+        """
+        return [
+            state for state in self._states if not country or state.country == country
+        ]
+
+    def _resolve(
+        self, key: str, state: Optional[str], limit: int
+    ) -> list[LocationMatch]:
+        """
+        Busca as cidades de nome exato ou similar a um nome normalizado.
+
+        Args:
+            key (str): O nome normalizado da cidade.
+            state (Optional[str]): Restringe a busca a um estado.
+            limit (int): O número máximo de candidatos.
+
+        Returns:
+            list[LocationMatch]: Os candidatos, do mais para o menos provável.
+        """
+        if not key:
+            return []
+
+        def in_state(position: int) -> bool:
+            return state is None or self._entries[position].location.state == state
+
+        exact = [
+            position for position in self._trigrams.exact(key) if in_state(position)
+        ]
+        if exact:
+            scored = [(1.0, position) for position in exact[:limit]]
+        else:
+            scored = self._trigrams.similar(
+                key, threshold=self.RESOLVE_MIN_SCORE, limit=limit, accept=in_state
+            )
+        return [
+            LocationMatch(location=self._entries[position].location, score=score)
+            for score, position in scored
+        ]
+
+    @staticmethod
+    def _sort_key(location: Location, order_by: Optional[str] = None) -> tuple:
+        """
+        Retorna a chave de ordenação de uma localização, com valores nulos ao final.
+
+        A coluna é comparada por `fold_text`, na mesma ordem da expressão
+        `f_unaccent(lower(...)) COLLATE "C"` usada por `LocationRepository`, para
+        que os cursores de paginação sejam válidos nos dois repositórios.
+
+        Args:
+            location (Location): A localização a ser ordenada.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+
+        Returns:
+            tuple: A chave composta pela coluna de ordenação e pelo identificador.
+        """
+        return LocationCatalog._bound(
+            getattr(location, order_by or "city_name"), location.id
+        )
+
+    @staticmethod
+    def _bound(value: Optional[str], id_: int) -> tuple:
+        """
+        Monta a chave de ordenação a partir do valor da coluna e do identificador.
+
+        Args:
+            value (Optional[str]): O valor da coluna de ordenação.
+            id_ (int): O identificador da localização.
+
+        Returns:
+            tuple: A chave de ordenação, com valores nulos ao final.
+        """
+        return (value is None, fold_text(value) if value is not None else "", id_)
+
+    def _select(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        after: Optional[Cursor] = None,
+    ) -> list[Location]:
+        """
+        Filtra e ordena as cidades do catálogo.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a busca.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+            after (Optional[Cursor]): Cursor do último item da página anterior.
+
+        Returns:
+            list[Location]: As localizações encontradas, já ordenadas.
+        """
+        filters = dict(filters or {})
+        if "state" in filters:
+            entries = self._by_state.get(filters.pop("state"), [])
+            presorted = order_by in (None, "city_name")
+        else:
+            entries = [entry for items in self._by_state.values() for entry in items]
+            presorted = False
+        city_name = filters.pop("city_name", None)
+        city_key = fold_text(city_name) if city_name else None
+
+        result = [
+            entry.location
+            for entry in entries
+            if (city_key is None or entry.folded == city_key)
+            and all(
+                getattr(entry.location, column) == value
+                for column, value in filters.items()
+            )
+        ]
+        if not presorted:
+            result.sort(key=lambda location: self._sort_key(location, order_by))
+        if after is not None:
+            bound = self._bound(after.value, after.id)
+            result = [
+                location
+                for location in result
+                if self._sort_key(location, order_by) > bound
+            ]
+        return result
@@ -0,0 +1,215 @@
+"""
+Módulo das listagens de localizações pré-serializadas.
+
+Estados e municípios mudam raramente, por isso as listagens completas, de
+estados, de cidades por estado e de cidades do país, são serializadas em JSON
+e comprimidas uma única vez, após a carga inicial. As requisições a essas
+listagens copiam os bytes prontos, sem consultar o banco de dados nem
+serializar os objetos a cada requisição. Quando montadas a partir do catálogo
+de localizações, as listagens são remontadas em segundo plano após cada
+alteração do catálogo, como as coordenadas obtidas pela geocodificação.
+"""
+
+import asyncio
+import gzip
+import hashlib
+from typing import NamedTuple, Optional
+
+from loguru import logger
+
+from tempotech.core import config
+from tempotech.core.interfaces.database_repository import (
+    ILocationCatalog,
+    ILocationRepository,
+)
+from tempotech.core.schemas.location_schema import Location
+
+
+class Snapshot(NamedTuple):
+    """
+    Documento JSON pré-serializado de uma listagem de localizações.
+
+    Attributes:
+        body (bytes): O documento JSON.
+        gzip (bytes): O documento comprimido com gzip.
+        etag (str): Identificador forte do documento JSON.
+        gzip_etag (str): Identificador forte do documento comprimido.
+    """
+
+    body: bytes
+    gzip: bytes
+    etag: str
+    gzip_etag: str
+
+
+def _build_snapshot(locations: list[bytes]) -> Snapshot:
+    """
+    Monta o documento JSON de uma listagem a partir dos objetos já serializados.
+
+    Args:
+        locations (list[bytes]): Os objetos `Location` serializados em JSON.
+
+    Returns:
+        Snapshot: O documento, a sua versão comprimida e o seu identificador.
+    """
+    body = b"[" + b",".join(locations) + b"]"
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return Snapshot(
+        body=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=f'"{digest}"',
+        gzip_etag=f'"{digest}-gzip"',
+    )
+
+
+class LocationSnapshot:
+    """
+    Listagens completas de localizações, pré-serializadas e mantidas em memória.
+
+    Assim como o catálogo de localizações, as listagens são montadas por `load`
+    a partir de outro repositório e substituídas de uma única vez, de forma que
+    consultas concorrentes nunca observam um conjunto parcial. Se o repositório
+    for um catálogo, as consultas seguintes a uma alteração do catálogo ainda
+    recebem as listagens anteriores, enquanto as novas são montadas.
+    """
+
+    refresh_delay: float = config.LOCATION_SNAPSHOT_REFRESH_DELAY
+    """
+    Espera, em segundos, antes de remontar as listagens após uma alteração do catálogo.
+    """
+
+    def __init__(self):
+        """
+        Inicializa as listagens vazias, ainda não carregadas.
+        """
+        self._states: Optional[Snapshot] = None
+        self._cities: Optional[Snapshot] = None
+        self._cities_by_state: dict[str, Snapshot] = {}
+        self._catalog: Optional[ILocationCatalog] = None
+        self._country: Optional[str] = None
+        self._revision: Optional[int] = None
+        self._refresh: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Indica se as listagens já foram montadas e podem ser servidas.
+        """
+        return self._states is not None
+
+    async def load(self, source: ILocationRepository, country: Optional[str] = None):
+        """
+        Monta, ou remonta, as listagens a partir de um repositório de localização.
+
+        A serialização é feita durante a leitura, e a compressão, fora do laço de
+        eventos, para não bloquear as requisições em andamento. Se o repositório
+        for um catálogo, a revisão lida é guardada, para que as listagens sejam
+        remontadas quando o catálogo for alterado.
+
+        Args:
+            source (ILocationRepository): O repositório de onde as localizações são lidas.
+            country (Optional[str]): Restringe as listagens a um país.
+        """
+        catalog = source if isinstance(source, ILocationCatalog) else None
+        revision = catalog.revision if catalog is not None else None
+        states = await source.list_states(country=country)
+        by_state: dict[str, list[bytes]] = {state.state: [] for state in states}
+        async for location in source.stream(
+            filters={"country": country} if country else None
+        ):
+            by_state.setdefault(location.state, []).append(self._dump(location))
+        self._states, self._cities, self._cities_by_state = await asyncio.to_thread(
+            self._build, [self._dump(state) for state in states], by_state
+        )
+        self._catalog, self._country, self._revision = catalog, country, revision
+
+    def _refresh_if_stale(self) -> None:
+        """
+        Remonta as listagens em segundo plano, se o catálogo foi alterado desde a montagem.
+
+        Apenas uma remontagem é executada por vez, e ela aguarda `refresh_delay`
+        antes de ler o catálogo, de forma que uma sequência de alterações, como a
+        geocodificação em lote, gera uma remontagem por intervalo, e não uma por
+        consulta. As alterações feitas durante a remontagem são identificadas na
+        próxima consulta.
+        """
+        if (
+            self._catalog is None
+            or self._catalog.revision == self._revision
+            or (self._refresh is not None and not self._refresh.done())
+        ):
+            return
+        self._refresh = asyncio.create_task(self._reload(self._catalog))
+
+    async def _reload(self, catalog: ILocationCatalog) -> None:
+        """
+        Remonta as listagens a partir do catálogo, mantendo as atuais em caso de falha.
+
+        Args:
+            catalog (ILocationCatalog): O catálogo de onde as localizações são lidas.
+        """
+        await asyncio.sleep(self.refresh_delay)
+        try:
+            await self.load(catalog, country=self._country)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Location snapshot refresh failed: {e!r}")
+
+    @staticmethod
+    def _dump(location: Location) -> bytes:
+        """
+        Serializa uma localização com os mesmos nomes de campos das respostas da API.
+
+        Args:
+            location (Location): A localização a ser serializada.
+
+        Returns:
+            bytes: O objeto JSON da localização.
+        """
+        return location.model_dump_json(by_alias=True).encode()
+
+    @staticmethod
+    def _build(
+        states: list[bytes], by_state: dict[str, list[bytes]]
+    ) -> tuple[Snapshot, Snapshot, dict[str, Snapshot]]:
+        """
+        Monta os documentos de todas as listagens.
+
+        Args:
+            states (list[bytes]): Os estados serializados.
+            by_state (dict[str, list[bytes]]): As cidades serializadas, por estado.
+
+        Returns:
+            tuple[Snapshot, Snapshot, dict[str, Snapshot]]: As listagens de estados,
+            de cidades do país e de cidades por estado.
+        """
+        return (
+            _build_snapshot(states),
+            _build_snapshot([city for cities in by_state.values() for city in cities]),
+            {state: _build_snapshot(cities) for state, cities in by_state.items()},
+        )
+
+    def states(self) -> Optional[Snapshot]:
+        """
+        Retorna a listagem de estados.
+
+        Returns:
+            Optional[Snapshot]: A listagem, ou `None` se ainda não foi montada.
+        """
+        self._refresh_if_stale()
+        return self._states
+
+    def cities(self, state: Optional[str] = None) -> Optional[Snapshot]:
+        """
+        Retorna a listagem de cidades de um estado, ou do país inteiro.
+
+        Args:
+            state (Optional[str]): A abreviação do estado. Se omitido, retorna todas as cidades.
+
+        Returns:
+            Optional[Snapshot]: A listagem, ou `None` se ainda não foi montada ou se
+            o estado não existe.
+        """
+        self._refresh_if_stale()
+        if state is None:
+            return self._cities
+        return self._cities_by_state.get(state.upper())
@@ -0,0 +1,128 @@
+"""
+Módulo do índice de trigramas para busca aproximada de nomes.
+
+Implementa, em memória, a mesma medida de similaridade da extensão `pg_trgm`
+do PostgreSQL: cada palavra é decomposta em sequências de três caracteres, e a
+similaridade entre dois textos é a razão entre os trigramas em comum e o total
+de trigramas distintos dos dois. Erros de digitação e palavras faltantes
+reduzem a similaridade sem impedir que o nome correto seja encontrado.
+"""
+
+import heapq
+from array import array
+from collections import Counter
+from typing import Callable, Iterator, Optional
+
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas sobre uma lista de textos já normalizados.
+
+    Os textos são identificados pela sua posição na lista recebida. Para cada
+    trigrama, o índice guarda as posições dos textos que o contêm, em vetores
+    compactos de inteiros.
+    """
+
+    __slots__ = ("_postings", "_sizes", "_exact")
+
+    def __init__(self, keys: list[str]):
+        """
+        Monta o índice a partir dos textos informados.
+
+        Args:
+            keys (list[str]): Os textos normalizados a serem indexados.
+        """
+        postings: dict[str, array] = {}
+        exact: dict[str, list[int]] = {}
+        sizes = array("H")
+        for position, key in enumerate(keys):
+            grams = self.trigrams(key)
+            sizes.append(len(grams))
+            exact.setdefault(key, []).append(position)
+            for gram in grams:
+                postings.setdefault(gram, array("I")).append(position)
+        self._postings = postings
+        self._sizes = sizes
+        self._exact = exact
+
+    @staticmethod
+    def trigrams(text: str) -> set[str]:
+        """
+        Decompõe um texto nos trigramas de suas palavras.
+
+        Assim como no `pg_trgm`, cada palavra recebe dois espaços no início e um
+        no final, o que valoriza a coincidência do começo das palavras.
+
+        Args:
+            text (str): O texto normalizado.
+
+        Returns:
+            set[str]: Os trigramas distintos do texto.
+        """
+        grams = set()
+        for word in text.split():
+            padded = f"  {word} "
+            grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+        return grams
+
+    def exact(self, key: str) -> list[int]:
+        """
+        Retorna as posições dos textos idênticos ao texto informado.
+
+        Args:
+            key (str): O texto normalizado.
+
+        Returns:
+            list[int]: As posições encontradas.
+        """
+        return self._exact.get(key, [])
+
+    def similar(
+        self,
+        key: str,
+        threshold: float,
+        limit: int,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> list[tuple[float, int]]:
+        """
+        Retorna os textos mais similares ao texto informado.
+
+        Args:
+            key (str): O texto normalizado.
+            threshold (float): A similaridade mínima, entre 0 e 1.
+            limit (int): O número máximo de resultados.
+            accept (Optional[Callable[[int], bool]]): Filtro opcional aplicado às posições.
+
+        Returns:
+            list[tuple[float, int]]: Pares de similaridade e posição, da maior para a menor
+            similaridade e, em caso de empate, pela posição.
+        """
+        grams = self.trigrams(key)
+        candidates = [
+            (score, -position)
+            for position, score in self._scores(grams)
+            if score >= threshold and (accept is None or accept(position))
+        ]
+        return [
+            (score, -position) for score, position in heapq.nlargest(limit, candidates)
+        ]
+
+    def _scores(self, grams: set[str]) -> Iterator[tuple[int, float]]:
+        """
+        Calcula a similaridade de Jaccard entre os trigramas informados e cada texto indexado.
+
+        Apenas os textos com ao menos um trigrama em comum são considerados.
+
+        Args:
+            grams (set[str]): Os trigramas do texto pesquisado.
+
+        Returns:
+            Iterator[tuple[int, float]]: Pares de posição e similaridade.
+        """
+        shared: Counter = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                shared.update(postings)
+        for position, count in shared.items():
+            yield position, count / (len(grams) + self._sizes[position] - count)
@@ -1,19 +1,24 @@
 """
 Módulo de repositório de conexão para PostgreSQL.
 
-Este módulo gerencia a criação de sessões de banco de dados assíncronas para
-o PostgreSQL, garantindo que as tabelas sejam criadas e que as sessões
-sejam devidamente gerenciadas dentro de um contexto.
+Este módulo gerencia o motor assíncrono e a fábrica de sessões do PostgreSQL.
+O motor é criado uma única vez por processo, durante o ciclo de vida da
+aplicação, e compartilhado por todas as requisições através do pool de conexões.
 """
+
 import urllib
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, ClassVar, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from tempotech.core import config
+from tempotech.core.database.repository.postgres.migrations import run_migrations
 from tempotech.core.interfaces.database_repository import IConnectionRepository
 
 
@@ -22,67 +27,104 @@ class ConnectionRepository(IConnectionRepository[AsyncSession]):
     Repositório de conexão para o banco de dados PostgreSQL.
 
     Esta classe implementa a interface `IConnectionRepository` para fornecer
-    uma conexão assíncrona com o banco de dados PostgreSQL.
+    uma conexão assíncrona com o banco de dados PostgreSQL. O motor e a fábrica
+    de sessões são compartilhados no nível da classe, seguindo o mesmo padrão
+    de `FastAPICache` e `FastAPILimiter`.
     """
 
+    _engine: ClassVar[Optional[AsyncEngine]] = None
+    _session_factory: ClassVar[async_sessionmaker[AsyncSession]] = async_sessionmaker(
+        class_=AsyncSession, expire_on_commit=False
+    )
+
+    @classmethod
+    async def init(cls) -> None:
+        """
+        Cria o motor assíncrono com pool de conexões e associa a ele a fábrica de sessões.
+
+        As configurações do pool são lidas de `config`. O esquema do banco de
+        dados e as migrações pendentes são aplicados apenas nesta etapa, e não a
+        cada requisição. Chamadas repetidas não recriam o motor.
+        """
+        if ConnectionRepository._engine is not None:
+            return
+        engine = create_async_engine(
+            f"postgresql+asyncpg://{urllib.parse.quote(config.DB_USER)}:"
+            + f"{urllib.parse.quote(config.DB_PWD)}@{config.DB_HOST}:"
+            + f"{config.DB_PORT}/{config.DB_NAME}",
+            echo=config.DB_ECHO,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=config.DB_POOL_PRE_PING,
+        )
+        async with engine.begin() as conn:
+            await run_migrations(conn)
+        ConnectionRepository._engine = engine
+        ConnectionRepository._session_factory.configure(bind=engine)
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Encerra todas as conexões do pool e descarta o motor compartilhado.
+        """
+        if ConnectionRepository._engine is None:
+            return
+        await ConnectionRepository._engine.dispose()
+        ConnectionRepository._engine = None
+        ConnectionRepository._session_factory.configure(bind=None)
+
+    @staticmethod
+    def _get_session_factory() -> async_sessionmaker[AsyncSession]:
+        """
+        Retorna a fábrica de sessões compartilhada.
+
+        Raises:
+            RuntimeError: Se `init` ainda não foi chamado.
+        """
+        if ConnectionRepository._engine is None:
+            raise RuntimeError("ConnectionRepository.init must be called first.")
+        return ConnectionRepository._session_factory
+
     @staticmethod
     async def connect() -> AsyncGenerator[AsyncSession, None]:
         """
-        Cria e gerencia uma sessão de banco de dados assíncrona.
+        Cede uma sessão assíncrona obtida da fábrica compartilhada.
 
-        Cria o motor assíncrono, garante que o esquema do banco de dados seja
-        criado e, em seguida, cede uma sessão assíncrona para a aplicação.
+        A sessão utiliza uma conexão do pool, que é devolvida ao pool quando
+        a sessão é encerrada.
 
         Yields:
             AsyncGenerator[AsyncSession, None]: Uma sessão de banco de dados assíncrona.
         """
-        async_engine = create_async_engine(
-            f"postgresql+asyncpg://{urllib.parse.quote(config.DB_USER)}:"
-            + f"{urllib.parse.quote(config.DB_PWD)}@{config.DB_HOST}:"
-            + f"{config.DB_PORT}/{config.DB_NAME}",
-            echo=True,
-        )
-        async with async_engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-        async_session = sessionmaker(
-            async_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with async_session() as session:
+        async with ConnectionRepository._get_session_factory()() as session:
             yield session
 
 
-class ConnectionRepositoryV2(IConnectionRepository[AsyncSession]):
+class ConnectionRepositoryV2(ConnectionRepository):
     """
     Repositório de conexão aprimorado usando um gerenciador de contexto assíncrono.
 
     Esta versão da classe utiliza `asynccontextmanager` para um gerenciamento
-    mais robusto e idiomático do ciclo de vida da sessão.
+    mais robusto e idiomático do ciclo de vida da sessão. Compartilha o motor
+    e o pool de conexões de `ConnectionRepository`.
     """
+
     # Gambiarra para trabalhar com gerenciamento de contexto
 
     @staticmethod
     @asynccontextmanager
     async def connect() -> AsyncGenerator[AsyncSession, None]:
         """
-        Cria e gerencia uma sessão de banco de dados assíncrona usando um
+        Cede uma sessão assíncrona da fábrica compartilhada usando um
         gerenciador de contexto.
 
-        Este método garante que a conexão e a sessão sejam abertas e fechadas
-        automaticamente.
+        Este método garante que a sessão seja aberta e fechada
+        automaticamente, devolvendo a conexão ao pool.
 
         Yields:
             AsyncGenerator[AsyncSession, None]: Uma sessão de banco de dados assíncrona.
         """
-        async_engine = create_async_engine(
-            f"postgresql+asyncpg://{urllib.parse.quote(config.DB_USER)}:"
-            + f"{urllib.parse.quote(config.DB_PWD)}@{config.DB_HOST}:"
-            + f"{config.DB_PORT}/{config.DB_NAME}",
-            echo=True,
-        )
-        async with async_engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
-        async_session = sessionmaker(
-            async_engine, class_=AsyncSession, expire_on_commit=False
-        )
-        async with async_session() as session:
-            yield session
\ No newline at end of file
+        async with ConnectionRepository._get_session_factory()() as session:
+            yield session
@@ -6,25 +6,73 @@ de localização, como estados e cidades, utilizando o SQLModel e uma sessão
 assíncrona do SQLAlchemy.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy import Engine, select
+from sqlalchemy import (
+    ColumnElement,
+    Engine,
+    Row,
+    Select,
+    func,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session
 
 from tempotech.core.database.models.location_model import LocationModel
-from tempotech.core.interfaces.database_repository import IDefaultRepository
+from tempotech.core.interfaces.database_repository import ILocationRepository
 from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.schemas.pagination_schema import Cursor, PageWindow
 
 
-class LocationRepository(IDefaultRepository[Location]):
+class LocationRepository(ILocationRepository):
     """
     Repositório responsável por operações CRUD de localização no banco de dados.
 
-    Implementa a interface `IDefaultRepository` para operações como criar
+    Implementa a interface `ILocationRepository` para operações como criar
     e buscar dados de localização.
     """
 
+    _COPY_COLUMNS = (
+        "city_name",
+        "state_name",
+        "state",
+        "country",
+        "latitude",
+        "longitude",
+        "created_at",
+    )
+    """
+    Colunas preenchidas pela carga em massa de `create_many`, na ordem dos registros.
+    """
+
+    _ACCENT_INSENSITIVE_COLUMNS = frozenset({"city_name"})
+    """
+    Colunas cujos filtros ignoram maiúsculas e acentos, comparando a expressão de
+    `_fold`, indexada pelas migrações.
+    """
+
+    STREAM_BATCH_SIZE = 500
+    """
+    Quantidade de linhas lidas do cursor no servidor a cada lote em `stream`.
+    """
+
+    _PROJECTION = (
+        LocationModel.id,
+        LocationModel.country,
+        LocationModel.state,
+        LocationModel.state_name,
+        LocationModel.city_name,
+        LocationModel.latitude,
+        LocationModel.longitude,
+    )
+    """
+    Colunas selecionadas pelas buscas, na ordem esperada por `_to_location`.
+    """
+
     def __init__(self, session: AsyncSession):
         """
         Inicializa o repositório com uma sessão de banco de dados.
@@ -34,6 +82,34 @@ class LocationRepository(IDefaultRepository[Location]):
         """
         self._session = session
 
+    @staticmethod
+    def _to_location(row: Row) -> Location:
+        """
+        Converte uma linha de `_PROJECTION` em um objeto `Location`.
+
+        Os dados vêm do próprio banco, já validados na escrita, por isso o
+        objeto é construído com `model_construct`, sem uma nova validação.
+
+        Args:
+            row (Row): A linha retornada pela consulta.
+
+        Returns:
+            Location: A localização correspondente à linha.
+        """
+        id_, country, state, state_name, city_name, latitude, longitude = row
+        return Location.model_construct(
+            id=id_,
+            country=country,
+            state=state,
+            stateName=state_name,
+            cityName=city_name,
+            coordinates=(
+                Coordinates.model_construct(latitude=latitude, longitude=longitude)
+                if latitude is not None and longitude is not None
+                else None
+            ),
+        )
+
     async def create(self, data: Location):
         """
         Cria um novo registro de localização no banco de dados.
@@ -55,13 +131,76 @@ class LocationRepository(IDefaultRepository[Location]):
         self._session.add(model)
         await self._session.commit()
 
+    async def create_many(self, data: list[Location]):
+        """
+        Cria vários registros de localização em uma única transação.
+
+        Utiliza o protocolo `COPY` do PostgreSQL, através do driver `asyncpg`,
+        para carregar todas as linhas de uma vez, evitando um `INSERT` e um
+        `COMMIT` por registro.
+
+        Args:
+            data (list[Location]): Os objetos de localização a serem criados.
+        """
+        if not data:
+            return
+        now = datetime.now()
+        records = [
+            (
+                item.city_name if item.city_name else None,
+                item.state_name,
+                item.state,
+                item.country,
+                item.coordinates.latitude if item.coordinates else None,
+                item.coordinates.longitude if item.coordinates else None,
+                now,
+            )
+            for item in data
+        ]
+        try:
+            connection = await self._session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                LocationModel.__tablename__,
+                records=records,
+                columns=self._COPY_COLUMNS,
+            )
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+
     async def update(self, data: Location, id: int):
         """
         Atualiza um registro de localização existente.
 
-        Esta função ainda não foi implementada.
+        Sobrescreve os nomes, o país e as coordenadas do registro, e registra o
+        momento da alteração em `updated_at`. É usado, por exemplo, para persistir
+        as coordenadas obtidas pela geocodificação.
+
+        Args:
+            data (Location): Os novos dados da localização.
+            id (int): O identificador do registro a ser atualizado.
         """
-        raise NotImplementedError
+        statement = (
+            update(LocationModel)
+            .where(LocationModel.id == id)
+            .values(
+                city_name=data.city_name if data.city_name else None,
+                state_name=data.state_name,
+                state=data.state,
+                country=data.country,
+                latitude=data.coordinates.latitude if data.coordinates else None,
+                longitude=data.coordinates.longitude if data.coordinates else None,
+                updated_at=datetime.now(),
+            )
+        )
+        try:
+            await self._session.execute(statement)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
 
     async def delete(self, id: int):
         """
@@ -75,50 +214,144 @@ class LocationRepository(IDefaultRepository[Location]):
         self,
         filters: Optional[dict] = None,
         order_by: Optional[str] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
+        page: Optional[PageWindow] = None,
     ) -> list[Location]:
         """
         Busca registros de localização no banco de dados com filtros e paginação.
 
+        Apenas as colunas retornadas pela API são selecionadas, e as linhas são
+        convertidas diretamente em `Location`, sem hidratar instâncias do ORM.
+        Os resultados são sempre ordenados pela coluna de ordenação, sem
+        maiúsculas e acentos, e, em caso de empate, pelo identificador. Filtros
+        por nome de cidade também ignoram maiúsculas e acentos. Quando `page.after` é informado, a paginação
+        é feita por chave (keyset), buscando os registros posteriores ao cursor
+        em vez de deslocar os resultados com `OFFSET`.
+
         Args:
             filters (Optional[dict]): Dicionário de filtros para a busca.
             order_by (Optional[str]): Coluna para ordenação dos resultados.
-            offset (Optional[int]): Deslocamento para paginação.
-            limit (Optional[int]): Limite de resultados por página.
+            page (Optional[PageWindow]): A janela de resultados, por deslocamento ou
+                por chave. Se omitida, todos os resultados são retornados.
 
         Returns:
             list[Location]: Uma lista de objetos Location encontrados.
         """
-        statement = select(LocationModel)
+        page = page or PageWindow()
+        statement = self._select(filters, order_by, page.after)
 
-        if offset is not None and limit is not None:
-            statement = statement.offset(offset).limit(limit)
+        if page.offset:
+            statement = statement.offset(page.offset)
+        if page.limit is not None:
+            statement = statement.limit(page.limit)
+
+        results = await self._session.execute(statement)
+        return [self._to_location(row) for row in results.all()]
+
+    async def stream(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+    ) -> AsyncGenerator[Location, None]:
+        """
+        Percorre os registros de localização usando um cursor no servidor.
+
+        As linhas são lidas do banco em lotes de `STREAM_BATCH_SIZE`, de modo que
+        o consumo de memória é constante, independentemente do total de registros.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a busca.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+
+        Returns:
+            AsyncGenerator[Location, None]: Gerador assíncrono dos objetos Location encontrados.
+        """
+        statement = self._select(filters, order_by).execution_options(
+            yield_per=self.STREAM_BATCH_SIZE
+        )
+        results = await self._session.stream(statement)
+        async for row in results:
+            yield self._to_location(row)
+
+    @staticmethod
+    def _fold(value) -> ColumnElement:
+        """
+        Converte uma coluna ou um valor para minúsculas e sem acentos.
+
+        A expressão `f_unaccent(lower(...)) COLLATE "C"` compara os textos pela
+        ordem dos seus caracteres, independentemente da collation do banco de
+        dados, e equivale a `fold_text`, usada pelo catálogo em memória. Assim,
+        a ordenação, os filtros e os cursores são os mesmos nos dois repositórios.
+
+        Args:
+            value: A coluna ou o valor a ser convertido.
+
+        Returns:
+            ColumnElement: A expressão convertida.
+        """
+        return func.f_unaccent(func.lower(value)).collate("C")
+
+    def _select(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+        after: Optional[Cursor] = None,
+    ) -> Select:
+        """
+        Monta a consulta de localizações com filtros, cursor e ordenação.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a busca.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+            after (Optional[Cursor]): Cursor do último item da página anterior.
+
+        Returns:
+            Select: A consulta sobre as colunas de `_PROJECTION`.
+        """
+        order_column = self._fold(getattr(LocationModel, order_by or "city_name"))
+        statement = select(*self._PROJECTION)
 
         if filters:
             for column_name, value in filters.items():
                 column = getattr(LocationModel, column_name)
-                statement = statement.where(column == value)
+                if column_name in self._ACCENT_INSENSITIVE_COLUMNS and value:
+                    statement = statement.where(self._fold(column) == self._fold(value))
+                else:
+                    statement = statement.where(column == value)
 
-        statement = (
-            statement.order_by(LocationModel.city_name)
-            if not order_by
-            else statement.order_by(order_by)
-        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(order_column, LocationModel.id)
+                > tuple_(self._fold(after.value), after.id)
+            )
+
+        return statement.order_by(order_column, LocationModel.id)
+
+    async def list_states(self, country: Optional[str] = None) -> list[Location]:
+        """
+        Lista os estados distintos a partir das cidades persistidas.
+
+        Args:
+            country (Optional[str]): Filtra os estados pelo código do país.
+
+        Returns:
+            list[Location]: Uma lista de objetos Location, um para cada estado,
+            ordenada pelo nome do estado.
+        """
+        statement = select(
+            LocationModel.country, LocationModel.state, LocationModel.state_name
+        ).distinct()
+        if country:
+            statement = statement.where(LocationModel.country == country)
+        statement = statement.order_by(LocationModel.state_name)
 
         results = await self._session.execute(statement)
-        locations = results.scalars().all()
         return [
-            Location(
-                country=item.country,
-                state=item.state,
-                stateName=item.state_name,
-                cityName=item.city_name,
-                coordinates=(
-                    Coordinates(latitude=item.latitude, longitude=item.longitude)
-                    if item.latitude and item.longitude
-                    else None
-                ),
+            Location.model_construct(
+                country=row.country,
+                state=row.state,
+                stateName=row.state_name,
+                cityName=None,
+                coordinates=None,
             )
-            for item in locations
+            for row in results
         ]
@@ -0,0 +1,90 @@
+"""
+Módulo de migrações do esquema do banco de dados PostgreSQL.
+
+Este módulo aplica, uma única vez durante a inicialização da aplicação, as
+alterações de esquema que o `SQLModel.metadata.create_all` não cobre, como
+índices em tabelas já existentes, extensões e índices de expressão. Cada
+migração é registrada na tabela "SchemaMigration" e aplicada apenas uma vez.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import SQLModel
+
+MIGRATION_LOCK_KEY = 7_451_212_001
+"""
+Chave do advisory lock que impede que vários processos apliquem migrações ao mesmo tempo.
+"""
+
+MIGRATIONS: list[tuple[int, str, list[str]]] = [
+    (
+        1,
+        "location_search_indexes",
+        [
+            'CREATE INDEX IF NOT EXISTS ix_location_state_city_name_id ON "Location" '
+            + "(state, city_name, id)",
+            'CREATE INDEX IF NOT EXISTS ix_location_country_state_state_name ON "Location" '
+            + "(country, state, state_name)",
+        ],
+    ),
+    (
+        2,
+        "location_unaccent_city_name",
+        [
+            "CREATE EXTENSION IF NOT EXISTS unaccent",
+            "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text AS "
+            + "$$ SELECT public.unaccent('public.unaccent', $1) $$ "
+            + "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT",
+            "CREATE INDEX IF NOT EXISTS ix_location_state_city_name_unaccent "
+            + 'ON "Location" (state, f_unaccent(lower(city_name)))',
+        ],
+    ),
+    (
+        3,
+        "location_folded_city_name_order",
+        [
+            "CREATE INDEX IF NOT EXISTS ix_location_state_city_name_folded "
+            + 'ON "Location" (state, (f_unaccent(lower(city_name)) COLLATE "C"), id)',
+        ],
+    ),
+]
+"""
+Migrações do esquema, em ordem: versão, nome e instruções SQL idempotentes.
+"""
+
+
+async def run_migrations(conn: AsyncConnection) -> None:
+    """
+    Garante as tabelas do modelo e aplica as migrações pendentes.
+
+    Todo o processo ocorre na transação de `conn`, protegido por um advisory
+    lock, para que apenas um processo por vez altere o esquema.
+
+    Args:
+        conn (AsyncConnection): Uma conexão com uma transação aberta.
+    """
+    await conn.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+    )
+    await conn.run_sync(SQLModel.metadata.create_all)
+    await conn.execute(
+        text(
+            'CREATE TABLE IF NOT EXISTS "SchemaMigration" ('
+            + "version integer PRIMARY KEY, "
+            + "name varchar(100) NOT NULL, "
+            + "applied_at timestamp NOT NULL DEFAULT now())"
+        )
+    )
+    result = await conn.execute(text('SELECT version FROM "SchemaMigration"'))
+    applied = set(result.scalars().all())
+    for version, name, statements in MIGRATIONS:
+        if version in applied:
+            continue
+        for statement in statements:
+            await conn.execute(text(statement))
+        await conn.execute(
+            text(
+                'INSERT INTO "SchemaMigration" (version, name) VALUES (:version, :name)'
+            ),
+            {"version": version, "name": name},
+        )
@@ -5,9 +5,13 @@ Este módulo define os contratos (interfaces) para a camada de persistência.
 O objetivo é garantir que a lógica de negócios não dependa de uma
 implementação de banco de dados específica, seguindo o padrão "Ports and Adapters".
 """
+
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Generic, Optional, TypeVar
 
+from tempotech.core.schemas.location_schema import Location, LocationMatch
+from tempotech.core.schemas.pagination_schema import PageWindow
+
 T = TypeVar("T")
 
 
@@ -19,6 +23,28 @@ class IConnectionRepository(ABC, Generic[T]):
     fornecendo uma maneira de obter uma sessão de forma assíncrona.
     """
 
+    @classmethod
+    @abstractmethod
+    async def init(cls) -> None:
+        """
+        Método abstrato para inicializar os recursos compartilhados de conexão.
+
+        A implementação deve criar o motor e a fábrica de sessões uma única vez
+        por processo, normalmente durante a inicialização da aplicação.
+        """
+        pass
+
+    @classmethod
+    @abstractmethod
+    async def close(cls) -> None:
+        """
+        Método abstrato para liberar os recursos compartilhados de conexão.
+
+        A implementação deve encerrar todas as conexões abertas pelo motor,
+        normalmente durante o desligamento da aplicação.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     async def connect() -> AsyncGenerator[T, None]:
@@ -53,6 +79,16 @@ class IDefaultRepository(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def create_many(self, data: list[T]):
+        """
+        Cria vários registros no repositório em uma única transação.
+
+        Args:
+            data (list[T]): Os objetos de dados a serem criados.
+        """
+        pass
+
     @abstractmethod
     async def update(self, data: T, id: int):
         """
@@ -79,19 +115,137 @@ class IDefaultRepository(ABC, Generic[T]):
         self,
         filters: Optional[dict] = None,
         order_by: Optional[str] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
+        page: Optional[PageWindow] = None,
     ) -> list[T]:
         """
         Busca registros no repositório, com suporte a filtros e paginação.
 
+        A paginação pode ser feita por deslocamento (`offset`) ou por chave
+        (`after`), a partir do cursor do último item da página anterior, ambos
+        informados na janela `page`.
+
         Args:
             filters (Optional[dict]): Dicionário de filtros para a consulta.
             order_by (Optional[str]): Coluna para ordenação dos resultados.
-            offset (Optional[int]): O ponto de partida da paginação.
-            limit (Optional[int]): O número máximo de resultados a serem retornados.
+            page (Optional[PageWindow]): A janela de resultados, por deslocamento ou
+                por chave. Se omitida, todos os resultados são retornados.
 
         Returns:
             list[T]: Uma lista de objetos que correspondem aos critérios de busca.
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class ILocationRepository(IDefaultRepository[Location]):
+    """
+    Interface para repositórios de localização.
+
+    Estende as operações CRUD de `IDefaultRepository` com consultas
+    específicas dos dados de localização.
+    """
+
+    @abstractmethod
+    async def stream(
+        self,
+        filters: Optional[dict] = None,
+        order_by: Optional[str] = None,
+    ) -> AsyncGenerator[Location, None]:
+        """
+        Percorre os registros do repositório sem carregá-los todos em memória.
+
+        Args:
+            filters (Optional[dict]): Dicionário de filtros para a consulta.
+            order_by (Optional[str]): Coluna para ordenação dos resultados.
+
+        Returns:
+            AsyncGenerator[Location, None]: Um gerador assíncrono dos objetos encontrados.
+        """
+        pass
+
+    @abstractmethod
+    async def list_states(self, country: Optional[str] = None) -> list[Location]:
+        """
+        Lista os estados distintos presentes no repositório.
+
+        Args:
+            country (Optional[str]): Filtra os estados pelo código do país.
+
+        Returns:
+            list[Location]: Uma lista de objetos Location, um para cada estado.
+        """
+        pass
+
+
+class ILocationCatalog(ILocationRepository):
+    """
+    Interface para catálogos de localização em memória.
+
+    Um catálogo é uma cópia somente leitura das localizações, carregada a
+    partir de outro repositório, que responde às consultas sem acessar o
+    banco de dados.
+    """
+
+    @property
+    @abstractmethod
+    def loaded(self) -> bool:
+        """
+        Indica se o catálogo já foi carregado e pode responder às consultas.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def revision(self) -> int:
+        """
+        Contador das alterações do catálogo, incrementado a cada carga ou atualização.
+
+        Permite que as cópias montadas a partir do catálogo, como as listagens
+        pré-serializadas, identifiquem que estão desatualizadas.
+        """
+        pass
+
+    @abstractmethod
+    async def load(self, source: ILocationRepository) -> None:
+        """
+        Carrega, ou recarrega, o catálogo a partir de um repositório de localização.
+
+        Args:
+            source (ILocationRepository): O repositório de onde as localizações são lidas.
+        """
+        pass
+
+    @abstractmethod
+    async def autocomplete(
+        self, prefix: str, state: Optional[str] = None, limit: int = 10
+    ) -> list[Location]:
+        """
+        Busca cidades cujo nome começa com o prefixo informado.
+
+        A comparação ignora maiúsculas, acentos e pontuação.
+
+        Args:
+            prefix (str): O início do nome da cidade.
+            state (Optional[str]): Restringe a busca a um estado.
+            limit (int): O número máximo de resultados.
+
+        Returns:
+            list[Location]: As cidades encontradas, em ordem alfabética.
+        """
+        pass
+
+    @abstractmethod
+    async def resolve(self, text: str, limit: int = 5) -> list[LocationMatch]:
+        """
+        Resolve um nome de cidade digitado livremente para as cidades do catálogo.
+
+        O nome pode conter erros de digitação, omitir acentos e terminar com a
+        sigla do estado.
+
+        Args:
+            text (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+            limit (int): O número máximo de candidatos.
+
+        Returns:
+            list[LocationMatch]: Os candidatos, do mais para o menos provável.
+        """
+        pass
@@ -8,7 +8,7 @@ específica (ex: IBGE, OpenWeather).
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from tempotech.core.schemas.location_schema import Location
 
@@ -26,6 +26,11 @@ class ILocationProvider(ABC):
     O código do país para o qual o provedor de localização é configurado.
     """
 
+    state_count: Optional[int] = None
+    """
+    A quantidade de estados do país, se conhecida, usada para detectar listagens incompletas.
+    """
+
     @abstractmethod
     async def list_states(self) -> AsyncGenerator[Location, None]:
         """
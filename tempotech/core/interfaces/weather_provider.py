@@ -7,8 +7,11 @@ seja independente de uma fonte de dados de clima específica (ex: OpenWeatherMap
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from tempotech.core.schemas.location_schema import Location
 from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.utils.concurrency import bounded_gather
 
 
 class IWeatherProvider(ABC):
@@ -19,15 +22,46 @@ class IWeatherProvider(ABC):
     deve implementar para buscar dados meteorológicos.
     """
 
+    batch_concurrency: int = 10
+    """
+    Quantidade máxima de requisições simultâneas em `get_current_weather_many`.
+    """
+
     @abstractmethod
-    async def get_current_weather(self, location: str) -> Weather:
+    async def get_current_weather(self, location: Location) -> Weather:
         """
         Método abstrato para obter o clima atual de uma localização.
 
         Args:
-            location (str): O nome da cidade ou outra identificação de localização.
+            location (Location): A cidade, de preferência com coordenadas.
 
         Returns:
             Weather: Um objeto contendo os dados de clima atuais.
         """
         pass
+
+    async def get_current_weather_many(
+        self, locations: list[Location]
+    ) -> list[Optional[Weather]]:
+        """
+        Obtém o clima atual de várias localizações de uma vez.
+
+        A implementação padrão consulta cada cidade por `get_current_weather`, com
+        no máximo `batch_concurrency` requisições simultâneas. Provedores com uma
+        API de consulta em grupo podem sobrescrevê-la.
+
+        Args:
+            locations (list[Location]): As cidades, de preferência com coordenadas.
+
+        Returns:
+            list[Optional[Weather]]: O clima de cada cidade, na mesma ordem de
+            `locations`, ou `None` para as cidades cujo clima não pôde ser obtido.
+        """
+        return await bounded_gather(
+            self.get_current_weather,
+            locations,
+            self.batch_concurrency,
+            describe=lambda location: (
+                f"Weather for {location.city_name}/{location.state}"
+            ),
+        )
@@ -3,17 +3,33 @@ Módulo de inicialização dos provedores de dados.
 
 Este módulo configura e inicializa as instâncias dos provedores de dados
 externos (como IBGE e OpenWeather) com base nas configurações da aplicação.
-Isso permite que a aplicação utilize o provedor de país e de coordenadas
-apropriado de forma centralizada.
+Isso permite que a aplicação utilize o provedor de país, de coordenadas e de
+clima apropriado de forma centralizada. Todos os provedores compartilham o mesmo
+cliente HTTP (`http_client`), aberto e encerrado no ciclo de vida da aplicação,
+e são expostos através de decoradores que coalescem chamadas concorrentes
+idênticas em uma única requisição.
 """
 
 from tempotech.core import config
 from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.providers.http_client import HttpClient
 from tempotech.core.providers.ibge_provider import IBGEProvider
 from tempotech.core.providers.open_weather_provider import OpenWeatherProvider
+from tempotech.core.providers.single_flight_provider import (
+    SingleFlightLocationProvider,
+    SingleFlightWeatherProvider,
+)
 
+http_client = HttpClient()
 coutry_provider: ILocationProvider
-coordinate_provider = OpenWeatherProvider()
+open_weather_provider = OpenWeatherProvider(http_client=http_client)
+coordinate_provider = SingleFlightLocationProvider(open_weather_provider)
+weather_provider: IWeatherProvider = SingleFlightWeatherProvider(
+    open_weather_provider, batch_concurrency=config.WEATHER_BATCH_CONCURRENCY
+)
 
 if config.COUNTRY == "BR":
-    coutry_provider = IBGEProvider()
+    coutry_provider = SingleFlightLocationProvider(
+        IBGEProvider(http_client=http_client, bulk_fetch=config.IBGE_BULK_FETCH)
+    )
@@ -0,0 +1,88 @@
+"""
+Módulo do cliente HTTP compartilhado pelos provedores de dados externos.
+
+Este módulo mantém uma única `aiohttp.ClientSession` por processo, com um
+pool de conexões configurado para reutilizar conexões TCP/TLS e manter as
+resoluções de DNS em cache, evitando abrir uma nova sessão a cada chamada.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+from tempotech.core import config
+
+
+class HttpClient:
+    """
+    Cliente HTTP compartilhado, injetado nas instâncias dos provedores.
+
+    A sessão é criada em `start`, durante o ciclo de vida da aplicação, e
+    encerrada em `close`. Se for utilizada antes de `start`, a sessão é
+    criada sob demanda com as mesmas configurações. Após `close`, a sessão não
+    é recriada até um novo `start`.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o cliente sem uma sessão aberta.
+        """
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._closed = False
+
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """
+        Cria a sessão HTTP com o conector e os tempos limite de `config`.
+
+        O conector utiliza o resolvedor assíncrono do `aiodns` e mantém as
+        resoluções de DNS e as conexões ociosas para reutilização.
+
+        Returns:
+            aiohttp.ClientSession: A sessão HTTP configurada.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=config.HTTP_POOL_LIMIT,
+            limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=config.HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            resolver=aiohttp.AsyncResolver(),
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=config.HTTP_TIMEOUT, connect=config.HTTP_CONNECT_TIMEOUT
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Retorna a sessão HTTP compartilhada, criando-a se necessário.
+
+        Returns:
+            aiohttp.ClientSession: A sessão HTTP compartilhada.
+
+        Raises:
+            RuntimeError: Se o cliente já foi encerrado por `close`.
+        """
+        if self._closed:
+            raise RuntimeError("HTTP client is closed.")
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def start(self) -> None:
+        """
+        Abre a sessão HTTP compartilhada.
+        """
+        self._closed = False
+        _ = self.session
+
+    async def close(self) -> None:
+        """
+        Encerra a sessão HTTP compartilhada e todas as suas conexões.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._closed = True
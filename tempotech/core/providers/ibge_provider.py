@@ -5,11 +5,12 @@ Este provedor implementa a interface `ILocationProvider` para buscar
 dados de localização (estados e cidades) do Brasil a partir da API do IBGE.
 Ele utiliza requisições HTTP assíncronas para buscar as informações.
 """
-from typing import AsyncGenerator
 
-import aiohttp
+import asyncio
+from typing import Any, AsyncGenerator, Optional
 
 from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.providers.http_client import HttpClient
 from tempotech.core.schemas.location_schema import Location
 
 
@@ -19,17 +20,78 @@ class IBGEProvider(ILocationProvider):
 
     Fornece métodos para listar estados e cidades. A propriedade `country`
     é definida como "BR" para indicar que este provedor é específico para o Brasil.
+
+    No modo de busca em massa (`bulk_fetch`), todos os municípios do país são
+    obtidos em uma única requisição e agrupados por estado; `list_cities_by_state`
+    passa a ser apenas uma fachada sobre esse resultado.
     """
+
     IBGE_ESTATE_LOCATION = "https://servicodados.ibge.gov.br/api/v1/localidades/estados"
     IBGE_CITY_LOCATION = (
         "https://servicodados.ibge.gov.br/api/v1/localidades/estados/{UF}/municipios"
     )
+    IBGE_ALL_CITIES_LOCATION = (
+        "https://servicodados.ibge.gov.br/api/v1/localidades/municipios"
+    )
 
-    def __init__(self):
+    def __init__(self, http_client: HttpClient, bulk_fetch: bool = False):
         """
         Inicializa o provedor do IBGE e define o país.
+
+        Args:
+            http_client (HttpClient): O cliente HTTP compartilhado pelos provedores.
+            bulk_fetch (bool): Se `True`, as cidades são obtidas de uma única
+                requisição com todos os municípios do país.
         """
         self.country = "BR"
+        self.state_count = 27
+        self._http_client = http_client
+        self._bulk_fetch = bulk_fetch
+        self._cities_by_state: Optional[dict[str, list[Location]]] = None
+        self._cities_lock = asyncio.Lock()
+
+    async def _fetch(self, url: str) -> Any:
+        """
+        Executa uma requisição GET na API do IBGE e retorna o corpo em JSON.
+
+        Args:
+            url (str): A URL a ser consultada.
+
+        Returns:
+            Any: O conteúdo da resposta decodificado.
+        """
+        async with self._http_client.session.get(url) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def _parse_city(item: dict) -> Optional[Location]:
+        """
+        Converte um município da API do IBGE em um objeto `Location`.
+
+        A hierarquia aninhada do município é percorrida uma única vez. Quando a
+        microrregião não está disponível, a UF é obtida pela região imediata.
+
+        Args:
+            item (dict): O município retornado pela API do IBGE.
+
+        Returns:
+            Optional[Location]: A cidade, ou `None` se a UF não puder ser identificada.
+        """
+        uf = ((item.get("microrregiao") or {}).get("mesorregiao") or {}).get("UF") or (
+            (item.get("regiao-imediata") or {}).get("regiao-intermediaria") or {}
+        ).get("UF")
+        if not uf or not uf.get("sigla") or not uf.get("nome"):
+            return None
+        return Location(
+            **{
+                "country": "BR",
+                "stateName": uf["nome"],
+                "state": uf["sigla"],
+                "cityName": item["nome"],
+                "coordinates": None,
+            }
+        )
 
     async def list_states(self) -> AsyncGenerator[Location, None]:
         """
@@ -41,10 +103,7 @@ class IBGEProvider(ILocationProvider):
         Returns:
             AsyncGenerator[Location, None]: Gerador de objetos Location para cada estado.
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.IBGE_ESTATE_LOCATION) as response:
-                response.raise_for_status()
-                data = await response.json()
+        data = await self._fetch(self.IBGE_ESTATE_LOCATION)
         for item in data:
             yield Location(
                 **{
@@ -56,11 +115,35 @@ class IBGEProvider(ILocationProvider):
                 }
             )
 
+    async def list_cities_grouped_by_state(self) -> dict[str, list[Location]]:
+        """
+        Lista todas as cidades do Brasil, agrupadas pela sigla do estado.
+
+        Os municípios são obtidos com uma única requisição e analisados em uma
+        única passagem. O resultado é mantido em memória, e chamadas
+        concorrentes aguardam a mesma requisição.
+
+        Returns:
+            dict[str, list[Location]]: As cidades de cada estado, indexadas pela sigla.
+        """
+        async with self._cities_lock:
+            if self._cities_by_state is None:
+                data = await self._fetch(self.IBGE_ALL_CITIES_LOCATION)
+                cities_by_state: dict[str, list[Location]] = {}
+                for item in data:
+                    city = self._parse_city(item)
+                    if city:
+                        cities_by_state.setdefault(city.state, []).append(city)
+                self._cities_by_state = cities_by_state
+        return self._cities_by_state
+
     async def list_cities_by_state(self, state: str) -> AsyncGenerator[Location, None]:
         """
         Lista todas as cidades de um estado específico do Brasil.
 
         Busca os municípios a partir da API do IBGE, usando a sigla do estado.
+        No modo de busca em massa, as cidades são lidas do resultado de
+        `list_cities_grouped_by_state`.
 
         Args:
             state (str): A sigla do estado (ex: "SC").
@@ -68,35 +151,17 @@ class IBGEProvider(ILocationProvider):
         Returns:
             AsyncGenerator[Location, None]: Gerador de objetos Location para cada cidade do estado.
         """
-        url = self.IBGE_CITY_LOCATION.replace("{UF}", state)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                data = await response.json()
+        if self._bulk_fetch:
+            cities_by_state = await self.list_cities_grouped_by_state()
+            for city in cities_by_state.get(state, []):
+                yield city
+            return
 
+        data = await self._fetch(self.IBGE_CITY_LOCATION.replace("{UF}", state))
         for item in data:
-            state = (
-                item.get("microrregiao", {})
-                .get("mesorregiao", {})
-                .get("UF", {})
-                .get("sigla")
-            )
-            state_name = (
-                item.get("microrregiao", {})
-                .get("mesorregiao", {})
-                .get("UF", {})
-                .get("nome")
-            )
-            if state and state_name:
-                yield Location(
-                    **{
-                        "country": "BR",
-                        "stateName": item["microrregiao"]["mesorregiao"]["UF"]["nome"],
-                        "state": item["microrregiao"]["mesorregiao"]["UF"]["sigla"],
-                        "cityName": item["nome"],
-                        "coordinates": None,
-                    }
-                )
+            city = self._parse_city(item)
+            if city:
+                yield city
 
     async def get_coordinates(self, location: Location) -> Location:
         """
@@ -105,4 +170,4 @@ class IBGEProvider(ILocationProvider):
         Esta função não é implementada no IBGE Provider, pois a API do IBGE
         não fornece coordenadas geográficas, apenas nomes e códigos.
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
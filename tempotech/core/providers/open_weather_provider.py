@@ -2,35 +2,42 @@
 Módulo do provedor de clima e geocodificação OpenWeather.
 
 Este provedor implementa a interface `ILocationProvider` para buscar
-coordenadas geográficas a partir da API de geocodificação do OpenWeatherMap.
-Ele é o provedor de coordenadas do projeto.
+coordenadas geográficas a partir da API de geocodificação do OpenWeatherMap,
+e a interface `IWeatherProvider` para buscar o clima atual das cidades.
+Ele é o provedor de coordenadas e de clima do projeto.
 """
 
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
-import aiohttp
-
 from tempotech.core import config
 from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.providers.http_client import HttpClient
 from tempotech.core.schemas.location_schema import Coordinates, Location
-from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.schemas.weather_schema import Temperature, Weather
 
 
-class OpenWeatherProvider(ILocationProvider):
+class OpenWeatherProvider(ILocationProvider, IWeatherProvider):
     """
-    Provedor de localização que utiliza a API de geocodificação do OpenWeather.
+    Provedor de localização e de clima que utiliza as APIs do OpenWeather.
 
-    Fornece a funcionalidade de buscar coordenadas geográficas para uma
-    localização específica.
+    Fornece a funcionalidade de buscar coordenadas geográficas e o clima
+    atual para uma localização específica ou para várias de uma vez.
     """
 
-    GEOCODING_URL = "http://api.openweathermap.org/geo/1.0/direct?q={city_name},{state_code},{country_code}&limit={limit}&appid={API_key}"
+    GEOCODING_URL = "http://api.openweathermap.org/geo/1.0/direct"
+    CURRENT_WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
 
-    def __init__(self):
+    def __init__(self, http_client: HttpClient):
         """
         Inicializa o provedor do OpenWeather e define o país padrão.
+
+        Args:
+            http_client (HttpClient): O cliente HTTP compartilhado pelos provedores.
         """
         self.country = "BR"
+        self._http_client = http_client
 
     async def list_states(self) -> AsyncGenerator[Location, None]:
         """
@@ -58,20 +65,75 @@ class OpenWeatherProvider(ILocationProvider):
             location (Location): Um objeto Location com `city_name`, `state` e `country`.
 
         Returns:
-            Location: O objeto Location atualizado com as coordenadas de latitude e longitude.
+            Location: Uma cópia do objeto Location com as coordenadas de latitude e
+            longitude, ou sem coordenadas, se a cidade não for encontrada.
         """
-        url = (
-            self.GEOCODING_URL.replace("{city_name}", location.city_name)
-            .replace("{state_code}", location.state)
-            .replace("{country_code}", location.country)
-            .replace("{limit}", 1)
-            .replace("{API_key}", config.OPEN_WEATHER_API_KEY)
+        params = {
+            "q": f"{location.city_name},{location.state},{location.country}",
+            "limit": "1",
+            "appid": config.OPEN_WEATHER_API_KEY,
+        }
+        async with self._http_client.session.get(
+            self.GEOCODING_URL, params=params
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        if not data:
+            return location
+        return location.model_copy(
+            update={
+                "coordinates": Coordinates(
+                    latitude=data[0]["lat"], longitude=data[0]["lon"]
+                )
+            }
         )
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                data = await response.json()
-        location.coordinates = Coordinates(
-            latitude=data["lat"],
-            longitude=data["lon"],
+
+    async def get_current_weather(self, location: Location) -> Weather:
+        """
+        Obtém o clima atual de uma cidade usando a API de clima do OpenWeather.
+
+        A consulta é feita pelas coordenadas da cidade e, na falta delas, pelo
+        nome da cidade e do estado. O `timestamp_utc` do resultado é o momento
+        da medição informado pelo OpenWeather (`dt`) ou, na sua falta, o momento
+        da consulta, em UTC.
+
+        Args:
+            location (Location): A cidade, de preferência com coordenadas.
+
+        Returns:
+            Weather: O clima atual da cidade, em graus Celsius.
+        """
+        params = {"units": "metric", "appid": config.OPEN_WEATHER_API_KEY}
+        if location.coordinates is not None:
+            params["lat"] = str(location.coordinates.latitude)
+            params["lon"] = str(location.coordinates.longitude)
+        else:
+            params["q"] = f"{location.city_name},{location.state},{location.country}"
+        async with self._http_client.session.get(
+            self.CURRENT_WEATHER_URL, params=params
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return Weather(
+            **{
+                "cityName": location.city_name,
+                "state": location.state,
+                "country": location.country,
+                "temperature": Temperature(
+                    **{
+                        "current": data["main"]["temp"],
+                        "feelsLike": data["main"]["feels_like"],
+                        "min": data["main"]["temp_min"],
+                        "max": data["main"]["temp_max"],
+                        "unit": "celsius",
+                    }
+                ),
+                "humidity": data["main"]["humidity"],
+                "windSpeed": data["wind"]["speed"],
+                "timestampUtc": (
+                    datetime.fromtimestamp(data["dt"], timezone.utc)
+                    if "dt" in data
+                    else datetime.now(timezone.utc)
+                ),
+            }
         )
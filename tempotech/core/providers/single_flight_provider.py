@@ -0,0 +1,155 @@
+"""
+Módulo dos provedores com coalescência de chamadas (single-flight).
+
+Define decoradores para `ILocationProvider` e `IWeatherProvider` que agrupam
+chamadas concorrentes com os mesmos argumentos normalizados em uma única
+requisição ao provedor decorado, por processo.
+"""
+
+from typing import AsyncGenerator, Hashable
+
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.utils.single_flight import SingleFlight
+from tempotech.core.utils.text import normalize_text
+
+
+def _location_key(location: Location) -> Hashable:
+    """
+    Retorna a chave normalizada que identifica uma cidade nas chamadas aos provedores.
+
+    Args:
+        location (Location): A cidade consultada.
+
+    Returns:
+        Hashable: As coordenadas da cidade ou, na falta delas, o país, o estado e o
+        nome normalizado da cidade.
+    """
+    if location.coordinates is not None:
+        return (location.coordinates.latitude, location.coordinates.longitude)
+    return (
+        location.country,
+        location.state.upper(),
+        normalize_text(location.city_name or ""),
+    )
+
+
+class SingleFlightLocationProvider(ILocationProvider):
+    """
+    Provedor de localização que coalesce as chamadas concorrentes a outro provedor.
+
+    As listagens são materializadas uma única vez por grupo de chamadas
+    concorrentes e repassadas a cada uma delas.
+    """
+
+    def __init__(self, provider: ILocationProvider):
+        """
+        Inicializa o decorador com o provedor a ser protegido.
+
+        Args:
+            provider (ILocationProvider): O provedor de localização decorado.
+        """
+        self.country = provider.country
+        self.state_count = provider.state_count
+        self._provider = provider
+        self._single_flight = SingleFlight()
+
+    async def list_states(self) -> AsyncGenerator[Location, None]:
+        """
+        Lista todos os estados, através do provedor decorado.
+
+        Returns:
+            AsyncGenerator[Location, None]: Gerador de objetos Location para cada estado.
+        """
+        states = await self._single_flight.do(
+            ("states",),
+            lambda: self._collect(self._provider.list_states()),
+        )
+        for state in states:
+            yield state
+
+    async def list_cities_by_state(self, state: str) -> AsyncGenerator[Location, None]:
+        """
+        Lista todas as cidades de um estado, através do provedor decorado.
+
+        Args:
+            state (str): A sigla do estado (ex: "SC").
+
+        Returns:
+            AsyncGenerator[Location, None]: Gerador de objetos Location para cada cidade do estado.
+        """
+        cities = await self._single_flight.do(
+            ("cities", state.upper()),
+            lambda: self._collect(self._provider.list_cities_by_state(state)),
+        )
+        for city in cities:
+            yield city
+
+    async def get_coordinates(self, location: Location) -> Location:
+        """
+        Obtém as coordenadas de uma localização, através do provedor decorado.
+
+        Args:
+            location (Location): O objeto Location contendo as informações da cidade.
+
+        Returns:
+            Location: O objeto Location com as coordenadas.
+        """
+        return await self._single_flight.do(
+            ("coordinates", _location_key(location)),
+            lambda: self._provider.get_coordinates(location),
+        )
+
+    @staticmethod
+    async def _collect(items: AsyncGenerator[Location, None]) -> list[Location]:
+        """
+        Consome um gerador assíncrono de localizações.
+
+        Args:
+            items (AsyncGenerator[Location, None]): O gerador a ser consumido.
+
+        Returns:
+            list[Location]: Os itens produzidos pelo gerador.
+        """
+        return [item async for item in items]
+
+
+class SingleFlightWeatherProvider(IWeatherProvider):
+    """
+    Provedor de clima que coalesce as chamadas concorrentes a outro provedor.
+
+    Consultas em lote são divididas por cidade pela implementação padrão de
+    `get_current_weather_many`, de forma que uma cidade consultada ao mesmo tempo
+    por uma requisição individual e por um lote gera uma única requisição ao
+    provedor decorado.
+    """
+
+    def __init__(self, provider: IWeatherProvider, batch_concurrency: int = 10):
+        """
+        Inicializa o decorador com o provedor a ser protegido.
+
+        Args:
+            provider (IWeatherProvider): O provedor de clima decorado.
+            batch_concurrency (int): Quantidade máxima de requisições simultâneas em
+                `get_current_weather_many`.
+        """
+        self.batch_concurrency = batch_concurrency
+        self._provider = provider
+        self._single_flight = SingleFlight()
+
+    async def get_current_weather(self, location: Location) -> Weather:
+        """
+        Obtém o clima atual de uma localização, através do provedor decorado.
+
+        Args:
+            location (Location): A cidade, de preferência com coordenadas.
+
+        Returns:
+            Weather: Um objeto contendo os dados de clima atuais.
+        """
+        return await self._single_flight.do(
+            _location_key(location),
+            lambda: self._provider.get_current_weather(location),
+        )
@@ -37,6 +37,11 @@ class Location(BaseModel):
     as coordenadas.
     """
 
+    id: Optional[int] = Field(
+        description="The internal identifier of the location. Not exposed by the API.",
+        default=None,
+        exclude=True,
+    )
     country: Literal["BR"]
     state: str
     state_name: str = Field(alias="stateName")
@@ -44,3 +49,45 @@ class Location(BaseModel):
     coordinates: Optional[Coordinates] = Field(
         description="The geographical coordinates of the city.", default=None
     )
+
+
+class LocationMatch(BaseModel):
+    """
+    Esquema de dados para um candidato da resolução de nomes de cidades.
+
+    Associa uma localização à pontuação de similaridade entre o nome
+    pesquisado e o nome da cidade.
+    """
+
+    location: Location
+    score: float = Field(
+        description="The similarity between the searched name and the city name, from 0 to 1.",
+        ge=0,
+        le=1,
+    )
+
+
+class CitySearchParams(BaseModel):
+    """
+    Esquema de dados para os parâmetros da busca paginada de cidades de um estado.
+
+    Agrupa os parâmetros da URL da listagem de cidades, com os mesmos nomes e
+    valores padrão com que são informados na requisição.
+    """
+
+    order_by: Optional[Literal["state_name", "city_name"]] = Field(
+        default=None, description="The column used to sort the cities."
+    )
+    search_by: Optional[Literal["country", "state", "state_name", "city_name"]] = Field(
+        default=None, description="The column used to filter the cities."
+    )
+    search_value: Optional[str] = Field(
+        default=None, description="The value searched in the `search_by` column."
+    )
+    page: int = Field(default=1, description="The page number.")
+    page_size: int = Field(default=10, description="The number of cities per page.")
+    cursor: Optional[str] = Field(
+        default=None,
+        description="The opaque cursor returned in `nextCursor`. When informed, "
+        "the cities are paginated by key instead of by page number.",
+    )
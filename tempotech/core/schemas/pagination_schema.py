@@ -7,13 +7,81 @@ qualquer tipo de objeto, como, por exemplo, a lista de cidades ou
 o histórico de consultas de clima.
 """
 
-from typing import Generic, TypeVar
+import base64
+import binascii
+import json
+from typing import Generic, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 T = TypeVar("T")
 
 
+class Cursor(BaseModel):
+    """
+    Esquema de dados para o cursor da paginação por chave (keyset).
+
+    Representa a posição do último item de uma página: o valor da coluna de
+    ordenação e o identificador do registro, usado como critério de desempate.
+    O cursor é trafegado para o cliente como um token opaco.
+    """
+
+    value: Optional[Union[str, int, float]] = Field(
+        description="The value of the ordering column of the last item of the page."
+    )
+    id: int = Field(description="The identifier of the last item of the page.")
+
+    def encode(self) -> str:
+        """
+        Codifica o cursor em um token opaco, seguro para uso em URLs.
+
+        Returns:
+            str: O token que representa o cursor.
+        """
+        raw = json.dumps([self.value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """
+        Decodifica um token gerado por `encode`.
+
+        Args:
+            token (str): O token opaco recebido do cliente.
+
+        Returns:
+            Cursor: O cursor representado pelo token.
+
+        Raises:
+            ValueError: Se o token não for um cursor válido.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            value, id_ = json.loads(raw)
+            return cls(value=value, id=id_)
+        except (binascii.Error, ValueError, TypeError, ValidationError) as error:
+            raise ValueError("Invalid pagination cursor.") from error
+
+
+class PageWindow(BaseModel):
+    """
+    Esquema de dados para a janela de resultados de uma busca paginada.
+
+    A janela é definida por deslocamento (`offset`) ou por chave (`after`), a
+    partir do cursor do último item da página anterior.
+    """
+
+    offset: Optional[int] = Field(
+        default=None, description="The number of results skipped."
+    )
+    limit: Optional[int] = Field(
+        default=None, description="The maximum number of results returned."
+    )
+    after: Optional[Cursor] = Field(
+        default=None, description="The cursor of the last item of the previous page."
+    )
+
+
 class Pagination(BaseModel, Generic[T]):
     """
     Esquema de dados para uma resposta paginada.
@@ -35,6 +103,12 @@ class Pagination(BaseModel, Generic[T]):
         description="The URL for the previous page of results. It will be an empty string if there's no previous page.",
         alias="previusPage",
     )
+    next_cursor: Optional[str] = Field(
+        description="An opaque cursor for the next page of results, to be sent back in the `cursor` "
+        + "parameter. It will be null if there's no next page.",
+        alias="nextCursor",
+        default=None,
+    )
     items_count: int = Field(
         description="The number of items on the current page.",
         alias="itemsCount",
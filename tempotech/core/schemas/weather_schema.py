@@ -6,40 +6,49 @@ como temperatura e dados meteorológicos completos. Esses esquemas são
 usados para validação de dados e para tipagem das respostas da API.
 """
 
-from datetime import datetime
-from typing import Annotated, Literal, TypeAlias
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Literal, Optional, TypeAlias
 
 from pydantic import AfterValidator, BaseModel, Field
 
+MAX_CLOCK_SKEW = timedelta(minutes=1)
+"""
+Diferença máxima tolerada entre o relógio do provedor de clima e o da aplicação.
+"""
+
 
-def ensure_future_datetime(d: datetime) -> datetime:
+def ensure_utc_datetime(d: datetime) -> datetime:
     """
-    Função de validação para garantir que um datetime está no futuro.
+    Função de validação para garantir que um datetime está em UTC e não é futuro.
 
     Esta função é usada como um `AfterValidator` para assegurar que o
-    timestamp de recuperação dos dados de clima seja sempre posterior ao
-    momento da validação.
+    timestamp de recuperação dos dados de clima seja um instante já ocorrido,
+    comparado ao momento atual em UTC, independentemente do fuso horário do
+    servidor. Datetimes sem fuso horário são interpretados como UTC.
 
     Args:
         d (datetime): O objeto datetime a ser validado.
 
     Returns:
-        datetime: O mesmo objeto datetime se a validação for bem-sucedida.
+        datetime: O mesmo instante, com o fuso horário UTC.
 
     Raises:
-        AssertionError: Se o datetime não for futuro.
+        AssertionError: Se o datetime for posterior ao momento atual, além de `MAX_CLOCK_SKEW`.
     """
-    now = datetime.now()
-    assert d > now
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    else:
+        d = d.astimezone(timezone.utc)
+    assert d <= datetime.now(timezone.utc) + MAX_CLOCK_SKEW
     return d
 
 
-FutureDatetime: TypeAlias = Annotated[datetime, AfterValidator(ensure_future_datetime)]
+UtcDatetime: TypeAlias = Annotated[datetime, AfterValidator(ensure_utc_datetime)]
 """
-Type alias para um campo de datetime que deve ser no futuro.
+Type alias para um campo de datetime em UTC que não pode estar no futuro.
 
 Utiliza `Annotated` e `AfterValidator` para aplicar a validação
-`ensure_future_datetime` automaticamente.
+`ensure_utc_datetime` automaticamente.
 """
 
 
@@ -66,7 +75,7 @@ class Weather(BaseModel):
     Esquema de dados para informações completas de clima.
 
     Representa um conjunto de dados meteorológicos para uma cidade específica,
-    incluindo nome da cidade, país, dados de temperatura, umidade, velocidade
+    incluindo nome da cidade, estado, país, dados de temperatura, umidade, velocidade
     do vento e um timestamp de recuperação.
     """
 
@@ -76,13 +85,33 @@ class Weather(BaseModel):
         description="The name of the city.",
         alias="cityName",
     )
+    state: str = Field(
+        min_length=2, max_length=2, description="The state abbreviation of the city."
+    )
     country: Literal["BR"] = Field(description="The country code of the city.")
     temperature: Temperature = Field(description="The temperature data for the city.")
     humidity: int = Field(ge=0, le=100, description="The percentage of humidity.")
     wind_speed: float = Field(
         ge=0, description="The wind speed in meters per second.", alias="windSpeed"
     )
-    timestamp_utc: FutureDatetime = Field(
+    timestamp_utc: UtcDatetime = Field(
         description="The UTC timestamp of when the weather data was retrieved.",
         alias="timestampUtc",
     )
+
+
+class WeatherBatchItem(BaseModel):
+    """
+    Esquema de dados para o resultado de uma cidade na consulta de várias cidades.
+
+    Contém o clima da cidade ou, se ele não pôde ser obtido, a descrição do
+    erro, de forma que a falha de uma cidade não invalida as demais.
+    """
+
+    query: str = Field(description="The city name as informed in the request.")
+    weather: Optional[Weather] = Field(
+        default=None, description="The current weather of the city, if available."
+    )
+    error: Optional[str] = Field(
+        default=None, description="The reason the weather is not available."
+    )
@@ -0,0 +1,52 @@
+"""
+Módulo do caso de uso para autocompletar nomes de cidades.
+
+Este módulo define a lógica de negócio para sugerir cidades a partir do
+início de seu nome, consultando apenas o catálogo de localizações em memória.
+"""
+
+from typing import Optional
+
+from tempotech.core.interfaces.database_repository import ILocationCatalog
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.schemas.location_schema import Location
+
+
+class AutocompleteCity(IUseCase[list[Location]]):
+    """
+    Caso de uso para sugerir cidades cujo nome começa com um prefixo.
+
+    A busca ignora maiúsculas, acentos e pontuação, e pode ser restrita a um estado.
+    """
+
+    def __init__(
+        self,
+        location_catalog: ILocationCatalog,
+        query: str,
+        state: Optional[str] = None,
+        limit: int = 10,
+    ):
+        """
+        Inicializa o caso de uso com o catálogo e os parâmetros de busca.
+
+        Args:
+            location_catalog (ILocationCatalog): O catálogo de localizações em memória.
+            query (str): O início do nome da cidade.
+            state (Optional[str]): A abreviação do estado. Se omitido, busca em todo o país.
+            limit (int): O número máximo de sugestões.
+        """
+        self._location_catalog = location_catalog
+        self._query = query
+        self._state = state
+        self._limit = limit
+
+    async def execute(self) -> list[Location]:
+        """
+        Executa a busca de sugestões no catálogo.
+
+        Returns:
+            list[Location]: As cidades encontradas, em ordem alfabética.
+        """
+        return await self._location_catalog.autocomplete(
+            self._query, state=self._state, limit=self._limit
+        )
@@ -0,0 +1,98 @@
+"""
+Módulo do caso de uso para preencher as coordenadas das cidades.
+
+Este módulo define a lógica para geocodificar, em lote, todas as cidades do
+banco de dados que ainda não possuem coordenadas, de forma que as consultas de
+clima não precisem chamar o provedor de geocodificação.
+"""
+
+import asyncio
+from functools import partial
+from typing import Optional
+
+from loguru import logger
+
+from tempotech.core.interfaces.database_repository import (
+    ILocationCatalog,
+    ILocationRepository,
+)
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.utils.concurrency import bounded_gather
+
+
+class BackfillCoordinates(IUseCase[int]):
+    """
+    Caso de uso para geocodificar as cidades sem coordenadas.
+
+    As chamadas ao provedor são feitas de forma concorrente, com paralelismo
+    limitado, e a falha de uma cidade não interrompe as demais. Cidades que o
+    provedor não encontrar permanecem sem coordenadas.
+    """
+
+    def __init__(
+        self,
+        location_db: ILocationRepository,
+        coordinate_provider: ILocationProvider,
+        location_catalog: Optional[ILocationCatalog] = None,
+        max_concurrency: int = 5,
+    ):
+        """
+        Inicializa o caso de uso com o repositório, o provedor e o catálogo.
+
+        Args:
+            location_db (ILocationRepository): O repositório de onde as cidades são lidas e atualizadas.
+            coordinate_provider (ILocationProvider): O provedor de geocodificação.
+            location_catalog (Optional[ILocationCatalog]): O catálogo a ser atualizado, se houver.
+            max_concurrency (int): Quantidade máxima de chamadas simultâneas ao provedor.
+        """
+        self._location_db = location_db
+        self._coordinate_provider = coordinate_provider
+        self._location_catalog = location_catalog
+        self._max_concurrency = max_concurrency
+
+    async def execute(self) -> int:
+        """
+        Executa o preenchimento das coordenadas.
+
+        Returns:
+            int: A quantidade de cidades que receberam coordenadas.
+        """
+        pending = [
+            location
+            for location in await self._location_db.search()
+            if location.coordinates is None and location.city_name
+        ]
+        db_lock = asyncio.Lock()
+        results = await bounded_gather(
+            partial(self._backfill, db_lock=db_lock),
+            pending,
+            self._max_concurrency,
+            describe=lambda location: (
+                f"Coordinates backfill for {location.city_name}/{location.state}"
+            ),
+        )
+        updated = sum(1 for result in results if result)
+        logger.info(f"Coordinates backfill updated {updated}/{len(pending)} cities")
+        return updated
+
+    async def _backfill(self, location: Location, db_lock: asyncio.Lock) -> bool:
+        """
+        Geocodifica uma cidade e grava as coordenadas obtidas.
+
+        Args:
+            location (Location): A cidade sem coordenadas.
+            db_lock (asyncio.Lock): Trava que serializa o uso da sessão do banco de dados.
+
+        Returns:
+            bool: `True` se a cidade recebeu coordenadas, `False` caso contrário.
+        """
+        located = await self._coordinate_provider.get_coordinates(location)
+        if located.coordinates is None:
+            return False
+        async with db_lock:
+            await self._location_db.update(located, located.id)
+        if self._location_catalog is not None and self._location_catalog.loaded:
+            await self._location_catalog.update(located, located.id)
+        return True
@@ -6,10 +6,17 @@ com dados de um provedor externo. Ele verifica se os dados já existem no
 banco e os insere caso não existam.
 """
 
+import asyncio
+from functools import partial
+
+from loguru import logger
+
 from tempotech.core.interfaces.database_repository import IDefaultRepository
 from tempotech.core.interfaces.location_provider import ILocationProvider
 from tempotech.core.interfaces.use_case import IUseCase
 from tempotech.core.schemas.location_schema import Location
+from tempotech.core.schemas.pagination_schema import PageWindow
+from tempotech.core.utils.concurrency import bounded_gather
 
 
 class CreateLocationUseCase(IUseCase[None]):
@@ -17,13 +24,22 @@ class CreateLocationUseCase(IUseCase[None]):
     Caso de uso para criar registros de localização no banco de dados.
 
     Orquestra a busca de estados e cidades de um provedor externo e, se não
-    existirem no banco de dados local, os insere.
+    existirem no banco de dados local, os insere. Os estados são processados
+    de forma concorrente, com paralelismo limitado, e a falha de um estado
+    não interrompe a carga dos demais.
+    """
+
+    RETRY_BACKOFF_SECONDS = 1.0
+    """
+    Espera base, em segundos, entre tentativas de um mesmo estado. Dobra a cada nova tentativa.
     """
 
     def __init__(
         self,
         location_db: IDefaultRepository[Location],
         location_provider: ILocationProvider,
+        max_concurrency: int = 5,
+        max_retries: int = 3,
     ):
         """
         Inicializa o caso de uso com o repositório de banco de dados e o provedor de localização.
@@ -31,29 +47,88 @@ class CreateLocationUseCase(IUseCase[None]):
         Args:
             location_db (IDefaultRepository[Location]): O repositório de banco de dados para persistir os dados.
             location_provider (ILocationProvider): O provedor de localização de onde os dados serão obtidos.
+            max_concurrency (int): Quantidade máxima de estados processados ao mesmo tempo.
+            max_retries (int): Quantidade máxima de tentativas por estado.
         """
         self._location_db = location_db
         self._location_provider = location_provider
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
 
     async def execute(self) -> None:
         """
         Executa a lógica de criação de dados de localização.
 
-        Busca os estados do provedor, verifica a existência no banco de dados
-        e, se necessário, busca as cidades do estado e as insere.
+        Busca os estados do provedor e agenda, de forma concorrente, a carga de
+        cada um deles. Estados que falharem após todas as tentativas são
+        registrados no log, sem abortar a carga dos demais.
+        """
+        states = [state async for state in self._location_provider.list_states()]
+        db_lock = asyncio.Lock()
+        results = await bounded_gather(
+            partial(self._seed_state, db_lock=db_lock),
+            states,
+            self._max_concurrency,
+            describe=lambda state: f"Location seed for state {state.state}",
+        )
+        failed = [state.state for state, done in zip(states, results) if not done]
+        if failed:
+            logger.error(f"Location seed failed for states: {', '.join(failed)}")
+
+    async def _seed_state(self, state: Location, db_lock: asyncio.Lock) -> bool:
+        """
+        Carrega um estado, tentando novamente após as falhas.
+
+        Args:
+            state (Location): O estado a ser carregado.
+            db_lock (asyncio.Lock): Trava que serializa o uso da sessão do banco de dados.
+
+        Returns:
+            bool: `True` se o estado foi carregado ou já existia.
+
+        Raises:
+            Exception: A falha da última tentativa.
+        """
+        for attempt in range(1, self._max_retries):
+            try:
+                await self._create_state(state, db_lock)
+                return True
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    f"Location seed for state {state.state} failed "
+                    f"(attempt {attempt}/{self._max_retries}): {error!r}"
+                )
+                await asyncio.sleep(self.RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        await self._create_state(state, db_lock)
+        return True
+
+    async def _create_state(self, state: Location, db_lock: asyncio.Lock) -> None:
+        """
+        Verifica se o estado já existe no banco de dados e, se não existir,
+        busca suas cidades no provedor e as insere em massa.
+
+        A sessão do banco de dados não suporta operações concorrentes, por isso
+        o acesso ao repositório é serializado por `db_lock`, enquanto as
+        chamadas ao provedor ocorrem em paralelo.
+
+        Args:
+            state (Location): O estado a ser carregado.
+            db_lock (asyncio.Lock): Trava que serializa o uso da sessão do banco de dados.
         """
-        provider_data = self._location_provider.list_states()
-        async for state in provider_data:
+        async with db_lock:
             local_data = await self._location_db.search(
                 filters={
                     "country": self._location_provider.country,
                     "state": state.state,
                     "state_name": state.state_name,
                 },
-                limit=1,
+                page=PageWindow(limit=1),
             )
-            if len(local_data) == 0:
-                async for city in self._location_provider.list_cities_by_state(
-                    state.state
-                ):
-                    await self._location_db.create(city)
+        if len(local_data) > 0:
+            return
+        cities = [
+            city
+            async for city in self._location_provider.list_cities_by_state(state.state)
+        ]
+        async with db_lock:
+            await self._location_db.create_many(cities)
@@ -0,0 +1,79 @@
+"""
+Módulo do caso de uso para exportar cidades.
+
+Este módulo define a lógica de negócio para exportar todas as cidades de um
+estado, ou do país inteiro, no formato NDJSON (um objeto JSON por linha). O
+conteúdo é produzido de forma incremental, a partir de um cursor no banco de
+dados, sem carregar todo o resultado em memória.
+"""
+
+from contextlib import AbstractAsyncContextManager
+from typing import AsyncGenerator, Callable, Literal, Optional
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.interfaces.use_case import IUseCase
+
+
+class ExportCity(IUseCase[AsyncGenerator[bytes, None]]):
+    """
+    Caso de uso para exportar cidades em NDJSON.
+
+    O repositório é aberto pelo próprio gerador, pois o conteúdo é consumido
+    enquanto a resposta é enviada, depois que as dependências da requisição
+    já foram encerradas.
+    """
+
+    CHUNK_SIZE = 500
+    """
+    Quantidade de linhas agrupadas em cada bloco de bytes produzido.
+    """
+
+    def __init__(
+        self,
+        location_db_scope: Callable[
+            [], AbstractAsyncContextManager[ILocationRepository]
+        ],
+        state: Optional[str] = None,
+        order_by: Optional[Literal["state_name", "city_name"]] = None,
+    ):
+        """
+        Inicializa o caso de uso com a fábrica do repositório e os filtros.
+
+        Args:
+            location_db_scope (Callable[[], AbstractAsyncContextManager[ILocationRepository]]):
+                Fábrica de um gerenciador de contexto que fornece o repositório de localização.
+            state (Optional[str]): A abreviação do estado. Se omitido, exporta todo o país.
+            order_by (Optional[Literal["state_name", "city_name"]]): Critério de ordenação.
+        """
+        self._location_db_scope = location_db_scope
+        self._state = state
+        self._order_by = order_by
+
+    async def execute(self) -> AsyncGenerator[bytes, None]:
+        """
+        Executa a exportação das cidades.
+
+        Returns:
+            AsyncGenerator[bytes, None]: Gerador assíncrono de blocos de linhas NDJSON.
+        """
+        return self._export()
+
+    async def _export(self) -> AsyncGenerator[bytes, None]:
+        """
+        Produz as linhas NDJSON em blocos de até `CHUNK_SIZE` cidades.
+
+        Returns:
+            AsyncGenerator[bytes, None]: Gerador assíncrono de blocos de linhas NDJSON.
+        """
+        filters = {"state": self._state} if self._state else None
+        lines: list[bytes] = []
+        async with self._location_db_scope() as location_db:
+            async for location in location_db.stream(
+                filters=filters, order_by=self._order_by
+            ):
+                lines.append(location.model_dump_json(by_alias=True).encode())
+                if len(lines) == self.CHUNK_SIZE:
+                    yield b"\n".join(lines) + b"\n"
+                    lines = []
+        if lines:
+            yield b"\n".join(lines) + b"\n"
@@ -0,0 +1,72 @@
+"""
+Módulo do caso de uso para obter as coordenadas de uma cidade.
+
+Este módulo define a lógica de negócio para garantir que uma cidade possua
+coordenadas geográficas. As coordenadas são buscadas no provedor de
+geocodificação apenas uma vez por cidade: o resultado é persistido no banco
+de dados e refletido no catálogo em memória, de onde é lido nas próximas vezes.
+"""
+
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Optional
+
+from tempotech.core.interfaces.database_repository import (
+    ILocationCatalog,
+    ILocationRepository,
+)
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.schemas.location_schema import Location
+
+
+class GetCoordinates(IUseCase[Location]):
+    """
+    Caso de uso para obter as coordenadas de uma cidade.
+
+    Se a cidade já possuir coordenadas, ela é retornada sem nenhuma chamada
+    externa. Caso contrário, as coordenadas são obtidas do provedor e gravadas
+    de volta no banco de dados e no catálogo.
+    """
+
+    def __init__(
+        self,
+        location: Location,
+        location_db_scope: Callable[
+            [], AbstractAsyncContextManager[ILocationRepository]
+        ],
+        coordinate_provider: ILocationProvider,
+        location_catalog: Optional[ILocationCatalog] = None,
+    ):
+        """
+        Inicializa o caso de uso com a cidade e as dependências de persistência.
+
+        Args:
+            location (Location): A cidade, normalmente obtida do catálogo.
+            location_db_scope (Callable[[], AbstractAsyncContextManager[ILocationRepository]]):
+                Fábrica de um gerenciador de contexto que fornece o repositório de localização.
+                A sessão só é aberta quando há coordenadas a serem gravadas.
+            coordinate_provider (ILocationProvider): O provedor de geocodificação.
+            location_catalog (Optional[ILocationCatalog]): O catálogo a ser atualizado, se houver.
+        """
+        self._location = location
+        self._location_db_scope = location_db_scope
+        self._coordinate_provider = coordinate_provider
+        self._location_catalog = location_catalog
+
+    async def execute(self) -> Location:
+        """
+        Executa a obtenção das coordenadas da cidade.
+
+        Returns:
+            Location: A cidade com coordenadas, ou sem elas, se o provedor não a encontrar.
+        """
+        if self._location.coordinates is not None:
+            return self._location
+        location = await self._coordinate_provider.get_coordinates(self._location)
+        if location.coordinates is None or location.id is None:
+            return location
+        async with self._location_db_scope() as location_db:
+            await location_db.update(location, location.id)
+        if self._location_catalog is not None and self._location_catalog.loaded:
+            await self._location_catalog.update(location, location.id)
+        return location
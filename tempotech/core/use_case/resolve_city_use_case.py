@@ -0,0 +1,42 @@
+"""
+Módulo do caso de uso para resolver nomes de cidades.
+
+Este módulo define a lógica de negócio para traduzir um nome de cidade
+digitado livremente, com erros de digitação, sem acentos ou acompanhado da
+sigla do estado, para as cidades conhecidas pelo catálogo de localizações.
+"""
+
+from tempotech.core.interfaces.database_repository import ILocationCatalog
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.schemas.location_schema import LocationMatch
+
+
+class ResolveCity(IUseCase[list[LocationMatch]]):
+    """
+    Caso de uso para resolver um nome de cidade em candidatos ranqueados.
+
+    A resolução é feita no catálogo em memória, sem acessar o banco de dados,
+    e pode ser executada a cada requisição de clima.
+    """
+
+    def __init__(self, location_catalog: ILocationCatalog, query: str, limit: int = 5):
+        """
+        Inicializa o caso de uso com o catálogo e o nome pesquisado.
+
+        Args:
+            location_catalog (ILocationCatalog): O catálogo de localizações em memória.
+            query (str): O nome da cidade, opcionalmente seguido da sigla do estado.
+            limit (int): O número máximo de candidatos.
+        """
+        self._location_catalog = location_catalog
+        self._query = query
+        self._limit = limit
+
+    async def execute(self) -> list[LocationMatch]:
+        """
+        Executa a resolução do nome no catálogo.
+
+        Returns:
+            list[LocationMatch]: Os candidatos, do mais para o menos provável.
+        """
+        return await self._location_catalog.resolve(self._query, limit=self._limit)
@@ -6,12 +6,12 @@ específico, com suporte a ordenação e paginação. Ele encapsula a orquestra
 entre o repositório de banco de dados e a resposta da aplicação.
 """
 
-from typing import Literal, Optional
+from typing import Optional
 
 from tempotech.core.interfaces.database_repository import IDefaultRepository
 from tempotech.core.interfaces.use_case import IUseCase
-from tempotech.core.schemas.location_schema import Location
-from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.schemas.location_schema import CitySearchParams, Location
+from tempotech.core.schemas.pagination_schema import Cursor, PageWindow, Pagination
 
 
 class SearchCity(IUseCase[Pagination[Location]]):
@@ -26,11 +26,8 @@ class SearchCity(IUseCase[Pagination[Location]]):
         self,
         location_db: IDefaultRepository[Location],
         state: str,
-        order_by: Optional[Literal["state_name", "city_name"]] = None,
-        search_by: Optional[Literal["city_name"]] = None,
-        search_value: Optional[str] = None,
-        page: int = 1,
-        page_size: int = 10,
+        params: CitySearchParams,
+        cursor: Optional[Cursor] = None,
     ):
         """
         Inicializa o caso de uso com o repositório e os parâmetros de busca.
@@ -38,47 +35,75 @@ class SearchCity(IUseCase[Pagination[Location]]):
         Args:
             location_db (IDefaultRepository[Location]): O repositório de banco de dados para a busca.
             state (str): A abreviação do estado a ser pesquisado.
-            order_by (Optional[Literal["state_name", "city_name"]]): Critério de ordenação.
-            search_by (Optional[Literal["city_name"]]): Campo para a busca.
-            search_value (Optional[str]): Valor a ser buscado no campo especificado.
-            page (int): O número da página atual.
-            page_size (int): O número de itens por página.
+            params (CitySearchParams): Os parâmetros de filtro, ordenação e paginação.
+            cursor (Optional[Cursor]): O cursor de `params.cursor`, já decodificado. Quando
+                informado, a paginação é feita por chave (keyset) em vez de por número de página.
         """
         self._location_db = location_db
         self._state = state
-        self._order_by = order_by
-        self._search_by = search_by
-        self._search_value = search_value
-        self._page = page
-        self._page_size = page_size
+        self._params = params
+        self._cursor = cursor
 
     async def execute(self) -> Pagination[Location]:
         """
         Executa a busca de cidades no banco de dados e retorna os resultados paginados.
 
         Monta os parâmetros para a consulta ao banco de dados e formata o resultado
-        em um objeto `Pagination`.
+        em um objeto `Pagination`, incluindo o cursor para a próxima página.
 
         Returns:
             Pagination[Location]: Um objeto de paginação contendo a lista de cidades e os metadados.
         """
-        params = {"filters": {"state": self._state}}
-        if self._search_by and self._search_value:
-            params["filters"][self._search_by] = self._search_value
-        if self._order_by:
-            params["order_by"] = self._order_by
-        if self._page:
-            params["offset"] = (self._page - 1) * self._page_size
-            params["limit"] = self._page_size
-        query = await self._location_db.search(**params)
+        params = self._params
+        filters = {"state": self._state}
+        if params.search_by and params.search_value:
+            filters[params.search_by] = params.search_value
+        query = await self._location_db.search(
+            filters=filters, order_by=params.order_by, page=self._page_window()
+        )
         return Pagination(
             **{
-                "actualPage": self._page,
+                "actualPage": params.page,
                 "nextPage": (
-                    self._page + 1 if len(query) == self._page_size else self._page
+                    params.page + 1 if len(query) == params.page_size else params.page
                 ),
-                "previusPage": self._page - 1 if self._page >= 1 else 0,
+                "previusPage": params.page - 1 if params.page >= 1 else 0,
+                "nextCursor": self._next_cursor(query),
                 "itemsCount": len(query),
                 "items": query,
             }
         )
+
+    def _page_window(self) -> Optional[PageWindow]:
+        """
+        Monta a janela de resultados da página requisitada.
+
+        Returns:
+            Optional[PageWindow]: A janela por chave, se houver cursor, ou por
+            deslocamento, ou `None` para retornar todos os resultados.
+        """
+        if self._cursor is not None:
+            return PageWindow(after=self._cursor, limit=self._params.page_size)
+        if self._params.page:
+            return PageWindow(
+                offset=(self._params.page - 1) * self._params.page_size,
+                limit=self._params.page_size,
+            )
+        return None
+
+    def _next_cursor(self, query: list[Location]) -> Optional[str]:
+        """
+        Gera o cursor da próxima página a partir do último item retornado.
+
+        Args:
+            query (list[Location]): Os itens da página atual.
+
+        Returns:
+            Optional[str]: O cursor codificado, ou `None` se não houver próxima página.
+        """
+        if len(query) < self._params.page_size or query[-1].id is None:
+            return None
+        last = query[-1]
+        return Cursor(
+            value=getattr(last, self._params.order_by or "city_name"), id=last.id
+        ).encode()
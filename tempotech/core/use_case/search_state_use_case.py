@@ -1,10 +1,14 @@
 """
 Módulo do caso de uso para buscar estados.
 
-Este módulo define a lógica de negócio para buscar uma lista de estados
-usando um provedor de localização externo. Ele encapsula a orquestração
-entre o provedor e a resposta da aplicação.
+Este módulo define a lógica de negócio para buscar uma lista de estados.
+Os estados são lidos do banco de dados, populado por `CreateLocationUseCase`,
+e o provedor de localização externo é usado apenas enquanto o banco ainda
+não possui todos os estados, seja porque a carga inicial não terminou, seja
+porque a carga de algum estado falhou.
 """
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
 from tempotech.core.interfaces.location_provider import ILocationProvider
 from tempotech.core.interfaces.use_case import IUseCase
 from tempotech.core.schemas.location_schema import Location
@@ -14,26 +18,37 @@ class SearchState(IUseCase[list[Location]]):
     """
     Caso de uso para buscar e retornar uma lista de estados.
 
-    Orquestra a busca de estados através de um `ILocationProvider` e
-    retorna os resultados como uma lista de objetos `Location`.
+    Orquestra a busca de estados através de um `ILocationRepository` e,
+    caso o repositório ainda não possua todos os estados, de um `ILocationProvider`,
+    retornando os resultados como uma lista de objetos `Location`.
     """
+
     def __init__(
         self,
+        location_db: ILocationRepository,
         location_provider: ILocationProvider,
     ):
         """
-        Inicializa o caso de uso com um provedor de localização.
+        Inicializa o caso de uso com o repositório e o provedor de localização.
 
         Args:
-            location_provider (ILocationProvider): O provedor de dados de localização a ser utilizado.
+            location_db (ILocationRepository): O repositório de onde os estados são lidos.
+            location_provider (ILocationProvider): O provedor de dados de localização
+                usado enquanto o repositório não possui todos os estados.
         """
+        self._location_db = location_db
         self._location_provider = location_provider
 
     async def execute(self) -> list[Location]:
         """
-        Executa o caso de uso para obter todos os estados do provedor.
+        Executa o caso de uso para obter todos os estados.
 
         Returns:
             list[Location]: Uma lista de objetos `Location` representando os estados.
         """
-        return [item async for item in self._location_provider.list_states()]
\ No newline at end of file
+        states = await self._location_db.list_states(
+            country=self._location_provider.country
+        )
+        if states and len(states) >= (self._location_provider.state_count or 0):
+            return states
+        return [item async for item in self._location_provider.list_states()]
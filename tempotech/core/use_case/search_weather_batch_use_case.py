@@ -0,0 +1,86 @@
+"""
+Módulo do caso de uso para buscar o clima atual de várias cidades.
+
+Este módulo define a lógica de negócio para obter, em uma única consulta, o
+clima atual de várias cidades já resolvidas para registros conhecidos. As
+coordenadas das cidades são obtidas como em `SearchWeather` e as cidades são
+consultadas de uma vez no provedor de clima, que coalesce as cidades repetidas.
+A falha de uma cidade é descrita no seu próprio resultado, sem interromper as
+demais.
+"""
+
+from typing import Callable, Optional
+
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.utils.concurrency import bounded_gather
+
+CITY_NOT_FOUND = "City not found."
+"""
+Erro das cidades cujo nome não corresponde a nenhuma cidade do catálogo.
+"""
+CITY_AMBIGUOUS = "City name is ambiguous; add the state abbreviation."
+"""
+Erro das cidades cujo nome corresponde a cidades homônimas de estados diferentes.
+"""
+WEATHER_UNAVAILABLE = "Weather unavailable."
+"""
+Erro das cidades cujo clima não pôde ser obtido do provedor.
+"""
+
+
+class SearchWeatherBatch(IUseCase[list[Optional[Weather]]]):
+    """
+    Caso de uso para buscar o clima atual de várias cidades.
+
+    Obtém as coordenadas através de `GetCoordinates`, com paralelismo limitado,
+    e consulta o `IWeatherProvider` com todas as cidades de uma vez.
+    """
+
+    def __init__(
+        self,
+        locations: list[Location],
+        get_coordinates: Callable[[Location], IUseCase[Location]],
+        weather_provider: IWeatherProvider,
+        max_concurrency: int = 10,
+    ):
+        """
+        Inicializa o caso de uso com as cidades e os provedores.
+
+        Args:
+            locations (list[Location]): As cidades, normalmente obtidas do catálogo.
+            get_coordinates (Callable[[Location], IUseCase[Location]]): Fábrica do caso
+                de uso `GetCoordinates` de uma cidade, já com os seus repositórios e
+                o provedor de geocodificação.
+            weather_provider (IWeatherProvider): O provedor de clima.
+            max_concurrency (int): Quantidade máxima de cidades cujas coordenadas são
+                obtidas ao mesmo tempo.
+        """
+        self._locations = locations
+        self._get_coordinates = get_coordinates
+        self._weather_provider = weather_provider
+        self._max_concurrency = max_concurrency
+
+    async def execute(self) -> list[Optional[Weather]]:
+        """
+        Executa a busca do clima atual das cidades.
+
+        Returns:
+            list[Optional[Weather]]: O clima de cada cidade, na mesma ordem de
+            `locations`, ou `None` se não pôde ser obtido.
+        """
+        located = await bounded_gather(
+            lambda location: self._get_coordinates(location).execute(),
+            self._locations,
+            self._max_concurrency,
+            describe=lambda location: (
+                f"Coordinates for {location.city_name}/{location.state}"
+            ),
+        )
+        found = [location for location in located if location is not None]
+        weathers = iter(await self._weather_provider.get_current_weather_many(found))
+        return [
+            next(weathers) if location is not None else None for location in located
+        ]
@@ -0,0 +1,61 @@
+"""
+Módulo do caso de uso para buscar o clima atual de uma cidade.
+
+Este módulo define a lógica de negócio para obter o clima atual de uma cidade
+já resolvida para um registro conhecido. As coordenadas da cidade são lidas do
+catálogo ou do banco de dados e, apenas na primeira consulta, obtidas do
+provedor de geocodificação.
+"""
+
+from typing import Callable
+
+from tempotech.core.interfaces.use_case import IUseCase
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.schemas.weather_schema import Weather
+
+
+class SearchWeather(IUseCase[Weather]):
+    """
+    Caso de uso para buscar o clima atual de uma cidade.
+
+    Orquestra a obtenção das coordenadas, através de `GetCoordinates`, e a
+    consulta ao `IWeatherProvider`.
+    """
+
+    def __init__(
+        self,
+        location: Location,
+        get_coordinates: Callable[[Location], IUseCase[Location]],
+        weather_provider: IWeatherProvider,
+    ):
+        """
+        Inicializa o caso de uso com a cidade e os provedores.
+
+        Args:
+            location (Location): A cidade, normalmente obtida do catálogo.
+            get_coordinates (Callable[[Location], IUseCase[Location]]): Fábrica do caso
+                de uso `GetCoordinates` de uma cidade, já com os seus repositórios e
+                o provedor de geocodificação.
+            weather_provider (IWeatherProvider): O provedor de clima.
+        """
+        self._location = location
+        self._get_coordinates = get_coordinates
+        self._weather_provider = weather_provider
+
+    @property
+    def location(self) -> Location:
+        """
+        A cidade consultada, usada, por exemplo, para compor a chave do cache do clima.
+        """
+        return self._location
+
+    async def execute(self) -> Weather:
+        """
+        Executa a busca do clima atual da cidade.
+
+        Returns:
+            Weather: O clima atual da cidade.
+        """
+        location = await self._get_coordinates(self._location).execute()
+        return await self._weather_provider.get_current_weather(location)
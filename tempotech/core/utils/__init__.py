@@ -0,0 +1,6 @@
+"""
+Módulo de utilitários da aplicação.
+
+Reúne funções auxiliares, sem dependências externas, compartilhadas pelos
+casos de uso, repositórios e provedores.
+"""
@@ -0,0 +1,51 @@
+"""
+Módulo de execução concorrente com paralelismo limitado.
+
+Reúne o padrão de distribuir um mesmo trabalho por vários itens, limitando
+a quantidade de execuções simultâneas com um semáforo, sem que a falha de um
+item interrompa os demais. É usado, por exemplo, na carga inicial das
+localizações e no preenchimento das coordenadas das cidades.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_gather(
+    worker: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+    describe: Callable[[T], str],
+) -> list[Optional[R]]:
+    """
+    Executa o trabalho para cada item, com no máximo `max_concurrency` simultâneos.
+
+    As exceções de um item são registradas no log, com a descrição do item, e
+    não interrompem os demais.
+
+    Args:
+        worker (Callable[[T], Awaitable[R]]): O trabalho executado para cada item.
+        items (Iterable[T]): Os itens a serem processados.
+        max_concurrency (int): Quantidade máxima de itens processados ao mesmo tempo.
+        describe (Callable[[T], str]): Descreve um item nas mensagens de log.
+
+    Returns:
+        list[Optional[R]]: O resultado de cada item, na mesma ordem de `items`, ou
+        `None` para os itens cujo trabalho falhou.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: T) -> Optional[R]:
+        try:
+            async with semaphore:
+                return await worker(item)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.warning(f"{describe(item)} failed: {error!r}")
+            return None
+
+    return await asyncio.gather(*(run(item) for item in items))
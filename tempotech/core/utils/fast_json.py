@@ -0,0 +1,44 @@
+"""
+Módulo de serialização JSON compacta.
+
+Utiliza o `orjson`, quando instalado, e recorre ao módulo `json` da
+biblioteca padrão, com a mesma saída compacta em UTF-8, caso contrário.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializa um valor composto apenas por tipos JSON.
+
+    Args:
+        value (Any): O valor a ser serializado.
+
+    Returns:
+        bytes: O JSON compacto, em UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Desserializa um JSON.
+
+    Args:
+        data (Union[bytes, str]): O JSON a ser lido.
+
+    Returns:
+        Any: O valor lido.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,74 @@
+"""
+Módulo do mecanismo de coalescência de chamadas (single-flight).
+
+Quando várias corrotinas fazem a mesma chamada ao mesmo tempo, apenas a
+primeira é de fato executada, e as demais aguardam o seu resultado. Isso evita
+que a expiração de um item popular do cache dispare, em um mesmo processo, uma
+requisição ao provedor externo para cada requisição recebida.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave em uma única execução.
+
+    A execução compartilhada é protegida contra o cancelamento de quem a
+    aguarda: se uma requisição for cancelada, as demais continuam recebendo
+    o resultado. A chave é liberada assim que a execução termina, de forma que
+    chamadas posteriores executam novamente.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o mecanismo sem nenhuma chamada em andamento.
+        """
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de chamadas em andamento.
+        """
+        return len(self._calls)
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Executa a função ou aguarda a execução em andamento com a mesma chave.
+
+        Args:
+            key (Hashable): A chave que identifica a chamada, a partir de argumentos normalizados.
+            function (Callable[[], Awaitable[T]]): A função a ser executada, caso não
+                exista uma chamada em andamento com a mesma chave.
+
+        Returns:
+            T: O resultado da execução compartilhada.
+
+        Raises:
+            Exception: A mesma exceção levantada pela execução compartilhada.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(function())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """
+        Libera a chave de uma execução concluída.
+
+        A exceção da execução é consultada para que não seja reportada como não
+        tratada quando todos que a aguardavam foram cancelados.
+
+        Args:
+            key (Hashable): A chave da chamada.
+            future (asyncio.Future): A execução concluída.
+        """
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()
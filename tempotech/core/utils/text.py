@@ -0,0 +1,51 @@
+"""
+Módulo de utilitários para tratamento de texto.
+
+Define a normalização usada para comparar nomes de localizações digitados
+livremente pelo usuário com os nomes oficiais, ignorando maiúsculas, acentos,
+pontuação e espaços repetidos, e a forma usada para ordenar e filtrar nomes de
+forma idêntica no banco de dados e no catálogo em memória.
+"""
+
+import re
+import unicodedata
+
+_NON_WORD = re.compile(r"[^\w\s]")
+"""
+Expressão que identifica pontuação, substituída por espaços na normalização.
+"""
+
+
+def fold_text(value: str) -> str:
+    """
+    Converte um texto para minúsculas e remove os acentos, preservando a pontuação.
+
+    Equivale à expressão `f_unaccent(lower(...))` do PostgreSQL, usada nas
+    ordenações e nos filtros por nome. Exemplo: `"Sant'Ana do Livramento"` se
+    torna `"sant'ana do livramento"`.
+
+    Args:
+        value (str): O texto a ser convertido.
+
+    Returns:
+        str: O texto em minúsculas e sem acentos.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def normalize_text(value: str) -> str:
+    """
+    Normaliza um texto para comparações insensíveis a maiúsculas e acentos.
+
+    Exemplo: `"  Sant'Ana do   Livramento"` se torna `"sant ana do livramento"`.
+
+    Args:
+        value (str): O texto a ser normalizado.
+
+    Returns:
+        str: O texto em minúsculas, sem acentos, sem pontuação e com espaços simples.
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
@@ -0,0 +1,91 @@
+"""
+Testes de integração para o caso de uso `BackfillCoordinates`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`BackfillCoordinates`, o provedor de geocodificação `ILocationProvider` e o
+repositório `ILocationRepository`, utilizando mocks para as implementações
+concretas das interfaces.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.use_case.backfill_coordinates_use_case import (
+    BackfillCoordinates,
+)
+
+CITIES = [
+    Location(
+        id=1, country="BR", state="SC", stateName="Santa Catarina", cityName="Joinville"
+    ),
+    Location(
+        id=2, country="BR", state="SC", stateName="Santa Catarina", cityName="Blumenau"
+    ),
+    Location(
+        id=3,
+        country="BR",
+        state="SC",
+        stateName="Santa Catarina",
+        cityName="Itajaí",
+        coordinates=Coordinates(latitude=-26.9, longitude=-48.6),
+    ),
+]
+
+
+class TestBackfillCoordinatesIntegration:
+    """
+    Classe de testes de integração para o caso de uso `BackfillCoordinates`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_cidades_sem_coordenadas_entao_apenas_elas_sao_geocodificadas(
+        self,
+    ):
+        """
+        Verifica se apenas as cidades sem coordenadas são geocodificadas e gravadas.
+
+        Cenário:
+            Duas cidades não possuem coordenadas, e o provedor falha para uma delas.
+
+        Dado que:
+            - O repositório retorna três cidades, uma delas com coordenadas.
+            - O provedor falha para "Blumenau".
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - O provedor é chamado apenas para "Joinville" e "Blumenau".
+            - Apenas "Joinville" é atualizada no repositório.
+            - O caso de uso retorna 1.
+        """
+
+        # Dado que
+        async def get_coordinates(location: Location):
+            if location.city_name == "Blumenau":
+                raise ConnectionError("OpenWeather indisponível")
+            return location.model_copy(
+                update={"coordinates": Coordinates(latitude=-26.3, longitude=-48.8)}
+            )
+
+        provider = MagicMock(spec=ILocationProvider)
+        provider.get_coordinates = AsyncMock(side_effect=get_coordinates)
+        repository = MagicMock(spec=ILocationRepository)
+        repository.search = AsyncMock(return_value=CITIES)
+        repository.update = AsyncMock()
+        use_case = BackfillCoordinates(
+            location_db=repository, coordinate_provider=provider, max_concurrency=2
+        )
+
+        # Quando
+        updated = await use_case.execute()
+
+        # Então
+        assert updated == 1
+        assert sorted(
+            call.args[0].city_name for call in provider.get_coordinates.await_args_list
+        ) == ["Blumenau", "Joinville"]
+        repository.update.assert_awaited_once()
+        assert repository.update.await_args.args[1] == 1
@@ -0,0 +1,194 @@
+"""
+Testes de integração para o caso de uso `CreateLocationUseCase`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`CreateLocationUseCase`, o provedor de localização `ILocationProvider` e o
+repositório `IDefaultRepository`, utilizando mocks para as implementações
+concretas das interfaces.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import IDefaultRepository
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.schemas.pagination_schema import PageWindow
+from tempotech.core.use_case.create_location_use_case import CreateLocationUseCase
+
+STATES = [
+    Location(country="BR", state="SC", stateName="Santa Catarina"),
+    Location(country="BR", state="RJ", stateName="Rio de Janeiro"),
+]
+
+CITIES = {
+    "SC": [
+        Location(
+            country="BR", state="SC", stateName="Santa Catarina", cityName="Joinville"
+        ),
+        Location(
+            country="BR", state="SC", stateName="Santa Catarina", cityName="Blumenau"
+        ),
+    ],
+    "RJ": [
+        Location(
+            country="BR", state="RJ", stateName="Rio de Janeiro", cityName="Niterói"
+        ),
+    ],
+}
+
+
+async def _list_states():
+    for state in STATES:
+        yield state
+
+
+def _build_provider(list_cities_by_state) -> MagicMock:
+    provider = MagicMock(spec=ILocationProvider)
+    provider.country = "BR"
+    provider.list_states = _list_states
+    provider.list_cities_by_state = list_cities_by_state
+    return provider
+
+
+class TestCreateLocationUseCaseIntegration:
+    """
+    Classe de testes de integração para o caso de uso `CreateLocationUseCase`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _sem_espera_entre_tentativas(self, monkeypatch):
+        monkeypatch.setattr(CreateLocationUseCase, "RETRY_BACKOFF_SECONDS", 0)
+
+    @pytest.mark.asyncio
+    async def test_quando_estados_nao_existem_no_banco_entao_cidades_sao_inseridas_em_massa(
+        self,
+    ):
+        """
+        Verifica se as cidades de cada estado são inseridas em uma única carga.
+
+        Cenário:
+            O banco de dados está vazio e o provedor retorna dois estados.
+
+        Dado que:
+            - O repositório não encontra nenhum registro para os estados.
+            - O provedor retorna as cidades de cada estado.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - `create_many` é chamado uma vez por estado, com todas as suas cidades.
+            - `create` nunca é chamado.
+        """
+
+        # Dado que
+        async def list_cities_by_state(state: str):
+            for city in CITIES[state]:
+                yield city
+
+        repository = MagicMock(spec=IDefaultRepository)
+        repository.search = AsyncMock(return_value=[])
+        repository.create_many = AsyncMock()
+        use_case = CreateLocationUseCase(
+            location_db=repository,
+            location_provider=_build_provider(list_cities_by_state),
+            max_concurrency=2,
+        )
+
+        # Quando
+        await use_case.execute()
+
+        # Então
+        inserted = {
+            call.args[0][0].state: call.args[0]
+            for call in repository.create_many.await_args_list
+        }
+        assert inserted == CITIES
+        repository.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_quando_estado_ja_existe_no_banco_entao_cidades_nao_sao_buscadas(
+        self,
+    ):
+        """
+        Verifica se estados já persistidos são ignorados.
+
+        Cenário:
+            O estado de Santa Catarina já existe no banco de dados.
+
+        Dado que:
+            - O repositório retorna um registro apenas para o estado "SC".
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - Apenas as cidades do estado "RJ" são buscadas e inseridas.
+        """
+        # Dado que
+        requested_states = []
+
+        async def list_cities_by_state(state: str):
+            requested_states.append(state)
+            for city in CITIES[state]:
+                yield city
+
+        async def search(filters: dict, page: PageWindow):
+            return [STATES[0]] if filters["state"] == "SC" else []
+
+        repository = MagicMock(spec=IDefaultRepository)
+        repository.search = AsyncMock(side_effect=search)
+        repository.create_many = AsyncMock()
+        use_case = CreateLocationUseCase(
+            location_db=repository,
+            location_provider=_build_provider(list_cities_by_state),
+        )
+
+        # Quando
+        await use_case.execute()
+
+        # Então
+        assert requested_states == ["RJ"]
+        repository.create_many.assert_awaited_once_with(CITIES["RJ"])
+
+    @pytest.mark.asyncio
+    async def test_quando_estado_falha_entao_e_repetido_sem_abortar_os_demais(self):
+        """
+        Verifica se falhas de um estado são isoladas e repetidas.
+
+        Cenário:
+            O provedor falha sempre para "SC" e falha uma única vez para "RJ".
+
+        Dado que:
+            - O repositório não encontra nenhum registro para os estados.
+            - O caso de uso permite até 3 tentativas por estado.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - "SC" é tentado 3 vezes e não é inserido.
+            - "RJ" é inserido na segunda tentativa.
+            - Nenhuma exceção é propagada.
+        """
+        # Dado que
+        attempts = {"SC": 0, "RJ": 0}
+
+        async def list_cities_by_state(state: str):
+            attempts[state] += 1
+            if state == "SC" or attempts[state] == 1:
+                raise ConnectionError("IBGE indisponível")
+            for city in CITIES[state]:
+                yield city
+
+        repository = MagicMock(spec=IDefaultRepository)
+        repository.search = AsyncMock(return_value=[])
+        repository.create_many = AsyncMock()
+        use_case = CreateLocationUseCase(
+            location_db=repository,
+            location_provider=_build_provider(list_cities_by_state),
+            max_retries=3,
+        )
+
+        # Quando
+        await use_case.execute()
+
+        # Então
+        assert attempts == {"SC": 3, "RJ": 2}
+        repository.create_many.assert_awaited_once_with(CITIES["RJ"])
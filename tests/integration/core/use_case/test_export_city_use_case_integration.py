@@ -0,0 +1,88 @@
+"""
+Testes de integração para o caso de uso `ExportCity`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`ExportCity` e o repositório `ILocationRepository`, utilizando mocks para a
+implementação concreta da interface.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.use_case.export_city_use_case import ExportCity
+
+CITIES = [
+    Location(
+        id=index,
+        country="BR",
+        state="SC",
+        stateName="Santa Catarina",
+        cityName=f"Cidade {index}",
+    )
+    for index in range(5)
+]
+
+
+class TestExportCityIntegration:
+    """
+    Classe de testes de integração para o caso de uso `ExportCity`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_exportar_cidades_entao_retorna_ndjson_em_blocos(
+        self, monkeypatch
+    ):
+        """
+        Verifica se as cidades são exportadas em NDJSON, agrupadas em blocos.
+
+        Cenário:
+            O repositório possui 5 cidades e o tamanho do bloco é 2.
+
+        Dado que:
+            - O repositório retorna as cidades de "SC" em streaming.
+        Quando:
+            - O gerador retornado por `execute` é consumido.
+        Então:
+            - São produzidos 3 blocos, com 2, 2 e 1 linhas.
+            - Cada linha é o JSON de uma cidade, sem o identificador interno.
+            - O repositório é consultado com o filtro do estado e é encerrado ao final.
+        """
+        # Dado que
+        monkeypatch.setattr(ExportCity, "CHUNK_SIZE", 2)
+        received = {}
+        closed = []
+
+        async def stream(filters, order_by):
+            received.update(filters=filters, order_by=order_by)
+            for city in CITIES:
+                yield city
+
+        repository = MagicMock(spec=ILocationRepository)
+        repository.stream = stream
+
+        @asynccontextmanager
+        async def location_db_scope():
+            yield repository
+            closed.append(True)
+
+        use_case = ExportCity(
+            location_db_scope=location_db_scope, state="SC", order_by="city_name"
+        )
+
+        # Quando
+        chunks = [chunk async for chunk in await use_case.execute()]
+
+        # Então
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            city.model_dump(mode="json", by_alias=True) for city in CITIES
+        ]
+        assert "id" not in json.loads(lines[0])
+        assert received == {"filters": {"state": "SC"}, "order_by": "city_name"}
+        assert closed == [True]
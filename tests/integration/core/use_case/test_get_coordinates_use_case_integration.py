@@ -0,0 +1,121 @@
+"""
+Testes de integração para o caso de uso `GetCoordinates`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`GetCoordinates`, o provedor de geocodificação `ILocationProvider`, o
+repositório `ILocationRepository` e o catálogo `ILocationCatalog`, utilizando
+mocks para as implementações concretas das interfaces.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import (
+    ILocationCatalog,
+    ILocationRepository,
+)
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.use_case.get_coordinates_use_case import GetCoordinates
+
+CITY = Location(
+    id=7, country="BR", state="SC", stateName="Santa Catarina", cityName="Joinville"
+)
+COORDINATES = Coordinates(latitude=-26.3045, longitude=-48.8487)
+
+
+def _build_scope(repository: MagicMock):
+    @asynccontextmanager
+    async def location_db_scope():
+        yield repository
+
+    return location_db_scope
+
+
+class TestGetCoordinatesIntegration:
+    """
+    Classe de testes de integração para o caso de uso `GetCoordinates`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_cidade_sem_coordenadas_entao_geocodifica_e_grava_no_banco_e_catalogo(
+        self,
+    ):
+        """
+        Verifica se as coordenadas obtidas do provedor são gravadas de volta.
+
+        Cenário:
+            A cidade "Joinville" ainda não possui coordenadas.
+
+        Dado que:
+            - O provedor retorna as coordenadas da cidade.
+            - O catálogo está carregado.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - A cidade é retornada com as coordenadas.
+            - O repositório e o catálogo são atualizados com o identificador da cidade.
+        """
+        # Dado que
+        located = CITY.model_copy(update={"coordinates": COORDINATES})
+        provider = MagicMock(spec=ILocationProvider)
+        provider.get_coordinates = AsyncMock(return_value=located)
+        repository = MagicMock(spec=ILocationRepository)
+        repository.update = AsyncMock()
+        catalog = MagicMock(spec=ILocationCatalog)
+        catalog.loaded = True
+        catalog.update = AsyncMock()
+        use_case = GetCoordinates(
+            location=CITY,
+            location_db_scope=_build_scope(repository),
+            coordinate_provider=provider,
+            location_catalog=catalog,
+        )
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result.coordinates == COORDINATES
+        repository.update.assert_awaited_once_with(located, 7)
+        catalog.update.assert_awaited_once_with(located, 7)
+
+    @pytest.mark.asyncio
+    async def test_quando_cidade_ja_possui_coordenadas_entao_provedor_nao_e_chamado(
+        self,
+    ):
+        """
+        Verifica se cidades com coordenadas não geram chamadas externas.
+
+        Cenário:
+            A cidade "Joinville" já possui coordenadas no catálogo.
+
+        Dado que:
+            - A cidade informada possui coordenadas.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - A própria cidade é retornada.
+            - Nem o provedor nem o repositório são chamados.
+        """
+        # Dado que
+        city = CITY.model_copy(update={"coordinates": COORDINATES})
+        provider = MagicMock(spec=ILocationProvider)
+        provider.get_coordinates = AsyncMock()
+        repository = MagicMock(spec=ILocationRepository)
+        repository.update = AsyncMock()
+        use_case = GetCoordinates(
+            location=city,
+            location_db_scope=_build_scope(repository),
+            coordinate_provider=provider,
+        )
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result is city
+        provider.get_coordinates.assert_not_awaited()
+        repository.update.assert_not_awaited()
@@ -12,8 +12,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from tempotech.core.interfaces.database_repository import IDefaultRepository
-from tempotech.core.schemas.location_schema import Location
-from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.schemas.location_schema import CitySearchParams, Location
+from tempotech.core.schemas.pagination_schema import Cursor, PageWindow, Pagination
 from tempotech.core.use_case.search_city_use_case import SearchCity
 
 
@@ -60,7 +60,9 @@ class TestSearchCityIntegration:
         ]
 
         use_case = SearchCity(
-            location_db=mock_repo_instance, state="SP", page=1, page_size=10
+            location_db=mock_repo_instance,
+            state="SP",
+            params=CitySearchParams(page=1, page_size=10),
         )
 
         # Quando
@@ -72,7 +74,9 @@ class TestSearchCityIntegration:
         assert result.items_count == 3
         assert result.items[0].city_name == "São Paulo"
         mock_repo_instance.search.assert_called_once_with(
-            filters={"state": "SP"}, offset=0, limit=10
+            filters={"state": "SP"},
+            order_by=None,
+            page=PageWindow(offset=0, limit=10),
         )
 
     @pytest.mark.asyncio
@@ -106,10 +110,9 @@ class TestSearchCityIntegration:
         use_case = SearchCity(
             location_db=mock_repo_instance,
             state="RJ",
-            search_by="city_name",
-            search_value="Niterói",
-            page=1,
-            page_size=10,
+            params=CitySearchParams(
+                search_by="city_name", search_value="Niterói", page=1, page_size=10
+            ),
         )
 
         # Quando
@@ -120,5 +123,64 @@ class TestSearchCityIntegration:
         assert result.items_count == 1
         assert result.items[0].city_name == "Niterói"
         mock_repo_instance.search.assert_called_once_with(
-            filters={"state": "RJ", "city_name": "Niterói"}, offset=0, limit=10
+            filters={"state": "RJ", "city_name": "Niterói"},
+            order_by=None,
+            page=PageWindow(offset=0, limit=10),
+        )
+
+    @pytest.mark.asyncio
+    async def test_quando_cursor_e_informado_entao_busca_e_feita_por_chave(self):
+        """
+        Verifica a integração entre o caso de uso e o repositório na paginação por chave.
+
+        Cenário:
+            O caso de uso `SearchCity` recebe o cursor da página anterior e deve
+            buscar os próximos registros sem usar deslocamento.
+
+        Dado que:
+            - Uma implementação mockada de `IDefaultRepository` que retorna uma página cheia.
+            - Um cursor apontando para a cidade "Blumenau".
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - O método `search` é invocado com o cursor em `page.after`, sem `offset`.
+            - O cursor da próxima página aponta para o último item retornado.
+        """
+        # Dado que
+        mock_repo_instance = MagicMock(spec=IDefaultRepository)
+        mock_repo_instance.search.return_value = [
+            Location(
+                id=7,
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Joinville",
+            ),
+            Location(
+                id=3,
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Lages",
+            ),
+        ]
+        cursor = Cursor(value="Blumenau", id=5)
+
+        use_case = SearchCity(
+            location_db=mock_repo_instance,
+            state="SC",
+            params=CitySearchParams(page_size=2, cursor=cursor.encode()),
+            cursor=cursor,
+        )
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        mock_repo_instance.search.assert_called_once_with(
+            filters={"state": "SC"},
+            order_by=None,
+            page=PageWindow(after=cursor, limit=2),
         )
+        assert Cursor.decode(result.next_cursor) == Cursor(value="Lages", id=3)
+        assert "id" not in result.model_dump()["items"][0]
@@ -0,0 +1,140 @@
+"""
+Testes de integração para o caso de uso `SearchState`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso `SearchState`,
+o repositório `ILocationRepository` e o provedor `ILocationProvider`, utilizando
+mocks para as implementações concretas das interfaces.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.schemas.location_schema import Location
+from tempotech.core.use_case.search_state_use_case import SearchState
+
+STATES = [
+    Location(country="BR", state="RJ", stateName="Rio de Janeiro"),
+    Location(country="BR", state="SC", stateName="Santa Catarina"),
+]
+
+
+class TestSearchStateIntegration:
+    """
+    Classe de testes de integração para o caso de uso `SearchState`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_estados_existem_no_banco_entao_provedor_nao_e_consultado(
+        self,
+    ):
+        """
+        Verifica se os estados são lidos do repositório quando disponíveis.
+
+        Cenário:
+            O banco de dados já foi populado com as cidades de todos os estados.
+
+        Dado que:
+            - O repositório retorna a lista de estados.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - Os estados do repositório são retornados.
+            - O provedor externo não é consultado.
+        """
+        # Dado que
+        repository = MagicMock(spec=ILocationRepository)
+        repository.list_states = AsyncMock(return_value=STATES)
+        provider = MagicMock(spec=ILocationProvider)
+        provider.country = "BR"
+        provider.state_count = len(STATES)
+
+        use_case = SearchState(location_db=repository, location_provider=provider)
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result == STATES
+        repository.list_states.assert_awaited_once_with(country="BR")
+        provider.list_states.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_quando_banco_esta_vazio_entao_estados_sao_buscados_no_provedor(
+        self,
+    ):
+        """
+        Verifica se o provedor é usado enquanto o repositório não possui dados.
+
+        Cenário:
+            A carga inicial do banco de dados ainda não foi concluída.
+
+        Dado que:
+            - O repositório retorna uma lista vazia.
+            - O provedor retorna a lista de estados.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - Os estados do provedor são retornados.
+        """
+
+        # Dado que
+        async def list_states():
+            for state in STATES:
+                yield state
+
+        repository = MagicMock(spec=ILocationRepository)
+        repository.list_states = AsyncMock(return_value=[])
+        provider = MagicMock(spec=ILocationProvider)
+        provider.country = "BR"
+        provider.state_count = len(STATES)
+        provider.list_states = list_states
+
+        use_case = SearchState(location_db=repository, location_provider=provider)
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result == STATES
+
+    @pytest.mark.asyncio
+    async def test_quando_banco_possui_apenas_parte_dos_estados_entao_estados_sao_buscados_no_provedor(
+        self,
+    ):
+        """
+        Verifica se o provedor é usado quando a carga inicial deixou estados de fora.
+
+        Cenário:
+            A carga das cidades do Rio de Janeiro falhou, e o banco possui apenas Santa Catarina.
+
+        Dado que:
+            - O repositório retorna apenas um dos dois estados do país.
+            - O provedor retorna a lista completa de estados.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - Os estados do provedor são retornados.
+        """
+
+        # Dado que
+        async def list_states():
+            for state in STATES:
+                yield state
+
+        repository = MagicMock(spec=ILocationRepository)
+        repository.list_states = AsyncMock(return_value=STATES[1:])
+        provider = MagicMock(spec=ILocationProvider)
+        provider.country = "BR"
+        provider.state_count = len(STATES)
+        provider.list_states = list_states
+
+        use_case = SearchState(location_db=repository, location_provider=provider)
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result == STATES
@@ -0,0 +1,121 @@
+"""
+Testes de integração para o caso de uso `SearchWeatherBatch`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`SearchWeatherBatch`, o provedor de coordenadas `ILocationProvider` e o
+provedor de clima `IWeatherProvider`, utilizando mocks para as implementações
+concretas das interfaces.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.use_case.get_coordinates_use_case import GetCoordinates
+from tempotech.core.use_case.search_weather_batch_use_case import SearchWeatherBatch
+
+
+def build_city(city_name: str) -> Location:
+    """
+    Cria uma cidade de Santa Catarina com coordenadas.
+    """
+    return Location(
+        country="BR",
+        state="SC",
+        stateName="Santa Catarina",
+        cityName=city_name,
+        coordinates=Coordinates(latitude=-26.3, longitude=-48.8),
+    )
+
+
+def build_weather(city_name: str) -> Weather:
+    """
+    Cria o clima atual de uma cidade.
+    """
+    return Weather(
+        **{
+            "cityName": city_name,
+            "state": "SC",
+            "country": "BR",
+            "temperature": {
+                "current": 25.0,
+                "feelsLike": 26.0,
+                "min": 20.0,
+                "max": 28.0,
+                "unit": "celsius",
+            },
+            "humidity": 80,
+            "windSpeed": 3.5,
+            "timestampUtc": datetime.now(timezone.utc),
+        }
+    )
+
+
+class TestSearchWeatherBatchIntegration:
+    """
+    Classe de testes de integração para o caso de uso `SearchWeatherBatch`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_varias_cidades_entao_provedor_e_consultado_uma_vez_com_falhas_por_cidade(
+        self,
+    ):
+        """
+        Verifica se as cidades são consultadas de uma vez e as falhas descritas por cidade.
+
+        Cenário:
+            A consulta contém "Joinville", "Blumenau" e "Itajaí", sem coordenadas.
+
+        Dado que:
+            - "Joinville" e "Blumenau" já possuem coordenadas.
+            - A geocodificação de "Itajaí" falha.
+            - O provedor de clima obtém apenas o clima de "Joinville".
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - O provedor de clima é chamado uma única vez, com as duas cidades com coordenadas.
+            - O resultado de "Joinville" contém o clima.
+            - Os resultados de "Blumenau" e "Itajaí" são `None`.
+            - Os resultados estão na ordem da consulta.
+        """
+        # Dado que
+        joinville, blumenau = build_city("Joinville"), build_city("Blumenau")
+        itajai = build_city("Itajaí").model_copy(update={"coordinates": None})
+        weather = build_weather("Joinville")
+        coordinate_provider = MagicMock(spec=ILocationProvider)
+        coordinate_provider.get_coordinates = AsyncMock(side_effect=RuntimeError)
+        weather_provider = MagicMock(spec=IWeatherProvider)
+        weather_provider.get_current_weather_many = AsyncMock(
+            return_value=[weather, None]
+        )
+
+        @asynccontextmanager
+        async def location_db_scope():
+            yield MagicMock(spec=ILocationRepository)
+
+        use_case = SearchWeatherBatch(
+            locations=[joinville, itajai, blumenau],
+            get_coordinates=partial(
+                GetCoordinates,
+                location_db_scope=location_db_scope,
+                coordinate_provider=coordinate_provider,
+            ),
+            weather_provider=weather_provider,
+        )
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        weather_provider.get_current_weather_many.assert_awaited_once_with(
+            [joinville, blumenau]
+        )
+        assert result == [weather, None, None]
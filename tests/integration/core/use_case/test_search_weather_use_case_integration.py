@@ -0,0 +1,101 @@
+"""
+Testes de integração para o caso de uso `SearchWeather`.
+
+Este módulo contém testes que verificam a interação entre o caso de uso
+`SearchWeather`, o provedor de coordenadas `ILocationProvider` e o provedor
+de clima `IWeatherProvider`, utilizando mocks para as implementações
+concretas das interfaces.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.interfaces.location_provider import ILocationProvider
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.schemas.weather_schema import Weather
+from tempotech.core.use_case.get_coordinates_use_case import GetCoordinates
+from tempotech.core.use_case.search_weather_use_case import SearchWeather
+
+
+class TestSearchWeatherIntegration:
+    """
+    Classe de testes de integração para o caso de uso `SearchWeather`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_cidade_possui_coordenadas_entao_clima_e_buscado_sem_geocodificar(
+        self,
+    ):
+        """
+        Verifica se o clima é buscado com as coordenadas já conhecidas da cidade.
+
+        Cenário:
+            A cidade "Joinville", resolvida no catálogo, já possui coordenadas.
+
+        Dado que:
+            - O provedor de clima retorna o clima atual da cidade.
+        Quando:
+            - O método `execute` do caso de uso é chamado.
+        Então:
+            - O clima retornado pelo provedor é retornado pelo caso de uso.
+            - O provedor de clima recebe a cidade com as coordenadas.
+            - O provedor de coordenadas não é chamado.
+        """
+        # Dado que
+        city = Location(
+            id=7,
+            country="BR",
+            state="SC",
+            stateName="Santa Catarina",
+            cityName="Joinville",
+            coordinates=Coordinates(latitude=-26.3, longitude=-48.8),
+        )
+        weather = Weather(
+            **{
+                "cityName": "Joinville",
+                "state": "SC",
+                "country": "BR",
+                "temperature": {
+                    "current": 25.0,
+                    "feelsLike": 26.0,
+                    "min": 20.0,
+                    "max": 28.0,
+                    "unit": "celsius",
+                },
+                "humidity": 80,
+                "windSpeed": 3.5,
+                "timestampUtc": datetime.now(timezone.utc),
+            }
+        )
+        coordinate_provider = MagicMock(spec=ILocationProvider)
+        coordinate_provider.get_coordinates = AsyncMock()
+        weather_provider = MagicMock(spec=IWeatherProvider)
+        weather_provider.get_current_weather = AsyncMock(return_value=weather)
+
+        @asynccontextmanager
+        async def location_db_scope():
+            yield MagicMock(spec=ILocationRepository)
+
+        use_case = SearchWeather(
+            location=city,
+            get_coordinates=partial(
+                GetCoordinates,
+                location_db_scope=location_db_scope,
+                coordinate_provider=coordinate_provider,
+            ),
+            weather_provider=weather_provider,
+        )
+
+        # Quando
+        result = await use_case.execute()
+
+        # Então
+        assert result == weather
+        weather_provider.get_current_weather.assert_awaited_once_with(city)
+        coordinate_provider.get_coordinates.assert_not_awaited()
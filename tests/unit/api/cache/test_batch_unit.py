@@ -0,0 +1,63 @@
+"""
+Testes unitários para a leitura e gravação de várias chaves do cache (`batch.py`).
+
+Este módulo contém testes para garantir que `get_many` e `set_many` leem e
+gravam as chaves com a validade do decorador `cache`, utilizando o backend em
+memória do `fastapi_cache`.
+"""
+
+from typing import Iterator
+
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from tempotech.api.cache.batch import get_many, set_many
+
+
+class TestCacheBatchUnit:
+    """
+    Classe de testes unitários para `get_many` e `set_many`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def backend(self) -> Iterator[InMemoryBackend]:
+        """
+        Configura o `FastAPICache` com um backend em memória para cada teste.
+
+        O `FastAPICache.init` não substitui uma configuração anterior, por isso a
+        configuração é descartada antes e depois de cada teste.
+        """
+        backend = InMemoryBackend()
+        FastAPICache.reset()
+        FastAPICache.init(backend, prefix="test")
+        yield backend
+        FastAPICache.reset()
+
+    @pytest.mark.asyncio
+    async def test_quando_chaves_gravadas_entao_apenas_valores_atuais_sao_lidos(
+        self, backend: InMemoryBackend
+    ):
+        """
+        Verifica se apenas os valores ainda atuais são lidos do cache.
+
+        Cenário:
+            O clima de "Joinville" foi gravado agora, e o de "Blumenau" já expirou.
+
+        Dado que:
+            - "Joinville" foi gravado com `set_many`.
+            - "Blumenau" está no cache apenas pelo período de valor expirado.
+        Quando:
+            - As chaves de "Joinville", "Blumenau" e "Itajaí" são lidas com `get_many`.
+        Então:
+            - Apenas o valor de "Joinville" é retornado, na ordem das chaves.
+        """
+        # Dado que
+        await set_many({"joinville": b"j{}"}, expire=600, grace=120)
+        await backend.set("blumenau", b"j{}", expire=60)
+
+        # Quando
+        values = await get_many(["joinville", "blumenau", "itajai"], grace=120)
+
+        # Então
+        assert values == [b"j{}", None, None]
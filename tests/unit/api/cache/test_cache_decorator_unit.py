@@ -0,0 +1,177 @@
+"""
+Testes unitários para o decorador de cache das rotas (`decorator.py`).
+
+Este módulo contém testes para garantir que o `cache` executa a rota apenas uma
+vez na expiração de uma chave e serve o valor expirado enquanto outro processo
+detém a trava de preenchimento, utilizando o backend em memória do `fastapi_cache`.
+"""
+
+import asyncio
+from typing import Iterator
+
+import pytest
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from tempotech.api.cache.decorator import Revalidation, cache
+from tempotech.api.cache.lock import FillLock
+from tempotech.core import config
+
+
+class IsolatedInMemoryBackend(InMemoryBackend):
+    """
+    Backend em memória com armazenamento próprio.
+
+    O `InMemoryBackend` guarda os valores em um atributo de classe, compartilhado
+    por todas as instâncias, o que faria um teste ler os valores de outro.
+    """
+
+    def __init__(self):
+        self._store = {}
+
+
+class TestCacheDecoratorUnit:
+    """
+    Classe de testes unitários para o decorador `cache`.
+    """
+
+    @pytest.fixture(autouse=True)
+    def backend(self) -> Iterator[InMemoryBackend]:
+        """
+        Configura o `FastAPICache` com um backend em memória para cada teste.
+
+        O `FastAPICache.init` não substitui uma configuração anterior, por isso a
+        configuração é descartada antes e depois de cada teste.
+        """
+        backend = IsolatedInMemoryBackend()
+        FastAPICache.reset()
+        FastAPICache.init(backend, prefix="test")
+        yield backend
+        FastAPICache.reset()
+
+    @pytest.mark.asyncio
+    async def test_quando_requisicoes_concorrentes_sem_cache_entao_rota_executa_uma_vez(
+        self,
+    ):
+        """
+        Verifica se requisições concorrentes a uma chave ausente compartilham uma execução.
+
+        Cenário:
+            Dez requisições consultam o estado "SC" ao mesmo tempo.
+
+        Dado que:
+            - O cache está vazio.
+            - A rota demora para responder.
+        Quando:
+            - As requisições são feitas de forma concorrente.
+        Então:
+            - A rota é executada uma única vez.
+            - Todas as requisições recebem o mesmo resultado.
+        """
+        # Dado que
+        executions = []
+
+        @cache(expire=60)
+        async def get_state(state: str) -> dict:
+            executions.append(state)
+            await asyncio.sleep(0.01)
+            return {"state": state}
+
+        # Quando
+        results = await asyncio.gather(*(get_state(state="SC") for _ in range(10)))
+
+        # Então
+        assert executions == ["SC"]
+        assert results == [{"state": "SC"}] * 10
+
+    @pytest.mark.asyncio
+    async def test_quando_chave_expirada_e_trava_de_outro_processo_entao_valor_expirado_e_servido(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Verifica se o valor expirado é servido enquanto outro processo recalcula a chave.
+
+        Cenário:
+            A chave do estado "SC" expirou, mas ainda está no período de `CACHE_STALE_TTL`.
+
+        Dado que:
+            - O cache foi preenchido e o valor deixou de ser atual.
+            - A trava de preenchimento pertence a outro processo.
+        Quando:
+            - Uma nova requisição é feita.
+        Então:
+            - A rota não é executada novamente.
+            - O valor expirado é retornado.
+        """
+        # Dado que
+        executions = []
+
+        @cache(expire=1)
+        async def get_state(state: str) -> dict:
+            executions.append(state)
+            return {"state": state, "version": len(executions)}
+
+        monkeypatch.setattr(config, "CACHE_STALE_TTL", 60)
+        await get_state(state="SC")
+        monkeypatch.setattr(config, "CACHE_STALE_TTL", 61)
+
+        async def acquire(key: str, ttl: float):
+            return None
+
+        monkeypatch.setattr(FillLock, "acquire", acquire)
+
+        # Quando
+        result = await get_state(state="SC")
+
+        # Então
+        assert executions == ["SC"]
+        assert result == {"state": "SC", "version": 1}
+
+    @pytest.mark.asyncio
+    async def test_quando_stale_while_revalidate_e_chave_expirada_entao_valor_expirado_e_servido_e_atualizado(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Verifica se o valor expirado é servido e recalculado em segundo plano.
+
+        Cenário:
+            A chave do clima de "Florianópolis" expirou, mas ainda está na janela de revalidação.
+
+        Dado que:
+            - A rota usa o modo `stale_while_revalidate`.
+            - O valor armazenado deixou de ser atual.
+        Quando:
+            - Uma nova requisição é feita.
+        Então:
+            - O valor expirado é retornado imediatamente.
+            - A rota é executada em segundo plano e o novo valor é servido em seguida.
+        """
+        # Dado que
+        executions = []
+
+        @cache(expire=1, revalidation=Revalidation(stale_while_revalidate=60))
+        async def get_weather(city_name: str) -> dict:
+            executions.append(city_name)
+            return {"cityName": city_name, "version": len(executions)}
+
+        await get_weather(city_name="Florianópolis")
+
+        async def get_with_ttl(key: str):
+            return 60, FastAPICache.get_coder().encode(
+                {"cityName": "Florianópolis", "version": 1}
+            )
+
+        backend = FastAPICache.get_backend()
+        original_get_with_ttl = backend.get_with_ttl
+        monkeypatch.setattr(backend, "get_with_ttl", get_with_ttl)
+
+        # Quando
+        stale = await get_weather(city_name="Florianópolis")
+        await asyncio.sleep(0.01)
+        monkeypatch.setattr(backend, "get_with_ttl", original_get_with_ttl)
+        fresh = await get_weather(city_name="Florianópolis")
+
+        # Então
+        assert stale == {"cityName": "Florianópolis", "version": 1}
+        assert fresh == {"cityName": "Florianópolis", "version": 2}
+        assert len(executions) == 2
@@ -0,0 +1,76 @@
+"""
+Testes unitários para o codificador binário do cache (`coder.py`).
+
+Este módulo contém testes para garantir que o `CompactCoder` preserva os
+valores codificados, comprime apenas os valores grandes e continua lendo os
+valores gravados pelo `JsonCoder`.
+"""
+
+from fastapi_cache.coder import JsonCoder
+
+from tempotech.api.cache.coder import CompactCoder
+from tempotech.core.schemas.location_schema import Location
+
+
+class TestCompactCoderUnit:
+    """
+    Classe de testes unitários para o `CompactCoder`.
+    """
+
+    def test_quando_valor_grande_entao_e_comprimido_e_decodificado_igual(self):
+        """
+        Verifica se listas grandes são comprimidas sem perda.
+
+        Cenário:
+            Uma página com 200 cidades e outra com uma única cidade.
+
+        Dado que:
+            - O tamanho mínimo de compressão é o padrão, de 1024 bytes.
+        Quando:
+            - As duas páginas são codificadas e decodificadas.
+        Então:
+            - Apenas a página grande é comprimida, e fica menor que o JSON original.
+            - As duas páginas são decodificadas com os mesmos valores.
+        """
+        # Dado que
+        location = Location(
+            country="BR", state="SC", stateName="Santa Catarina", cityName="Joinville"
+        )
+        large = [location] * 200
+        small = [location]
+
+        # Quando
+        encoded_large = CompactCoder.encode(large)
+        encoded_small = CompactCoder.encode(small)
+
+        # Então
+        assert encoded_large[:1] == b"z"
+        assert encoded_small[:1] == b"j"
+        assert len(encoded_large) < len(JsonCoder.encode(large))
+        assert (
+            CompactCoder.decode(encoded_large)
+            == CompactCoder.decode(encoded_small) * 200
+        )
+
+    def test_quando_valor_gravado_pelo_json_coder_entao_e_decodificado(self):
+        """
+        Verifica a compatibilidade com os valores já gravados no cache.
+
+        Cenário:
+            Um valor gravado pelo `JsonCoder` antes da troca do codificador.
+
+        Dado que:
+            - O valor foi lido do Redis como bytes.
+        Quando:
+            - O valor é decodificado.
+        Então:
+            - O JSON original é retornado.
+        """
+        # Dado que
+        encoded = JsonCoder.encode({"state": "SC"})
+
+        # Quando
+        decoded = CompactCoder.decode(encoded)
+
+        # Então
+        assert decoded == {"state": "SC"}
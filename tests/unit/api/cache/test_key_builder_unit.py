@@ -0,0 +1,172 @@
+"""
+Testes unitários para o construtor de chaves canônicas do cache (`key_builder.py`).
+
+Este módulo contém testes para garantir que variações de escrita de uma mesma
+consulta geram a mesma chave, utilizando requisições montadas diretamente a
+partir do escopo ASGI, e que a chave pode ser composta pelas dependências já
+resolvidas da rota.
+"""
+
+from types import SimpleNamespace
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from starlette.requests import Request
+
+from tempotech.api.cache.key_builder import (
+    Param,
+    arguments_key_builder,
+    canonical_key_builder,
+    normalize_int,
+    normalize_uf,
+)
+from tempotech.core.utils.text import normalize_text
+
+
+def make_request(path_params: dict, query_string: str = "") -> Request:
+    """
+    Monta uma requisição GET com os parâmetros de caminho e de URL informados.
+    """
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [],
+            "query_string": query_string.encode(),
+            "path_params": path_params,
+        }
+    )
+
+
+async def get_route():
+    """
+    Rota de exemplo usada na composição das chaves.
+    """
+
+
+class TestCanonicalKeyBuilderUnit:
+    """
+    Classe de testes unitários para o `canonical_key_builder`.
+    """
+
+    def setup_method(self):
+        """
+        Configura o `FastAPICache`, cujo prefixo compõe as chaves.
+        """
+        FastAPICache.init(InMemoryBackend(), prefix="test")
+
+    def test_quando_nome_da_cidade_varia_em_acentos_e_espacos_entao_chave_e_a_mesma(
+        self,
+    ):
+        """
+        Verifica se o nome da cidade é normalizado na chave.
+
+        Cenário:
+            O clima de "São Paulo" é consultado com três escritas diferentes.
+
+        Dado que:
+            - O construtor normaliza o parâmetro `city_name`.
+        Quando:
+            - As chaves das três requisições são geradas.
+        Então:
+            - As três chaves são iguais.
+            - Parâmetros não declarados na rota são ignorados.
+        """
+        # Dado que
+        key_builder = canonical_key_builder(city_name=Param(normalize_text))
+
+        # Quando
+        keys = {
+            key_builder(get_route, request=make_request({"city_name": name}, query))
+            for name, query in [
+                ("São Paulo", ""),
+                ("sao  paulo", ""),
+                (" SAO PAULO", "_=1700000000"),
+            ]
+        }
+
+        # Então
+        assert keys == {f"test::{__name__}:get_route:city_name=sao paulo"}
+
+    def test_quando_parametros_padrao_e_ordem_variam_entao_chave_e_a_mesma(self):
+        """
+        Verifica se a ordem dos parâmetros e os valores padrão não alteram a chave.
+
+        Cenário:
+            A primeira página das cidades de SC é consultada de três formas.
+
+        Dado que:
+            - A página 1 e o tamanho 10 são os valores padrão.
+        Quando:
+            - As chaves das requisições são geradas.
+        Então:
+            - As três chaves são iguais.
+            - A segunda página gera uma chave diferente.
+        """
+        # Dado que
+        key_builder = canonical_key_builder(
+            state=Param(normalize_uf),
+            order_by=Param(),
+            page=Param(normalize_int, default="1"),
+            page_size=Param(normalize_int, default="10"),
+        )
+
+        # Quando
+        keys = {
+            key_builder(get_route, request=make_request({"state": state}, query))
+            for state, query in [
+                ("SC", "order_by=city_name"),
+                ("sc", "page=1&order_by=city_name"),
+                ("Sc", "page_size=10&order_by=city_name&page=01"),
+            ]
+        }
+        second_page = key_builder(
+            get_route,
+            request=make_request({"state": "SC"}, "order_by=city_name&page=2"),
+        )
+
+        # Então
+        assert len(keys) == 1
+        assert second_page not in keys
+
+    def test_quando_nomes_diferentes_resolvem_a_mesma_cidade_entao_chave_e_a_mesma(
+        self,
+    ):
+        """
+        Verifica se a chave pode ser composta pelo resultado das dependências da rota.
+
+        Cenário:
+            "Joinville" é consultada como "joinvile" e como "Joinville/SC".
+
+        Dado que:
+            - O construtor compõe a chave com o identificador da cidade resolvida.
+            - Os dois nomes foram resolvidos para a mesma cidade.
+        Quando:
+            - As chaves das duas requisições e a de outra cidade são geradas.
+        Então:
+            - As chaves dos dois nomes são iguais e compostas pelo identificador da cidade.
+            - A chave da outra cidade é diferente.
+        """
+        # Dado que
+        key_builder = arguments_key_builder(
+            location_id=lambda kwargs: kwargs["use_case"].location.id
+        )
+
+        def build_kwargs(city_name: str, location_id: int) -> dict:
+            location = SimpleNamespace(id=location_id)
+            return {
+                "city_name": city_name,
+                "use_case": SimpleNamespace(location=location),
+            }
+
+        # Quando
+        keys = {
+            key_builder(get_route, kwargs=build_kwargs(name, 1))
+            for name in ["joinvile", "Joinville/SC"]
+        }
+        other = key_builder(get_route, kwargs=build_kwargs("Blumenau", 2))
+
+        # Então
+        assert keys == {f"test::{__name__}:get_route:location_id=1"}
+        assert other not in keys
@@ -0,0 +1,71 @@
+"""
+Testes unitários para o agendador de atualização antecipada do cache (`refresh_ahead.py`).
+
+Este módulo contém testes para garantir que o `RefreshAheadScheduler` recalcula
+apenas as chaves mais requisitadas próximas de expirar, dentro do limite de
+chamadas por ciclo.
+"""
+
+import pytest
+
+from tempotech.api.cache.refresh_ahead import (
+    RefreshAheadScheduler,
+    RefreshAheadSettings,
+)
+
+
+class TestRefreshAheadSchedulerUnit:
+    """
+    Classe de testes unitários para o `RefreshAheadScheduler`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_ciclo_executa_entao_chaves_populares_proximas_de_expirar_sao_recalculadas(
+        self,
+    ):
+        """
+        Verifica se o ciclo respeita o ranking, a antecedência e o limite de chamadas.
+
+        Cenário:
+            Três cidades consultadas com frequências diferentes.
+
+        Dado que:
+            - "Porto Alegre" é a menos consultada e fica fora das duas mais requisitadas.
+            - "Curitiba" ainda tem 500 segundos até expirar.
+            - O limite é de uma chamada por ciclo.
+        Quando:
+            - Quatro ciclos são executados, sem novas consultas.
+        Então:
+            - Apenas "São Paulo", a mais consultada e próxima de expirar, é recalculada.
+            - A cidade deixa de ser acompanhada quando a sua frequência decai a zero.
+        """
+        # Dado que
+        scheduler = RefreshAheadScheduler(
+            RefreshAheadSettings(top_n=2, lead=60, interval=3600, budget=1)
+        )
+        await scheduler.start()
+        refreshed = []
+        expires_in = {"São Paulo": 10, "Curitiba": 500, "Porto Alegre": 0}
+
+        def record(city: str, hits: int):
+            async def remaining() -> int:
+                return expires_in[city]
+
+            async def refresh() -> str:
+                refreshed.append(city)
+                return city
+
+            for _ in range(hits):
+                scheduler.record(city, expires_in=remaining, refresh=refresh)
+
+        record("São Paulo", 4)
+        record("Curitiba", 3)
+        record("Porto Alegre", 1)
+
+        # Quando
+        results = [await scheduler.tick() for _ in range(4)]
+        await scheduler.close()
+
+        # Então
+        assert results == [1, 1, 1, 0]
+        assert refreshed == ["São Paulo"] * 3
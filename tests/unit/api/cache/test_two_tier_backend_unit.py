@@ -0,0 +1,88 @@
+"""
+Testes unitários para o backend de cache em dois níveis (`backend.py`).
+
+Este módulo contém testes para garantir que o `TwoTierBackend` serve as chaves
+lidas anteriormente do cache local e respeita o tamanho máximo em bytes,
+utilizando o backend em memória do `fastapi_cache` como backend remoto.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from tempotech.api.cache.backend import LocalCacheSettings, TwoTierBackend
+
+
+class TestTwoTierBackendUnit:
+    """
+    Classe de testes unitários para o `TwoTierBackend`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_chave_lida_novamente_entao_backend_remoto_nao_e_consultado(
+        self,
+    ):
+        """
+        Verifica se a segunda leitura de uma chave é respondida pelo cache local.
+
+        Cenário:
+            A lista de estados é lida duas vezes por um processo que não a gravou.
+
+        Dado que:
+            - A chave existe apenas no backend remoto.
+        Quando:
+            - A chave é lida duas vezes.
+        Então:
+            - O backend remoto é consultado uma única vez.
+            - As duas leituras retornam o mesmo valor e a validade do backend remoto.
+        """
+        # Dado que
+        remote = InMemoryBackend()
+        await remote.set("states", '[{"state": "SC"}]', 600)
+        remote.get_with_ttl = AsyncMock(wraps=remote.get_with_ttl)
+        backend = TwoTierBackend(remote)
+
+        # Quando
+        first = await backend.get_with_ttl("states")
+        second = await backend.get_with_ttl("states")
+
+        # Então
+        remote.get_with_ttl.assert_awaited_once_with("states")
+        assert first[1] == second[1] == '[{"state": "SC"}]'
+        assert 598 <= second[0] <= 600
+
+    @pytest.mark.asyncio
+    async def test_quando_tamanho_maximo_excedido_entao_chave_menos_usada_e_descartada(
+        self,
+    ):
+        """
+        Verifica se o cache local descarta as chaves menos usadas ao atingir o limite.
+
+        Cenário:
+            Três chaves de 10 bytes em um cache local de 25 bytes.
+
+        Dado que:
+            - As chaves "sc" e "rj" foram gravadas, e "sc" foi lida em seguida.
+        Quando:
+            - A chave "sp" é gravada.
+        Então:
+            - A chave "rj", a menos usada, é descartada do cache local.
+            - O tamanho do cache local não excede o limite.
+        """
+        # Dado que
+        backend = TwoTierBackend(
+            InMemoryBackend(), settings=LocalCacheSettings(max_bytes=25)
+        )
+        await backend.set("sc", "12345678", 600)
+        await backend.set("rj", "12345678", 600)
+        await backend.get("sc")
+
+        # Quando
+        await backend.set("sp", "12345678", 600)
+
+        # Então
+        assert backend._get_local("rj") is None
+        assert backend._get_local("sc") is not None
+        assert backend._get_local("sp") is not None
+        assert backend.size == 20
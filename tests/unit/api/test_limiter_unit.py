@@ -0,0 +1,132 @@
+"""
+Testes unitários para a limitação de taxa local (`limiter.py`).
+
+Este módulo contém testes para garantir que o `LocalRateLimiter` aplica o
+limite dentro do processo, sem consultar o Redis a cada requisição, e bloqueia
+os clientes que excederam o limite somando os demais processos, utilizando um
+mock para o cliente Redis.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+from tempotech.api.limiter import LocalRateLimiter, rate_limiter
+
+
+def build_request(ip: str) -> Request:
+    """
+    Cria uma requisição à listagem de estados feita pelo IP informado.
+    """
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/state",
+            "headers": [],
+            "client": (ip, 12345),
+        }
+    )
+
+
+class TestLocalRateLimiterUnit:
+    """
+    Classe de testes unitários para o `LocalRateLimiter`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_limite_excedido_no_processo_entao_responde_429(self):
+        """
+        Verifica se o limite é aplicado localmente, sem o Redis.
+
+        Cenário:
+            A rota admite 1 requisição a cada 10 segundos.
+
+        Dado que:
+            - O Redis não foi configurado.
+        Quando:
+            - O mesmo cliente faz duas requisições seguidas, e outro cliente faz uma.
+        Então:
+            - A primeira requisição do cliente é admitida.
+            - A segunda requisição responde 429, com o tempo de espera em `Retry-After`.
+            - A requisição do outro cliente é admitida.
+        """
+        # Dado que
+        limiter = LocalRateLimiter(times=1, seconds=10)
+
+        # Quando
+        await limiter(build_request("10.0.0.1"), Response())
+        with pytest.raises(HTTPException) as error:
+            await limiter(build_request("10.0.0.1"), Response())
+        await limiter(build_request("10.0.0.2"), Response())
+
+        # Então
+        assert error.value.status_code == 429
+        assert 9 <= int(error.value.headers["Retry-After"]) <= 10
+
+    @pytest.mark.asyncio
+    async def test_quando_total_dos_processos_atinge_limite_entao_cliente_e_bloqueado(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Verifica se as contagens são sincronizadas e o total entre processos é respeitado.
+
+        Cenário:
+            A rota admite 2 requisições a cada 10 segundos, e outro processo já
+            admitiu uma requisição do mesmo cliente.
+
+        Dado que:
+            - O Redis está configurado e retorna o total de 2 requisições na janela atual.
+            - O cliente fez uma requisição neste processo.
+        Quando:
+            - As contagens são sincronizadas e o cliente faz outra requisição.
+        Então:
+            - A contagem do cliente é enviada ao Redis em uma única chamada.
+            - A nova requisição responde 429, embora o balde local ainda tenha fichas.
+        """
+        # Dado que
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=[2])
+        monkeypatch.setattr(LocalRateLimiter, "_redis", redis)
+        monkeypatch.setattr(LocalRateLimiter, "_prefix", "test")
+        limiter = LocalRateLimiter(times=2, seconds=10)
+        await limiter(build_request("10.0.0.1"), Response())
+
+        # Quando
+        await LocalRateLimiter.sync()
+        with pytest.raises(HTTPException) as error:
+            await limiter(build_request("10.0.0.1"), Response())
+
+        # Então
+        redis.eval.assert_awaited_once()
+        _, count, key, *args = redis.eval.await_args.args
+        assert count == 1
+        assert key.startswith("test:10000:10.0.0.1:/state:")
+        assert args == [1, 10000]
+        assert error.value.status_code == 429
+
+    def test_quando_janela_nao_positiva_entao_limite_e_rejeitado(self):
+        """
+        Verifica se limites com janela vazia são rejeitados na criação.
+
+        Cenário:
+            Uma rota é configurada com `seconds=0` ou com uma janela negativa.
+
+        Dado que:
+            - A taxa de reabastecimento é dividida pela duração da janela.
+            - Uma janela menor que 1 milissegundo também é vazia.
+        Quando:
+            - O `LocalRateLimiter` e o `rate_limiter` são criados com essas janelas.
+        Então:
+            - Um `ValueError` é lançado, em vez de uma divisão por zero nas requisições.
+        """
+        # Quando/Então
+        for seconds in [0, -1, 0.0001]:
+            with pytest.raises(ValueError):
+                LocalRateLimiter(times=1, seconds=seconds)
+        for seconds in [0, -1]:
+            with pytest.raises(ValueError):
+                rate_limiter(times=1, seconds=seconds, local=False)
@@ -0,0 +1,132 @@
+"""
+Testes unitários para as classes de resposta da API (`responses.py`).
+
+Este módulo contém testes para garantir que a `FastJSONResponse` serializa
+modelos e valores JSON com os mesmos nomes de campos das respostas da API, e
+que o cabeçalho `If-None-Match` é comparado aos `ETag` calculados pelo digest
+do conteúdo.
+"""
+
+import json
+
+from starlette.requests import Request
+
+from tempotech.api.responses import FastJSONResponse, content_etag, etag_matches
+from tempotech.core.schemas.location_schema import Location
+
+
+class TestFastJSONResponseUnit:
+    """
+    Classe de testes unitários para a `FastJSONResponse`.
+    """
+
+    def test_quando_conteudo_e_lista_de_modelos_entao_usa_nomes_de_campos_da_api(self):
+        """
+        Verifica se uma lista de modelos é serializada sem conversão intermediária.
+
+        Cenário:
+            Uma rota retorna diretamente uma lista de cidades já validadas.
+
+        Dado que:
+            - A lista possui duas cidades.
+        Quando:
+            - A resposta é criada com a lista.
+        Então:
+            - O corpo é um JSON compacto com os campos `stateName` e `cityName`.
+        """
+        # Dado que
+        cities = [
+            Location(
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Joinville",
+            ),
+            Location(
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Blumenau",
+            ),
+        ]
+
+        # Quando
+        response = FastJSONResponse(cities)
+
+        # Então
+        body = json.loads(response.body)
+        assert b", " not in response.body
+        assert [city["cityName"] for city in body] == ["Joinville", "Blumenau"]
+        assert body[0]["stateName"] == "Santa Catarina"
+
+    def test_quando_conteudo_e_valor_json_entao_e_serializado(self):
+        """
+        Verifica se valores JSON comuns continuam sendo serializados.
+
+        Cenário:
+            O FastAPI envia à resposta o conteúdo de uma rota sem modelo.
+
+        Dado que:
+            - O conteúdo é um dicionário com texto acentuado.
+        Quando:
+            - A resposta é criada com o dicionário.
+        Então:
+            - O corpo é o JSON do dicionário.
+        """
+        # Quando
+        response = FastJSONResponse({"detail": "Cidade não encontrada."})
+
+        # Então
+        assert json.loads(response.body) == {"detail": "Cidade não encontrada."}
+
+
+def make_request(if_none_match: str) -> Request:
+    """
+    Monta uma requisição GET com o cabeçalho `If-None-Match` informado.
+    """
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"if-none-match", if_none_match.encode())],
+            "query_string": b"",
+        }
+    )
+
+
+class TestEtagUnit:
+    """
+    Classe de testes unitários para `content_etag` e `etag_matches`.
+    """
+
+    def test_quando_if_none_match_com_varios_etags_entao_comparacao_e_fraca(self):
+        """
+        Verifica se o `If-None-Match` é comparado ao `ETag` do conteúdo.
+
+        Cenário:
+            O cliente envia o `ETag` recebido, sem o prefixo `W/` e com outro `ETag`.
+
+        Dado que:
+            - O `ETag` é calculado a partir do mesmo conteúdo, em texto e em bytes.
+        Quando:
+            - A função `etag_matches` é chamada com cabeçalhos diferentes.
+        Então:
+            - O `ETag` é fraco, entre aspas, e não depende do tipo do conteúdo.
+            - A comparação aceita a lista de `ETag`, a ausência do prefixo e `*`.
+            - Um `ETag` de outro conteúdo não corresponde.
+        """
+        # Dado que
+        etag = content_etag('{"state":"SC"}')
+        tag = etag.removeprefix("W/")
+
+        # Quando
+        matches = [
+            etag_matches(make_request(header), etag)
+            for header in [f'"outro", {tag}', "*", content_etag(b"{}")]
+        ]
+
+        # Então
+        assert etag == content_etag(b'{"state":"SC"}')
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert matches == [True, True, False]
@@ -0,0 +1,328 @@
+"""
+Testes unitários para o catálogo de localizações em memória (`location_catalog.py`).
+
+Este módulo contém testes para garantir que o `LocationCatalog` responde ao
+autocompletar e às buscas paginadas a partir das localizações carregadas de
+um repositório, utilizando um mock para a implementação concreta da interface.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from tempotech.core.database.repository.memory.location_catalog import (
+    LocationCatalog,
+)
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.schemas.location_schema import Coordinates, Location
+from tempotech.core.schemas.pagination_schema import Cursor, PageWindow
+
+CITIES = [
+    Location(
+        id=1, country="BR", state="SP", stateName="São Paulo", cityName="São Paulo"
+    ),
+    Location(
+        id=2,
+        country="BR",
+        state="SP",
+        stateName="São Paulo",
+        cityName="São José dos Campos",
+    ),
+    Location(
+        id=3, country="BR", state="SC", stateName="Santa Catarina", cityName="São José"
+    ),
+    Location(
+        id=4,
+        country="BR",
+        state="SC",
+        stateName="Santa Catarina",
+        cityName="Florianópolis",
+    ),
+]
+
+
+async def _build_catalog(cities: list[Location] = CITIES) -> LocationCatalog:
+    async def stream(filters=None, order_by=None):
+        for city in cities:
+            yield city
+
+    source = MagicMock(spec=ILocationRepository)
+    source.stream = stream
+    catalog = LocationCatalog()
+    await catalog.load(source)
+    return catalog
+
+
+class TestLocationCatalogUnit:
+    """
+    Classe de testes unitários para o `LocationCatalog`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_prefixo_sem_acento_entao_retorna_cidades_em_ordem_alfabetica(
+        self,
+    ):
+        """
+        Verifica se o autocompletar ignora acentos e maiúsculas.
+
+        Cenário:
+            O catálogo possui três cidades começando com "São".
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `autocomplete` é chamado com o prefixo "SAO JO".
+        Então:
+            - As cidades "São José" e "São José dos Campos" são retornadas, em ordem alfabética.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+
+        # Quando
+        result = await catalog.autocomplete("SAO JO")
+
+        # Então
+        assert catalog.loaded
+        assert [city.city_name for city in result] == [
+            "São José",
+            "São José dos Campos",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_quando_autocompletar_com_estado_e_limite_entao_resultado_e_restrito(
+        self,
+    ):
+        """
+        Verifica se o autocompletar respeita o estado e o limite informados.
+
+        Cenário:
+            Busca pelo prefixo "são" restrita ao estado de São Paulo, com limite 1.
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `autocomplete` é chamado com `state="sp"` e `limit=1`.
+        Então:
+            - Apenas a primeira cidade de "SP" em ordem alfabética é retornada.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+
+        # Quando
+        result = await catalog.autocomplete("são", state="sp", limit=1)
+
+        # Então
+        assert [city.city_name for city in result] == ["São José dos Campos"]
+
+    @pytest.mark.asyncio
+    async def test_quando_buscar_com_cursor_entao_retorna_itens_posteriores(self):
+        """
+        Verifica se a busca por estado pagina por chave, como no banco de dados.
+
+        Cenário:
+            Busca das cidades de "SP" após o cursor da primeira cidade.
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `search` é chamado com o filtro de estado e o cursor.
+        Então:
+            - Apenas a cidade posterior ao cursor é retornada.
+            - Os estados são listados em ordem de nome.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+
+        # Quando
+        result = await catalog.search(
+            filters={"state": "SP"},
+            page=PageWindow(after=Cursor(value="São José dos Campos", id=2), limit=10),
+        )
+
+        # Então
+        assert [city.id for city in result] == [1]
+        assert [state.state for state in await catalog.list_states()] == ["SC", "SP"]
+
+    @pytest.mark.asyncio
+    async def test_quando_nome_com_erro_de_digitacao_entao_resolve_cidade_mais_similar(
+        self,
+    ):
+        """
+        Verifica se a resolução tolera erros de digitação e ausência de acentos.
+
+        Cenário:
+            O nome "florianopoles" é pesquisado, com erro de digitação e sem acento.
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `resolve` é chamado.
+        Então:
+            - "Florianópolis" é o primeiro candidato, com pontuação menor que 1.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+
+        # Quando
+        result = await catalog.resolve("florianopoles")
+
+        # Então
+        assert result[0].location.city_name == "Florianópolis"
+        assert 0 < result[0].score < 1
+
+    @pytest.mark.asyncio
+    async def test_quando_nome_com_sigla_do_estado_entao_resolve_cidade_do_estado(
+        self,
+    ):
+        """
+        Verifica se a sigla do estado ao final do nome restringe a resolução.
+
+        Cenário:
+            O nome "Sao Jose/SC" é pesquisado, e existem cidades similares em "SP".
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `resolve` é chamado.
+        Então:
+            - Apenas "São José", de "SC", é retornada, com pontuação 1.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+
+        # Quando
+        result = await catalog.resolve("Sao Jose/SC")
+
+        # Então
+        assert [(match.location.id, match.score) for match in result] == [(3, 1.0)]
+
+    @pytest.mark.asyncio
+    async def test_quando_nome_de_cidades_homonimas_entao_candidatos_empatam(self):
+        """
+        Verifica se cidades homônimas de estados diferentes recebem a mesma pontuação.
+
+        Cenário:
+            O nome "bom jesu", com erro de digitação, é pesquisado, e existe uma
+            cidade "Bom Jesus" no "RS" e outra em "SC".
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `resolve` é chamado.
+        Então:
+            - As duas cidades são retornadas com a mesma pontuação, o que permite
+              às rotas exigir a sigla do estado.
+        """
+        # Dado que
+        catalog = await _build_catalog(
+            [
+                Location(
+                    id=5,
+                    country="BR",
+                    state="RS",
+                    stateName="Rio Grande do Sul",
+                    cityName="Bom Jesus",
+                ),
+                Location(
+                    id=6,
+                    country="BR",
+                    state="SC",
+                    stateName="Santa Catarina",
+                    cityName="Bom Jesus",
+                ),
+            ]
+        )
+
+        # Quando
+        result = await catalog.resolve("bom jesu")
+
+        # Então
+        assert {match.location.state for match in result} == {"RS", "SC"}
+        assert result[0].score == result[1].score
+
+    @pytest.mark.asyncio
+    async def test_quando_atualizar_coordenadas_entao_consultas_refletem_a_alteracao(
+        self,
+    ):
+        """
+        Verifica se a atualização de uma cidade é refletida sem recarregar o catálogo.
+
+        Cenário:
+            As coordenadas de "Florianópolis" são obtidas após o carregamento.
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `update` é chamado com as coordenadas da cidade.
+        Então:
+            - O autocompletar e a resolução retornam a cidade com as coordenadas.
+        """
+        # Dado que
+        catalog = await _build_catalog()
+        coordinates = Coordinates(latitude=-27.59, longitude=-48.54)
+
+        # Quando
+        await catalog.update(
+            CITIES[3].model_copy(update={"coordinates": coordinates}), 4
+        )
+
+        # Então
+        assert (await catalog.autocomplete("flori"))[0].coordinates == coordinates
+        assert (await catalog.resolve("florianopolis"))[0].location.coordinates == (
+            coordinates
+        )
+
+    @pytest.mark.asyncio
+    async def test_quando_nome_acentuado_entao_ordem_e_filtro_seguem_o_banco_de_dados(
+        self,
+    ):
+        """
+        Verifica se a ordenação e o filtro por nome equivalem a `f_unaccent(lower(...))`.
+
+        Cenário:
+            As cidades de "SC" incluem "Águas Mornas" e "Sant'Ana", com pontuação.
+
+        Dado que:
+            - O catálogo foi carregado a partir do repositório.
+        Quando:
+            - O método `search` é chamado com o filtro de estado e com o nome "SANT'ANA".
+        Então:
+            - "Águas Mornas" é a primeira cidade, ordenada como "aguas mornas".
+            - O filtro preserva a pontuação, como no banco de dados.
+            - O cursor de "Águas Mornas" retorna as cidades seguintes.
+        """
+        # Dado que
+        cities = CITIES + [
+            Location(
+                id=5,
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Águas Mornas",
+            ),
+            Location(
+                id=6,
+                country="BR",
+                state="SC",
+                stateName="Santa Catarina",
+                cityName="Sant'Ana",
+            ),
+        ]
+        catalog = await _build_catalog(cities)
+
+        # Quando
+        ordered = await catalog.search(filters={"state": "SC"})
+        by_name = await catalog.search(filters={"state": "SC", "city_name": "SANT'ANA"})
+        without_punctuation = await catalog.search(
+            filters={"state": "SC", "city_name": "Sant Ana"}
+        )
+        after = await catalog.search(
+            filters={"state": "SC"},
+            page=PageWindow(after=Cursor(value="Águas Mornas", id=5), limit=10),
+        )
+
+        # Então
+        assert [city.id for city in ordered] == [5, 4, 6, 3]
+        assert [city.id for city in by_name] == [6]
+        assert not without_punctuation
+        assert [city.id for city in after] == [4, 6, 3]
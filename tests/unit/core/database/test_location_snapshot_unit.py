@@ -0,0 +1,205 @@
+"""
+Testes unitários para as listagens de localizações pré-serializadas (`location_snapshot.py`).
+
+Este módulo contém testes para garantir que o `LocationSnapshot` monta as
+listagens de estados e cidades a partir de um repositório, utilizando um mock
+para a implementação concreta da interface, e as remonta quando o catálogo de
+origem é alterado.
+"""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.database.repository.memory.location_catalog import (
+    LocationCatalog,
+)
+from tempotech.core.database.repository.memory.location_snapshot import (
+    LocationSnapshot,
+)
+from tempotech.core.interfaces.database_repository import ILocationRepository
+from tempotech.core.schemas.location_schema import Coordinates, Location
+
+STATES = [
+    Location(country="BR", state="SC", stateName="Santa Catarina"),
+    Location(country="BR", state="SP", stateName="São Paulo"),
+]
+
+CITIES = [
+    Location(
+        id=1, country="BR", state="SP", stateName="São Paulo", cityName="São Paulo"
+    ),
+    Location(
+        id=2, country="BR", state="SC", stateName="Santa Catarina", cityName="São José"
+    ),
+    Location(
+        id=3,
+        country="BR",
+        state="SC",
+        stateName="Santa Catarina",
+        cityName="Florianópolis",
+    ),
+]
+
+
+def _build_source() -> MagicMock:
+    async def stream(filters=None, order_by=None):
+        for city in CITIES:
+            yield city
+
+    source = MagicMock(spec=ILocationRepository)
+    source.list_states = AsyncMock(return_value=STATES)
+    source.stream = stream
+    return source
+
+
+class TestLocationSnapshotUnit:
+    """
+    Classe de testes unitários para o `LocationSnapshot`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_carregado_entao_listagens_sao_serializadas_e_comprimidas(
+        self,
+    ):
+        """
+        Verifica se as listagens de estados e cidades são montadas a partir do repositório.
+
+        Cenário:
+            O repositório possui dois estados e três cidades.
+
+        Dado que:
+            - As listagens ainda não foram montadas.
+        Quando:
+            - O método `load` é chamado.
+        Então:
+            - A listagem de estados contém os dois estados, com os nomes de campos da API.
+            - A listagem de SC contém apenas as suas cidades, também na versão comprimida.
+            - A listagem do país contém as três cidades.
+            - Listagens diferentes, e as duas codificações de uma listagem, possuem
+              `ETag`s diferentes.
+        """
+        # Dado que
+        source = _build_source()
+        snapshot = LocationSnapshot()
+        assert not snapshot.loaded
+
+        # Quando
+        await snapshot.load(source, country="BR")
+
+        # Então
+        states = json.loads(snapshot.states().body)
+        santa_catarina = snapshot.cities("sc")
+        assert snapshot.loaded
+        assert [state["stateName"] for state in states] == [
+            "Santa Catarina",
+            "São Paulo",
+        ]
+        assert [city["cityName"] for city in json.loads(santa_catarina.body)] == [
+            "São José",
+            "Florianópolis",
+        ]
+        assert gzip.decompress(santa_catarina.gzip) == santa_catarina.body
+        assert len(json.loads(snapshot.cities().body)) == 3
+        assert santa_catarina.etag != snapshot.cities("SP").etag
+        assert santa_catarina.etag != santa_catarina.gzip_etag
+        assert snapshot.cities("RJ") is None
+
+    @pytest.mark.asyncio
+    async def test_quando_catalogo_alterado_entao_listagens_sao_remontadas(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Verifica se as coordenadas gravadas no catálogo chegam às listagens.
+
+        Cenário:
+            As listagens foram montadas a partir do catálogo de localizações.
+
+        Dado que:
+            - A remontagem não aguarda novas alterações.
+            - As coordenadas de "Florianópolis" são gravadas no catálogo.
+        Quando:
+            - A listagem de SC é consultada.
+        Então:
+            - A consulta ainda recebe a listagem anterior.
+            - A listagem é remontada em segundo plano com as coordenadas.
+        """
+        # Dado que
+        monkeypatch.setattr(LocationSnapshot, "refresh_delay", 0)
+        catalog = LocationCatalog()
+        await catalog.load(_build_source())
+        snapshot = LocationSnapshot()
+        await snapshot.load(catalog, country="BR")
+        previous = snapshot.cities("SC")
+        located = CITIES[2].model_copy(
+            update={"coordinates": Coordinates(latitude=-27.6, longitude=-48.5)}
+        )
+        await catalog.update(located, located.id)
+
+        # Quando
+        stale = snapshot.cities("SC")
+        for _ in range(100):
+            if snapshot.cities("SC") is not previous:
+                break
+            await asyncio.sleep(0.01)
+
+        # Então
+        cities = json.loads(snapshot.cities("SC").body)
+        assert stale is previous
+        assert snapshot.cities("SC").etag != previous.etag
+        assert [
+            city["coordinates"]
+            for city in cities
+            if city["cityName"] == "Florianópolis"
+        ] == [{"latitude": -27.6, "longitude": -48.5}]
+
+    @pytest.mark.asyncio
+    async def test_quando_catalogo_alterado_varias_vezes_entao_listagens_sao_remontadas_uma_vez(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Verifica se alterações seguidas do catálogo geram uma única remontagem.
+
+        Cenário:
+            A geocodificação em lote grava as coordenadas das cidades uma a uma,
+            enquanto as listagens são consultadas.
+
+        Dado que:
+            - A remontagem aguarda 50 milissegundos antes de ler o catálogo.
+        Quando:
+            - As coordenadas das três cidades são gravadas, com uma consulta após cada uma.
+        Então:
+            - As listagens são montadas uma única vez após a carga inicial.
+            - A listagem remontada contém as coordenadas das três cidades.
+        """
+        # Dado que
+        monkeypatch.setattr(LocationSnapshot, "refresh_delay", 0.05)
+        builds = []
+        build = LocationSnapshot._build
+
+        def counted_build(states, by_state):
+            builds.append(len(states))
+            return build(states, by_state)
+
+        monkeypatch.setattr(LocationSnapshot, "_build", staticmethod(counted_build))
+        catalog = LocationCatalog()
+        await catalog.load(_build_source())
+        snapshot = LocationSnapshot()
+        await snapshot.load(catalog, country="BR")
+
+        # Quando
+        for city in CITIES:
+            located = city.model_copy(
+                update={"coordinates": Coordinates(latitude=-27.6, longitude=-48.5)}
+            )
+            await catalog.update(located, located.id)
+            snapshot.cities()
+        await asyncio.sleep(0.1)
+
+        # Então
+        cities = json.loads(snapshot.cities().body)
+        assert len(builds) == 2
+        assert all(city["coordinates"] is not None for city in cities)
@@ -0,0 +1,120 @@
+"""
+Testes unitários para as migrações do esquema do banco de dados (`migrations.py`).
+
+Este módulo contém testes para garantir que `run_migrations` aplica as
+migrações sob o advisory lock, registra cada versão aplicada na tabela
+"SchemaMigration" e não reaplica as versões já registradas, utilizando um mock
+para a conexão assíncrona.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.database.repository.postgres.migrations import (
+    MIGRATION_LOCK_KEY,
+    MIGRATIONS,
+    run_migrations,
+)
+
+
+def _build_connection(applied: list[int]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = applied
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value=result)
+    conn.run_sync = AsyncMock()
+    return conn
+
+
+def _executed(conn: MagicMock) -> list[tuple[str, dict]]:
+    return [
+        (str(call.args[0]), call.args[1] if len(call.args) > 1 else {})
+        for call in conn.execute.await_args_list
+    ]
+
+
+class TestMigrationsUnit:
+    """
+    Classe de testes unitários para `run_migrations`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_banco_sem_migracoes_entao_aplica_todas_sob_advisory_lock(
+        self,
+    ):
+        """
+        Verifica se as migrações são aplicadas em um banco de dados novo.
+
+        Cenário:
+            Nenhuma migração foi registrada na tabela "SchemaMigration".
+
+        Dado que:
+            - A consulta às versões aplicadas retorna uma lista vazia.
+        Quando:
+            - A função `run_migrations` é chamada.
+        Então:
+            - O advisory lock é a primeira instrução executada.
+            - A tabela "SchemaMigration" é criada antes da consulta às versões.
+            - O índice de `f_unaccent(lower(city_name))` é criado.
+            - Cada versão é registrada, em ordem.
+        """
+        # Dado que
+        conn = _build_connection([])
+
+        # Quando
+        await run_migrations(conn)
+
+        # Então
+        executed = _executed(conn)
+        statements = [statement for statement, _ in executed]
+        assert executed[0] == (
+            "SELECT pg_advisory_xact_lock(:key)",
+            {"key": MIGRATION_LOCK_KEY},
+        )
+        conn.run_sync.assert_awaited_once()
+        assert statements[1].startswith('CREATE TABLE IF NOT EXISTS "SchemaMigration"')
+        assert statements[2] == 'SELECT version FROM "SchemaMigration"'
+        assert any(
+            "ix_location_state_city_name_unaccent" in statement
+            and "f_unaccent(lower(city_name))" in statement
+            for statement in statements
+        )
+        assert [
+            params["version"]
+            for statement, params in executed
+            if statement.startswith('INSERT INTO "SchemaMigration"')
+        ] == [version for version, _, _ in MIGRATIONS]
+
+    @pytest.mark.asyncio
+    async def test_quando_migracao_ja_registrada_entao_nao_e_reaplicada(self):
+        """
+        Verifica se as versões já registradas são ignoradas.
+
+        Cenário:
+            A migração dos índices de busca (versão 1) já foi aplicada.
+
+        Dado que:
+            - A consulta às versões aplicadas retorna `[1]`.
+        Quando:
+            - A função `run_migrations` é chamada.
+        Então:
+            - As instruções da versão 1 não são executadas.
+            - Apenas as versões seguintes são registradas.
+        """
+        # Dado que
+        conn = _build_connection([1])
+        _, _, first_statements = MIGRATIONS[0]
+
+        # Quando
+        await run_migrations(conn)
+
+        # Então
+        executed = _executed(conn)
+        statements = [statement for statement, _ in executed]
+        assert not set(first_statements) & set(statements)
+        assert [
+            params["version"]
+            for statement, params in executed
+            if statement.startswith('INSERT INTO "SchemaMigration"')
+        ] == [version for version, _, _ in MIGRATIONS[1:]]
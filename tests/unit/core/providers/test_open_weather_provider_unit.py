@@ -0,0 +1,139 @@
+"""
+Testes unitários para o provedor OpenWeather (`open_weather_provider.py`).
+
+Este módulo contém testes para garantir que o `OpenWeatherProvider` converte
+as respostas da API de clima nos esquemas da aplicação e consulta várias
+cidades de uma vez, utilizando mocks no lugar do cliente HTTP.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tempotech.core.providers.http_client import HttpClient
+from tempotech.core.providers.open_weather_provider import OpenWeatherProvider
+from tempotech.core.schemas.location_schema import Coordinates, Location
+
+RESPONSE = {
+    "main": {
+        "temp": 25.1,
+        "feels_like": 26.2,
+        "temp_min": 20.3,
+        "temp_max": 28.4,
+        "humidity": 80,
+    },
+    "wind": {"speed": 3.5},
+    "dt": 1_760_000_000,
+}
+
+
+def _build_provider() -> tuple[OpenWeatherProvider, MagicMock]:
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = AsyncMock(return_value=RESPONSE)
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response)
+    request.__aexit__ = AsyncMock(return_value=False)
+    http_client = MagicMock(spec=HttpClient)
+    http_client.session = MagicMock()
+    http_client.session.get = MagicMock(return_value=request)
+    return OpenWeatherProvider(http_client=http_client), http_client
+
+
+class TestOpenWeatherProviderUnit:
+    """
+    Classe de testes unitários para o `OpenWeatherProvider`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_cidade_com_coordenadas_entao_clima_e_convertido_para_o_esquema(
+        self,
+    ):
+        """
+        Verifica se a resposta da API de clima é convertida no esquema `Weather`.
+
+        Cenário:
+            A cidade "Joinville" possui coordenadas.
+
+        Dado que:
+            - A API de clima responde com os dados atuais da cidade.
+        Quando:
+            - O método `get_current_weather` é chamado.
+        Então:
+            - A consulta é feita pelas coordenadas da cidade.
+            - O clima é retornado em graus Celsius, com o momento da medição em UTC.
+        """
+        # Dado que
+        provider, http_client = _build_provider()
+        city = Location(
+            country="BR",
+            state="SC",
+            stateName="Santa Catarina",
+            cityName="Joinville",
+            coordinates=Coordinates(latitude=-26.3, longitude=-48.8),
+        )
+
+        # Quando
+        weather = await provider.get_current_weather(city)
+
+        # Então
+        params = http_client.session.get.call_args.kwargs["params"]
+        assert (params["lat"], params["lon"], params["units"]) == (
+            "-26.3",
+            "-48.8",
+            "metric",
+        )
+        assert weather.city_name == "Joinville"
+        assert weather.state == "SC"
+        assert weather.temperature.current == 25.1
+        assert weather.temperature.feels_like == 26.2
+        assert weather.humidity == 80
+        assert weather.wind_speed == 3.5
+        assert weather.timestamp_utc == datetime.fromtimestamp(
+            1_760_000_000, timezone.utc
+        )
+
+    @pytest.mark.asyncio
+    async def test_quando_uma_cidade_do_lote_falha_entao_as_demais_sao_retornadas(
+        self,
+    ):
+        """
+        Verifica se a falha de uma cidade em uma consulta em lote não afeta as demais.
+
+        Cenário:
+            O lote contém "Joinville" e "Blumenau", e a consulta de "Blumenau" falha.
+
+        Dado que:
+            - A API de clima responde apenas para "Joinville".
+        Quando:
+            - O método `get_current_weather_many` é chamado.
+        Então:
+            - É feita uma requisição por cidade.
+            - O resultado possui o clima de "Joinville" e `None` para "Blumenau",
+              na ordem do lote.
+        """
+        # Dado que
+        provider, http_client = _build_provider()
+        request = http_client.session.get.return_value
+
+        def get(url, params):
+            if params["q"].startswith("Blumenau"):
+                raise ConnectionError("OpenWeather indisponível")
+            return request
+
+        http_client.session.get.side_effect = get
+        joinville = Location(
+            country="BR", state="SC", stateName="Santa Catarina", cityName="Joinville"
+        )
+        blumenau = Location(
+            country="BR", state="SC", stateName="Santa Catarina", cityName="Blumenau"
+        )
+
+        # Quando
+        result = await provider.get_current_weather_many([joinville, blumenau])
+
+        # Então
+        assert http_client.session.get.call_count == 2
+        assert result[0].city_name == "Joinville"
+        assert result[1] is None
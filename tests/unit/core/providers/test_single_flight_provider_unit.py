@@ -0,0 +1,74 @@
+"""
+Testes unitários para os provedores com coalescência de chamadas (`single_flight_provider.py`).
+
+Este módulo contém testes para garantir que os decoradores agrupam chamadas
+concorrentes idênticas ao provedor decorado, utilizando mocks para as
+implementações concretas das interfaces.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from tempotech.core.interfaces.weather_provider import IWeatherProvider
+from tempotech.core.providers.single_flight_provider import (
+    SingleFlightWeatherProvider,
+)
+from tempotech.core.schemas.location_schema import Location
+
+
+class TestSingleFlightWeatherProviderUnit:
+    """
+    Classe de testes unitários para o `SingleFlightWeatherProvider`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_requisicoes_concorrentes_da_mesma_cidade_entao_provedor_e_chamado_uma_vez(
+        self,
+    ):
+        """
+        Verifica se variações de escrita da mesma cidade são coalescidas.
+
+        Cenário:
+            Uma requisição individual e um lote consultam "São Paulo" ao mesmo tempo.
+
+        Dado que:
+            - O provedor decorado demora para responder.
+            - Os nomes da cidade diferem em acentos e maiúsculas.
+        Quando:
+            - As consultas são feitas de forma concorrente.
+        Então:
+            - O provedor decorado é chamado uma única vez.
+            - Todas as consultas recebem o mesmo resultado.
+        """
+        # Dado que
+        calls = []
+
+        async def get_current_weather(location: Location):
+            calls.append(location.city_name)
+            await asyncio.sleep(0.01)
+            return "clima"
+
+        provider = MagicMock(spec=IWeatherProvider)
+        provider.get_current_weather = get_current_weather
+        single_flight_provider = SingleFlightWeatherProvider(provider)
+        sao_paulo = Location(
+            country="BR", state="SP", stateName="São Paulo", cityName="São Paulo"
+        )
+        sao_paulo_sem_acento = Location(
+            country="BR", state="sp", stateName="São Paulo", cityName="SAO PAULO"
+        )
+
+        # Quando
+        single, many = await asyncio.gather(
+            single_flight_provider.get_current_weather(sao_paulo),
+            single_flight_provider.get_current_weather_many(
+                [sao_paulo_sem_acento, sao_paulo]
+            ),
+        )
+
+        # Então
+        assert calls == ["São Paulo"]
+        assert single == "clima"
+        assert many == ["clima", "clima"]
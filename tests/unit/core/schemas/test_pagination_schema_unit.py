@@ -9,7 +9,7 @@ incluindo aliases, são acessíveis conforme o esperado.
 import pytest
 from pydantic import ValidationError
 
-from tempotech.core.schemas.pagination_schema import Pagination
+from tempotech.core.schemas.pagination_schema import Cursor, Pagination
 
 
 class TestPaginationUnit:
@@ -166,3 +166,56 @@ class TestPaginationUnit:
         # Quando/Então
         with pytest.raises(ValidationError):
             Pagination(**invalid_data)
+
+
+class TestCursorUnit:
+    """
+    Classe de testes unitários para o esquema `Cursor`.
+    """
+
+    def test_quando_cursor_e_codificado_entao_decodificacao_retorna_o_mesmo_cursor(
+        self,
+    ):
+        """
+        Verifica se um cursor codificado pode ser decodificado sem perdas.
+
+        Cenário:
+            Ida e volta de um cursor com valor acentuado.
+
+        Dado que:
+            - Um cursor com o valor "São José" e o identificador 42.
+        Quando:
+            - O cursor é codificado e o token resultante é decodificado.
+        Então:
+            - O token não contém caracteres reservados de URL.
+            - O cursor decodificado é igual ao original.
+        """
+        # Dado que
+        cursor = Cursor(value="São José", id=42)
+
+        # Quando
+        token = cursor.encode()
+        decoded = Cursor.decode(token)
+
+        # Então
+        assert "=" not in token and "/" not in token and "+" not in token
+        assert decoded == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJhIl0", "eyJhIjoxfQ"])
+    def test_quando_token_invalido_entao_value_error_e_levantado(self, token):
+        """
+        Verifica se tokens inválidos são rejeitados.
+
+        Cenário:
+            Decodificação de tokens que não foram gerados por `Cursor.encode`.
+
+        Dado que:
+            - Um token malformado ou com conteúdo inesperado.
+        Quando:
+            - O token é decodificado.
+        Então:
+            - Uma exceção ValueError é levantada.
+        """
+        # Quando/Então
+        with pytest.raises(ValueError):
+            Cursor.decode(token)
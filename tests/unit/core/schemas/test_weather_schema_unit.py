@@ -3,71 +3,97 @@ Testes unitários para os esquemas de clima (`weather_schema.py`).
 
 Este módulo contém testes para garantir que os modelos Pydantic `Temperature`
 e `Weather` validam corretamente os dados de entrada, que seus atributos
-são acessíveis conforme o esperado, e que a validação de `FutureDatetime`
+são acessíveis conforme o esperado, e que a validação de `UtcDatetime`
 funciona corretamente.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from pydantic import ValidationError
 
 from tempotech.core.schemas.weather_schema import (
-    FutureDatetime,
     Temperature,
     Weather,
-    ensure_future_datetime,
+    ensure_utc_datetime,
 )
 
 
-class TestEnsureFutureDatetimeUnit:
+class TestEnsureUtcDatetimeUnit:
     """
-    Classe de testes unitários para a função `ensure_future_datetime`.
+    Classe de testes unitários para a função `ensure_utc_datetime`.
     """
 
-    def test_quando_datetime_futuro_entao_retorna_o_mesmo_datetime(self):
+    def test_quando_datetime_sem_fuso_horario_entao_e_interpretado_como_utc(self):
         """
-        Verifica se a função retorna o datetime inalterado quando ele está no futuro.
+        Verifica se um datetime sem fuso horário é interpretado como UTC.
 
         Cenário:
-            Validação de um datetime que ocorre após o momento atual.
+            Validação de um datetime sem fuso horário que ocorre antes do momento atual.
 
         Dado que:
-            - Um objeto datetime que representa um momento no futuro.
+            - Um objeto datetime sem fuso horário, em UTC, que representa um momento no passado.
         Quando:
-            - A função `ensure_future_datetime` é chamada com esse datetime.
+            - A função `ensure_utc_datetime` é chamada com esse datetime.
         Então:
-            - A função retorna o mesmo objeto datetime sem levantar exceções.
+            - A função retorna o mesmo horário, com o fuso horário UTC.
         """
         # Dado que
-        future_dt = datetime.now() + timedelta(seconds=1)
+        naive_dt = datetime(2025, 1, 1, 12, 0)
 
         # Quando
-        result = ensure_future_datetime(future_dt)
+        result = ensure_utc_datetime(naive_dt)
 
         # Então
-        assert result == future_dt
+        assert result == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
 
-    def test_quando_datetime_passado_entao_levanta_assertion_error(self):
+    def test_quando_datetime_em_fuso_a_frente_de_utc_entao_e_convertido_para_utc(
+        self,
+    ):
+        """
+        Verifica se o momento atual em um fuso à frente de UTC é aceito e convertido.
+
+        Cenário:
+            O servidor está em um fuso horário três horas à frente de UTC.
+
+        Dado que:
+            - O momento atual, com o fuso horário UTC+3.
+        Quando:
+            - A função `ensure_utc_datetime` é chamada com esse datetime.
+        Então:
+            - A função retorna o mesmo instante, com o fuso horário UTC.
+        """
+        # Dado que
+        local_dt = datetime.now(timezone(timedelta(hours=3)))
+
+        # Quando
+        result = ensure_utc_datetime(local_dt)
+
+        # Então
+        assert result == local_dt
+        assert result.tzinfo == timezone.utc
+
+    def test_quando_datetime_futuro_entao_levanta_assertion_error(self):
         """
-        Verifica se a função levanta um AssertionError quando o datetime está no passado.
+        Verifica se a função levanta um AssertionError quando o datetime está no futuro.
 
         Cenário:
-            Validação de um datetime que ocorre antes do momento atual.
+            Validação de um datetime que ocorre após o momento atual, além da
+            diferença tolerada entre os relógios.
 
         Dado que:
-            - Um objeto datetime que representa um momento no passado.
+            - Um objeto datetime que representa um momento uma hora no futuro.
         Quando:
-            - A função `ensure_future_datetime` é chamada com esse datetime.
+            - A função `ensure_utc_datetime` é chamada com esse datetime.
         Então:
-            - Um AssertionError é levantado, indicando que o datetime não é futuro.
+            - Um AssertionError é levantado, indicando que o datetime é futuro.
         """
         # Dado que
-        past_dt = datetime.now() - timedelta(seconds=1)
+        future_dt = datetime.now(timezone.utc) + timedelta(hours=1)
 
         # Quando/Então
         with pytest.raises(AssertionError):
-            ensure_future_datetime(past_dt)
+            ensure_utc_datetime(future_dt)
 
 
 class TestTemperatureUnit:
@@ -177,7 +203,7 @@ class TestWeatherUnit:
             Criação bem-sucedida de um objeto Weather com todos os campos preenchidos.
 
         Dado que:
-            - Todos os campos são válidos, incluindo um objeto Temperature válido e um `timestamp_utc` futuro.
+            - Todos os campos são válidos, incluindo um objeto Temperature válido e um `timestamp_utc` atual.
             - O país é "BR".
         Quando:
             - Um objeto Weather é instanciado com esses dados.
@@ -188,6 +214,7 @@ class TestWeatherUnit:
         # Dado que
         valid_data = {
             "cityName": "São Paulo",
+            "state": "SP",
             "country": "BR",
             "temperature": {
                 "current": 22.0,
@@ -198,7 +225,7 @@ class TestWeatherUnit:
             },
             "humidity": 70,
             "windSpeed": 5.2,
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
 
         # Quando
@@ -210,7 +237,7 @@ class TestWeatherUnit:
         assert isinstance(weather.temperature, Temperature)
         assert weather.humidity == 70
         assert weather.wind_speed == 5.2  # Verifica alias
-        assert isinstance(weather.timestamp_utc, datetime)  # Verifica FutureDatetime
+        assert isinstance(weather.timestamp_utc, datetime)  # Verifica UtcDatetime
 
     def test_quando_nome_da_cidade_muito_curto_entao_erro_de_validacao_e_retornado(
         self,
@@ -231,6 +258,7 @@ class TestWeatherUnit:
         # Dado que
         invalid_data = {
             "cityName": "",  # Muito curto
+            "state": "SC",
             "country": "BR",
             "temperature": {
                 "current": 22.0,
@@ -241,7 +269,7 @@ class TestWeatherUnit:
             },
             "humidity": 70,
             "windSpeed": 5.2,
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
 
         # Quando/Então
@@ -265,6 +293,7 @@ class TestWeatherUnit:
         # Dado que
         invalid_data = {
             "cityName": "Rio de Janeiro",
+            "state": "RJ",
             "country": "US",  # País inválido
             "temperature": {
                 "current": 22.0,
@@ -275,7 +304,7 @@ class TestWeatherUnit:
             },
             "humidity": 70,
             "windSpeed": 5.2,
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
 
         # Quando/Então
@@ -299,6 +328,7 @@ class TestWeatherUnit:
         # Dado que
         invalid_data_low = {
             "cityName": "Curitiba",
+            "state": "PR",
             "country": "BR",
             "temperature": {
                 "current": 15.0,
@@ -309,10 +339,11 @@ class TestWeatherUnit:
             },
             "humidity": -5,  # Fora do intervalo
             "windSpeed": 3.0,
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
         invalid_data_high = {
             "cityName": "Curitiba",
+            "state": "PR",
             "country": "BR",
             "temperature": {
                 "current": 15.0,
@@ -323,7 +354,7 @@ class TestWeatherUnit:
             },
             "humidity": 105,  # Fora do intervalo
             "windSpeed": 3.0,
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
 
         # Quando/Então
@@ -351,6 +382,7 @@ class TestWeatherUnit:
         # Dado que
         invalid_data = {
             "cityName": "Porto Alegre",
+            "state": "RS",
             "country": "BR",
             "temperature": {
                 "current": 20.0,
@@ -361,30 +393,31 @@ class TestWeatherUnit:
             },
             "humidity": 60,
             "windSpeed": -1.0,  # Negativo
-            "timestampUtc": (datetime.now() + timedelta(minutes=1)).isoformat(),
+            "timestampUtc": datetime.now(timezone.utc).isoformat(),
         }
 
         # Quando/Então
         with pytest.raises(ValidationError):
             Weather(**invalid_data)
 
-    def test_quando_timestamp_utc_passado_entao_erro_de_validacao_e_retornado(self):
+    def test_quando_timestamp_utc_futuro_entao_erro_de_validacao_e_retornado(self):
         """
-        Verifica se um erro de validação é retornado quando o `timestamp_utc` está no passado.
+        Verifica se um erro de validação é retornado quando o `timestamp_utc` está no futuro.
 
         Cenário:
-            Tentativa de criar um objeto Weather com um `timestamp_utc` que não é futuro.
+            Tentativa de criar um objeto Weather com um `timestamp_utc` que ainda não ocorreu.
 
         Dado que:
-            - O campo 'timestampUtc' é um datetime no passado.
+            - O campo 'timestampUtc' é um datetime uma hora no futuro.
         Quando:
             - Um objeto Weather é instanciado.
         Então:
-            - Uma exceção ValidationError é levantada devido à validação de `FutureDatetime`.
+            - Uma exceção ValidationError é levantada devido à validação de `UtcDatetime`.
         """
         # Dado que
         invalid_data = {
             "cityName": "Belo Horizonte",
+            "state": "MG",
             "country": "BR",
             "temperature": {
                 "current": 28.0,
@@ -396,8 +429,8 @@ class TestWeatherUnit:
             "humidity": 50,
             "windSpeed": 8.0,
             "timestampUtc": (
-                datetime.now() - timedelta(minutes=1)
-            ).isoformat(),  # Passado
+                datetime.now(timezone.utc) + timedelta(hours=1)
+            ).isoformat(),  # Futuro
         }
 
         # Quando/Então
@@ -423,6 +456,7 @@ class TestWeatherUnit:
         # Dado que
         invalid_data = {
             "cityName": "Recife",
+            "state": "PE",
             "country": "BR",
             "temperature": {
                 "current": 30.0,
@@ -0,0 +1,58 @@
+"""
+Testes unitários para a execução concorrente com paralelismo limitado (`concurrency.py`).
+
+Este módulo contém testes para garantir que o `bounded_gather` respeita o limite
+de execuções simultâneas e isola a falha de cada item.
+"""
+
+import asyncio
+
+import pytest
+
+from tempotech.core.utils.concurrency import bounded_gather
+
+
+class TestBoundedGatherUnit:
+    """
+    Classe de testes unitários para o `bounded_gather`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_varios_itens_entao_limite_e_respeitado_e_falhas_retornam_none(
+        self,
+    ):
+        """
+        Verifica se os itens respeitam o limite de concorrência e falham de forma isolada.
+
+        Cenário:
+            Seis itens são processados com limite de dois simultâneos, e o item 3 falha.
+
+        Dado que:
+            - O trabalho demora para concluir e registra as execuções simultâneas.
+        Quando:
+            - A função `bounded_gather` é chamada.
+        Então:
+            - No máximo dois itens são processados ao mesmo tempo.
+            - O resultado de cada item é retornado na ordem dos itens.
+            - O item que falhou resulta em `None`, sem interromper os demais.
+        """
+        # Dado que
+        running = {"now": 0, "max": 0}
+
+        async def worker(item: int) -> int:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            if item == 3:
+                raise ConnectionError("provedor indisponível")
+            return item * 10
+
+        # Quando
+        results = await bounded_gather(
+            worker, range(6), 2, describe=lambda item: f"Item {item}"
+        )
+
+        # Então
+        assert running["max"] == 2
+        assert results == [0, 10, 20, None, 40, 50]
@@ -0,0 +1,100 @@
+"""
+Testes unitários para o mecanismo de coalescência de chamadas (`single_flight.py`).
+
+Este módulo contém testes para garantir que o `SingleFlight` executa uma única
+vez as chamadas concorrentes com a mesma chave e libera a chave ao final.
+"""
+
+import asyncio
+
+import pytest
+
+from tempotech.core.utils.single_flight import SingleFlight
+
+
+class TestSingleFlightUnit:
+    """
+    Classe de testes unitários para o `SingleFlight`.
+    """
+
+    @pytest.mark.asyncio
+    async def test_quando_chamadas_concorrentes_com_mesma_chave_entao_funcao_executa_uma_vez(
+        self,
+    ):
+        """
+        Verifica se chamadas concorrentes com a mesma chave compartilham uma execução.
+
+        Cenário:
+            Dez chamadas concorrentes com a chave "SC" e uma com a chave "RJ".
+
+        Dado que:
+            - A função executada demora para concluir.
+        Quando:
+            - As chamadas são feitas ao mesmo tempo.
+        Então:
+            - A função é executada uma vez por chave.
+            - Todas as chamadas recebem o resultado da sua chave.
+            - Nenhuma chave permanece em andamento ao final.
+        """
+        # Dado que
+        single_flight = SingleFlight()
+        executions = []
+
+        async def fetch(key: str) -> str:
+            executions.append(key)
+            await asyncio.sleep(0.01)
+            return key.lower()
+
+        # Quando
+        results = await asyncio.gather(
+            *(single_flight.do(key, lambda key=key: fetch(key)) for key in ["SC"] * 10),
+            single_flight.do("RJ", lambda: fetch("RJ")),
+        )
+
+        # Então
+        assert sorted(executions) == ["RJ", "SC"]
+        assert results == ["sc"] * 10 + ["rj"]
+        assert len(single_flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_quando_execucao_falha_entao_erro_e_propagado_e_proxima_chamada_executa(
+        self,
+    ):
+        """
+        Verifica se falhas são repassadas a todos e não ficam memorizadas.
+
+        Cenário:
+            A primeira execução falha e a segunda é bem-sucedida.
+
+        Dado que:
+            - Duas chamadas concorrentes aguardam uma execução que falha.
+        Quando:
+            - Uma nova chamada é feita após a falha.
+        Então:
+            - As duas chamadas concorrentes recebem a exceção.
+            - A nova chamada executa a função novamente.
+        """
+        # Dado que
+        single_flight = SingleFlight()
+        attempts = []
+
+        async def fetch() -> str:
+            attempts.append(True)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise ConnectionError("provedor indisponível")
+            return "ok"
+
+        failures = await asyncio.gather(
+            single_flight.do("SC", fetch),
+            single_flight.do("SC", fetch),
+            return_exceptions=True,
+        )
+
+        # Quando
+        result = await single_flight.do("SC", fetch)
+
+        # Então
+        assert all(isinstance(failure, ConnectionError) for failure in failures)
+        assert result == "ok"
+        assert len(attempts) == 2
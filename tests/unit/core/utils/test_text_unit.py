@@ -0,0 +1,69 @@
+"""
+Testes unitários para os utilitários de texto (`text.py`).
+
+Este módulo contém testes para garantir que `normalize_text` produz a mesma
+forma normalizada para variações de escrita de um mesmo nome, e que `fold_text`
+remove apenas maiúsculas e acentos.
+"""
+
+import pytest
+
+from tempotech.core.utils.text import fold_text, normalize_text
+
+
+class TestNormalizeTextUnit:
+    """
+    Classe de testes unitários para a função `normalize_text`.
+    """
+
+    @pytest.mark.parametrize(
+        "value",
+        ["São Paulo", "sao paulo", "  SÃO   PAULO ", "São-Paulo"],
+    )
+    def test_quando_variacoes_de_um_nome_entao_normalizacao_e_identica(self, value):
+        """
+        Verifica se variações de maiúsculas, acentos, espaços e pontuação são ignoradas.
+
+        Cenário:
+            O nome "São Paulo" é escrito de formas diferentes.
+
+        Dado que:
+            - O texto possui variações de maiúsculas, acentos, espaços ou hífens.
+        Quando:
+            - A função `normalize_text` é chamada.
+        Então:
+            - O resultado é sempre "sao paulo".
+        """
+        # Dado que / Quando
+        normalized = normalize_text(value)
+
+        # Então
+        assert normalized == "sao paulo"
+
+
+class TestFoldTextUnit:
+    """
+    Classe de testes unitários para a função `fold_text`.
+    """
+
+    def test_quando_nome_com_acentos_e_pontuacao_entao_apenas_acentos_sao_removidos(
+        self,
+    ):
+        """
+        Verifica se a conversão equivale a `f_unaccent(lower(...))`.
+
+        Cenário:
+            O nome "Sant'Ana do Livramento" é escrito com acentos e maiúsculas.
+
+        Dado que:
+            - O texto possui maiúsculas, acentos e pontuação.
+        Quando:
+            - A função `fold_text` é chamada.
+        Então:
+            - O resultado está em minúsculas e sem acentos, com a pontuação preservada.
+        """
+        # Dado que / Quando
+        folded = fold_text("SANT'ÁNA do Livramento")
+
+        # Então
+        assert folded == "sant'ana do livramento"